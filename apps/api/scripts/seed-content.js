@@ -9,6 +9,10 @@ import Module from '../src/models/moduleModel.js';
 import Lesson from '../src/models/lessonModel.js';
 import LessonQuiz from '../src/models/quizModel.js';
 import Academy from '../src/models/academyModel.js';
+import {
+  hasModuleLessons,
+  readModuleLessons,
+} from '../../../scripts/content-layout.js';
 
 const __filename = fileURLToPath(import.meta.url);
 const __dirname = dirname(__filename);
@@ -126,14 +130,11 @@ async function seedContent() {
       }
 
       // Load lessons for this module
-      const lessonsPath = path.join(
-        __dirname,
-        `../../../content/lessons/${moduleInfo.slug}.json`
-      );
+      const lessonsDir = path.join(__dirname, '../../../content/lessons');
       let lessons = [];
 
-      if (fs.existsSync(lessonsPath)) {
-        const lessonsData = JSON.parse(fs.readFileSync(lessonsPath, 'utf8'));
+      if (hasModuleLessons(lessonsDir, moduleInfo.slug)) {
+        const lessonsData = readModuleLessons(lessonsDir, moduleInfo.slug);
         console.log(`  Found ${lessonsData.length} lessons`);
 
         for (let i = 0; i < lessonsData.length; i++) {
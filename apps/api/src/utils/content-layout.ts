@@ -0,0 +1,116 @@
+import path from 'node:path';
+import { promises as fs } from 'node:fs';
+
+// A module's lessons live either in content/lessons/<module>.json or as
+// per-lesson shards in content/lessons/<module>/ listed by manifest.json
+// (written by scripts/content_layout.py). The monolithic file wins when both
+// exist; scripts/content-layout.js implements the same rules for Node tools.
+
+const MANIFEST_NAME = 'manifest.json';
+const MANIFEST_FORMAT = 1;
+
+export interface ManifestEntry {
+  order: number | null;
+  id: string | number | null;
+  file: string;
+  sha256: string;
+  size: number;
+}
+
+export interface Manifest {
+  format: number;
+  moduleSlug: string;
+  lessons: ManifestEntry[];
+}
+
+async function exists(filePath: string): Promise<boolean> {
+  try {
+    await fs.access(filePath);
+    return true;
+  } catch {
+    return false;
+  }
+}
+
+async function readJson<T>(filePath: string): Promise<T> {
+  const raw = await fs.readFile(filePath, 'utf8');
+  return JSON.parse(raw) as T;
+}
+
+export async function readManifest(
+  lessonsDir: string,
+  slug: string
+): Promise<Manifest | null> {
+  const manifestPath = path.join(lessonsDir, slug, MANIFEST_NAME);
+  if (!(await exists(manifestPath))) {
+    return null;
+  }
+  const manifest = await readJson<Manifest>(manifestPath);
+  if (manifest.format !== MANIFEST_FORMAT) {
+    throw new Error(
+      `Unsupported manifest format in ${manifestPath}: ${manifest.format}`
+    );
+  }
+  return manifest;
+}
+
+export async function readModuleLessons(
+  lessonsDir: string,
+  slug: string
+): Promise<any> {
+  const monolithic = path.join(lessonsDir, `${slug}.json`);
+  const manifest = (await exists(monolithic))
+    ? null
+    : await readManifest(lessonsDir, slug);
+  if (!manifest) {
+    // Missing modules surface as the usual ENOENT for <module>.json
+    return await readJson<any>(monolithic);
+  }
+  return await Promise.all(
+    manifest.lessons.map((entry) =>
+      readJson<any>(path.join(lessonsDir, slug, entry.file))
+    )
+  );
+}
+
+export async function listLessonModules(lessonsDir: string): Promise<string[]> {
+  const slugs = new Set<string>();
+  for (const entry of await fs.readdir(lessonsDir, { withFileTypes: true })) {
+    if (entry.isFile() && entry.name.endsWith('.json')) {
+      slugs.add(entry.name.replace(/\.json$/, ''));
+    } else if (
+      entry.isDirectory() &&
+      (await exists(path.join(lessonsDir, entry.name, MANIFEST_NAME)))
+    ) {
+      slugs.add(entry.name);
+    }
+  }
+  return Array.from(slugs).sort();
+}
+
+// Lesson ids and their module, read from the manifest alone when the module
+// is sharded so building an index touches no lesson files
+export async function lessonIdsForModule(
+  lessonsDir: string,
+  slug: string
+): Promise<Array<{ id: string | number; moduleSlug: string }>> {
+  const monolithic = path.join(lessonsDir, `${slug}.json`);
+  const manifest = (await exists(monolithic))
+    ? null
+    : await readManifest(lessonsDir, slug);
+  if (manifest) {
+    return manifest.lessons
+      .filter((entry) => entry.id !== null && entry.id !== undefined)
+      .map((entry) => ({
+        id: entry.id as string | number,
+        moduleSlug: manifest.moduleSlug || slug,
+      }));
+  }
+  const lessonsJson = await readJson<any>(monolithic);
+  const lessons = Array.isArray(lessonsJson)
+    ? lessonsJson
+    : lessonsJson?.lessons || [];
+  return lessons
+    .filter((l: any) => l && l.id !== undefined)
+    .map((l: any) => ({ id: l.id, moduleSlug: l.moduleSlug || slug }));
+}
@@ -1,6 +1,7 @@
 import path from 'node:path';
 import { promises as fs } from 'node:fs';
 import { contentBasePath } from './optimized-content';
+import { listLessonModules, readModuleLessons } from './content-layout';
 
 // Interface for content version history
 export interface ContentVersion {
@@ -206,15 +207,9 @@ export async function initializeVersionTracking(): Promise<void> {
 
     // Process lessons
     const lessonsDir = path.join(basePath, 'lessons');
-    const lessonFiles = await fs.readdir(lessonsDir);
-    const lessonJsonFiles = lessonFiles.filter((f) => f.endsWith('.json'));
-
-    for (const file of lessonJsonFiles) {
+    for (const slug of await listLessonModules(lessonsDir)) {
       try {
-        const filePath = path.join(lessonsDir, file);
-        const data = await fs.readFile(filePath, 'utf8');
-        const lessons = JSON.parse(data);
-        const slug = file.replace(/\.json$/, '');
+        const lessons = await readModuleLessons(lessonsDir, slug);
 
         // Track each lesson
         if (Array.isArray(lessons)) {
@@ -230,7 +225,7 @@ export async function initializeVersionTracking(): Promise<void> {
           }
         }
       } catch (error) {
-        console.warn(`Failed to process lesson file ${file}:`, error);
+        console.warn(`Failed to process lessons for ${slug}:`, error);
       }
     }
 
@@ -1,6 +1,11 @@
 import path from 'node:path';
 import { promises as fs } from 'node:fs';
 import { z } from 'zod';
+import {
+  lessonIdsForModule,
+  listLessonModules,
+  readModuleLessons,
+} from './content-layout';
 
 // Basic schemas to assert expected shapes from JSON content files
 const ModuleSchema = z.object({
@@ -62,12 +67,10 @@ export async function findModuleBySlugOrLegacy(
 }
 
 export async function getLessonsByModuleSlug(moduleSlug: string): Promise<any> {
-  const lessonsPath = path.join(
-    resolveContentDir(),
-    'lessons',
-    `${moduleSlug}.json`
+  return await readModuleLessons(
+    path.join(resolveContentDir(), 'lessons'),
+    moduleSlug
   );
-  return await readJson<any>(lessonsPath);
 }
 
 export async function getQuizzesByModuleSlug(moduleSlug: string): Promise<any> {
@@ -86,20 +89,13 @@ async function buildLessonIndex(): Promise<Map<string, string>> {
   const index = new Map<string, string>();
   const contentDir = resolveContentDir();
   const lessonsDir = path.join(contentDir, 'lessons');
-  const files = await fs.readdir(lessonsDir);
-  const jsonFiles = files.filter((f) => f.endsWith('.json'));
-  for (const file of jsonFiles) {
-    const full = path.join(lessonsDir, file);
+  for (const slug of await listLessonModules(lessonsDir)) {
     try {
-      const lessonsJson = await readJson<any>(full);
-      const lessons = Array.isArray(lessonsJson)
-        ? lessonsJson
-        : lessonsJson?.lessons || [];
-      const moduleSlug = file.replace(/\.json$/, '');
-      for (const l of lessons) {
-        if (l && l.id !== undefined) {
-          index.set(String(l.id), l.moduleSlug || moduleSlug);
-        }
+      for (const { id, moduleSlug } of await lessonIdsForModule(
+        lessonsDir,
+        slug
+      )) {
+        index.set(String(id), moduleSlug);
       }
     } catch {
       // Skip unreadable or invalid files
@@ -1,6 +1,11 @@
 import path from 'node:path';
 import * as fs from 'node:fs';
 import { z } from 'zod';
+import {
+  lessonIdsForModule,
+  listLessonModules,
+  readModuleLessons,
+} from './content-layout';
 
 // Basic schemas to assert expected shapes from JSON content files
 const ModuleSchema = z.object({
@@ -130,12 +135,10 @@ export async function getLessonsByModuleSlug(moduleSlug: string): Promise<any> {
   }
 
   try {
-    const lessonsPath = path.join(
-      resolveContentDir(),
-      'lessons',
-      `${moduleSlug}.json`
+    const data = await readModuleLessons(
+      path.join(resolveContentDir(), 'lessons'),
+      moduleSlug
     );
-    const data = await readJson<any>(lessonsPath);
 
     // Update cache
     cache.lessons.set(moduleSlug, data);
@@ -205,26 +208,17 @@ async function buildLessonIndex(): Promise<Map<string, string>> {
     const index = new Map<string, string>();
     const contentDir = resolveContentDir();
     const lessonsDir = path.join(contentDir, 'lessons');
-    const files = await fs.promises.readdir(lessonsDir);
-    const jsonFiles = files.filter((f) => f.endsWith('.json'));
-
-    for (const file of jsonFiles) {
-      const full = path.join(lessonsDir, file);
+    for (const slug of await listLessonModules(lessonsDir)) {
       try {
-        const lessonsJson = await readJson<any>(full);
-        const lessons = Array.isArray(lessonsJson)
-          ? lessonsJson
-          : lessonsJson?.lessons || [];
-        const moduleSlug = file.replace(/\.json$/, '');
-
-        for (const l of lessons) {
-          if (l && l.id !== undefined) {
-            index.set(String(l.id), l.moduleSlug || moduleSlug);
-          }
+        for (const { id, moduleSlug } of await lessonIdsForModule(
+          lessonsDir,
+          slug
+        )) {
+          index.set(String(id), moduleSlug);
         }
       } catch (error) {
         // Skip unreadable or invalid files
-        console.warn(`Failed to process lesson file ${file}:`, error);
+        console.warn(`Failed to process lessons for ${slug}:`, error);
       }
     }
 
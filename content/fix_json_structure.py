@@ -11,6 +11,9 @@ import sys
 import re
 import glob
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'scripts'))
+from content_layout import refresh_manifest
+
 def fix_lesson_json(data, file_path):
     """Fix lesson JSON structure to match working schema"""
     changes = []
@@ -145,7 +148,18 @@ def process_json_file(file_path, dry_run=True):
         changes = []
         
         # Determine if this is a lesson or quiz file
-        if 'lessons' in str(file_path):
+        name = os.path.basename(file_path)
+        parent = os.path.basename(os.path.dirname(file_path))
+        shard = False
+        if 'lessons' in str(file_path) and name in ('manifest.json', 'sources.json'):
+            # Shard manifests and module sources are not lessons
+            return []
+        elif 'lessons' in str(file_path) and parent != 'lessons':
+            # Per-lesson shard (lessons/<module>/lesson-NNN.json): fix in place, keep it an object
+            fixed, file_changes = fix_lesson_json([data], parent + '.json')
+            fixed_data = fixed[0]
+            shard = True
+        elif 'lessons' in str(file_path):
             fixed_data, file_changes = fix_lesson_json(data, file_path)
         elif 'quizzes' in str(file_path):
             fixed_data, file_changes = fix_quiz_json(data, file_path)
@@ -159,6 +173,9 @@ def process_json_file(file_path, dry_run=True):
             # Write the fixed data back to file
             with open(file_path, 'w', encoding='utf-8') as f:
                 json.dump(fixed_data, f, indent=2, ensure_ascii=False)
+            if shard:
+                # Keep the shard's manifest hash and size current
+                refresh_manifest(os.path.dirname(os.path.dirname(file_path)), parent, [name])
             print("✅ Fixed " + str(file_path))
         elif changes:
             print("📝 Would fix " + str(file_path) + ":")
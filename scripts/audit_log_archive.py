@@ -0,0 +1,408 @@
+#!/usr/bin/env python3
+"""
+Streaming archival and compaction of the audit_logs table.
+
+`archive` moves rows older than a cutoff out of Postgres in time-ordered
+batches (ORDER BY created_at, id, keyset-paginated). Each batch is streamed
+with `COPY (SELECT ...) TO STDOUT` in text format into a spool file that
+moves to disk past 16 MB, then read back row by row into daily gzip
+partitions and fsynced, so memory does not grow with batch or row size. Only then are exactly the archived ids deleted, in
+small committed batches so row locks stay short. `--vacuum` runs a plain
+VACUUM ANALYZE afterwards to reclaim the dead tuples.
+
+`restore` loads whole days back with `COPY ... FROM STDIN` into a temporary
+table and inserts them with ON CONFLICT (id) DO NOTHING, so restoring twice,
+or restoring rows that were archived but not yet deleted, is harmless.
+`list` prints the archive index.
+
+Archive layout (default .archive/audit_logs):
+    index.json                              columns and per-day row counts, id and time ranges
+    YYYY/MM/audit_logs-YYYY-MM-DD.tsv.gz    COPY text rows, one gzip member per batch
+
+Archiving is at-least-once. A crash between writing a batch and deleting it
+re-archives those rows on the next run, and restore de-duplicates on id.
+Timestamps are archived in UTC. An advisory lock keeps two archivers from
+running at once.
+
+Requires psycopg2 (pip install psycopg2-binary). Connection settings come
+from --database-url, DATABASE_URL, or the DB_HOST/DB_PORT/DB_NAME/DB_USER/
+DB_PASSWORD/DB_SSL variables used by apps/api.
+
+Usage:
+    python scripts/audit_log_archive.py archive [--older-than DAYS | --before DATE] [--batch-size N]
+        [--delete-batch N] [--pause SECONDS] [--no-delete] [--vacuum] [--dry-run]
+    python scripts/audit_log_archive.py restore --from YYYY-MM-DD [--to YYYY-MM-DD]
+    python scripts/audit_log_archive.py list [--from YYYY-MM-DD] [--to YYYY-MM-DD]
+    (all commands accept --archive-dir <dir> and --database-url <url>)
+"""
+
+import argparse
+import gzip
+import json
+import os
+import sys
+import tempfile
+import time
+from datetime import date, datetime, timedelta, timezone
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+try:
+    import psycopg2
+    from psycopg2 import sql
+except ImportError:  # optional
+    psycopg2 = None
+
+REPO_ROOT = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+DEFAULT_ARCHIVE_DIR = os.path.join(REPO_ROOT, ".archive", "audit_logs")
+INDEX_NAME = "index.json"
+INDEX_FORMAT = 1
+
+TABLE = "audit_logs"
+# Column order of migration 007-create-audit-log-table.js; id first and created_at last
+COLUMNS = ("id", "user_id", "action", "resource_type", "resource_id", "resource_name",
+           "details", "ip_address", "user_agent", "created_at")
+# Arbitrary constant identifying this tool's advisory lock
+ADVISORY_LOCK_KEY = 0x6175646974  # "audit"
+SPOOL_MEMORY_BYTES = 16 * 1024 * 1024
+
+
+class ArchiveError(RuntimeError):
+    pass
+
+
+# Connection
+
+def connect(database_url: Optional[str] = None):
+    if psycopg2 is None:
+        raise ArchiveError("psycopg2 is required: pip install psycopg2-binary")
+    url = database_url or os.environ.get("DATABASE_URL")
+    if url:
+        conn = psycopg2.connect(url)
+    else:
+        conn = psycopg2.connect(
+            host=os.environ.get("DB_HOST", "localhost"),
+            port=int(os.environ.get("DB_PORT", "5432")),
+            dbname=os.environ.get("DB_NAME", "glasscode_dev"),
+            user=os.environ.get("DB_USER", "postgres"),
+            password=os.environ.get("DB_PASSWORD", ""),
+            sslmode="require" if os.environ.get("DB_SSL", "").lower() == "true" else "prefer",
+        )
+    with conn.cursor() as cur:
+        # Partition by UTC day regardless of server settings
+        cur.execute("SET TIME ZONE 'UTC'")
+        cur.execute("SET client_encoding TO 'UTF8'")
+    conn.commit()
+    return conn
+
+
+def _column_list():
+    return sql.SQL(", ").join(sql.Identifier(c) for c in COLUMNS)
+
+
+# Index and partitions
+
+def load_index(archive_dir: str) -> Dict[str, Any]:
+    path = os.path.join(archive_dir, INDEX_NAME)
+    if not os.path.exists(path):
+        return {"format": INDEX_FORMAT, "table": TABLE, "columns": list(COLUMNS), "partitions": {}, "runs": []}
+    with open(path, "r", encoding="utf-8") as f:
+        index = json.load(f)
+    if index.get("format") != INDEX_FORMAT:
+        raise ArchiveError(f"Unsupported archive index format {index.get('format')!r} in {path}")
+    if index.get("columns") != list(COLUMNS):
+        raise ArchiveError(f"Archive columns {index.get('columns')} do not match {list(COLUMNS)}")
+    return index
+
+
+def save_index(archive_dir: str, index: Dict[str, Any]) -> None:
+    os.makedirs(archive_dir, exist_ok=True)
+    path = os.path.join(archive_dir, INDEX_NAME)
+    tmp = path + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(index, f, indent=2, sort_keys=True)
+        f.write("\n")
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+
+def partition_file(day: str) -> str:
+    return f"{day[:4]}/{day[5:7]}/{TABLE}-{day}.tsv.gz"
+
+
+def _parse_row(line: bytes) -> Tuple[int, str]:
+    """(id, created_at) from a COPY text row; tabs inside values are escaped as \\t."""
+    first = line.split(b"\t", 1)[0]
+    last = line.rsplit(b"\t", 1)[-1].rstrip(b"\n")
+    return int(first), last.decode("ascii")
+
+
+def write_batch(archive_dir: str, index: Dict[str, Any],
+                lines: Iterable[bytes]) -> Tuple[List[int], Optional[str]]:
+    """Append time-ordered COPY rows to their daily partitions.
+
+    Rows are consumed one at a time, so lines can be an open file. Returns
+    the archived ids and the created_at of the last row. Files are fsynced
+    and the index is saved before returning, so the caller can safely delete
+    the returned ids.
+    """
+    ids: List[int] = []
+    last_created: Optional[str] = None
+    stats: Dict[str, Dict[str, Any]] = {}
+    # Each batch is a separate gzip member per day; readers see one continuous stream
+    writers: Dict[str, Tuple[Any, gzip.GzipFile]] = {}
+    try:
+        for line in lines:
+            row_id, created_at = _parse_row(line)
+            day = created_at[:10]
+            if day not in writers:
+                path = os.path.join(archive_dir, partition_file(day))
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                raw = open(path, "ab")
+                writers[day] = (raw, gzip.GzipFile(fileobj=raw, mode="wb", mtime=0))
+            writers[day][1].write(line)
+            ids.append(row_id)
+            last_created = created_at
+            s = stats.setdefault(day, {"rows": 0, "minId": row_id, "maxId": row_id, "first": created_at, "last": created_at})
+            s["rows"] += 1
+            s["minId"] = min(s["minId"], row_id)
+            s["maxId"] = max(s["maxId"], row_id)
+            s["first"] = min(s["first"], created_at)
+            s["last"] = max(s["last"], created_at)
+        for raw, gz in writers.values():
+            gz.close()
+            raw.flush()
+            os.fsync(raw.fileno())
+    finally:
+        # Always finish the gzip member so a failed batch cannot corrupt later appends
+        for raw, gz in writers.values():
+            gz.close()
+            raw.close()
+
+    for day, s in stats.items():
+        rel = partition_file(day)
+        path = os.path.join(archive_dir, rel)
+        entry = index["partitions"].get(day)
+        if entry is None:
+            index["partitions"][day] = {"file": rel, **s}
+        else:
+            entry["rows"] += s["rows"]
+            entry["minId"] = min(entry["minId"], s["minId"])
+            entry["maxId"] = max(entry["maxId"], s["maxId"])
+            entry["first"] = min(entry["first"], s["first"])
+            entry["last"] = max(entry["last"], s["last"])
+        index["partitions"][day]["bytes"] = os.path.getsize(path)
+    save_index(archive_dir, index)
+    return ids, last_created
+
+
+def _days(index: Dict[str, Any], start: Optional[str], end: Optional[str]) -> List[str]:
+    return [d for d in sorted(index["partitions"]) if (not start or d >= start) and (not end or d <= end)]
+
+
+# Archive
+
+def _has_created_at_index(cur) -> bool:
+    cur.execute("SELECT indexdef FROM pg_indexes WHERE tablename = %s", (TABLE,))
+    return any("(created_at" in row[0] for row in cur.fetchall())
+
+
+def _copy_batch(conn, cutoff: datetime, after: Optional[Tuple[str, int]], batch_size: int, out) -> None:
+    """COPY the next batch of rows, in text format, into the binary file out."""
+    where = [sql.SQL("created_at < {}").format(sql.Literal(cutoff))]
+    if after is not None:
+        where.append(sql.SQL("(created_at, id) > ({}::timestamptz, {})").format(sql.Literal(after[0]), sql.Literal(after[1])))
+    query = sql.SQL("COPY (SELECT {cols} FROM {table} WHERE {where} ORDER BY created_at, id LIMIT {limit}) TO STDOUT").format(
+        cols=_column_list(), table=sql.Identifier(TABLE),
+        where=sql.SQL(" AND ").join(where), limit=sql.Literal(batch_size))
+    with conn.cursor() as cur:
+        cur.copy_expert(query.as_string(conn), out)
+    conn.commit()
+
+
+def _delete_ids(conn, ids: List[int], delete_batch: int, pause: float) -> int:
+    deleted = 0
+    query = sql.SQL("DELETE FROM {} WHERE id = ANY(%s)").format(sql.Identifier(TABLE))
+    for start in range(0, len(ids), delete_batch):
+        with conn.cursor() as cur:
+            cur.execute(query, (ids[start:start + delete_batch],))
+            deleted += cur.rowcount
+        conn.commit()
+        if pause:
+            time.sleep(pause)
+    return deleted
+
+
+def dry_run(conn, cutoff: datetime) -> None:
+    with conn.cursor() as cur:
+        cur.execute(sql.SQL("SELECT created_at::date, count(*) FROM {} WHERE created_at < %s GROUP BY 1 ORDER BY 1")
+                    .format(sql.Identifier(TABLE)), (cutoff,))
+        rows = cur.fetchall()
+    conn.rollback()
+    total = sum(count for _, count in rows)
+    print(f"Would archive {total} rows across {len(rows)} days before {cutoff.isoformat()}")
+    for day, count in rows:
+        print(f"  {day}  {count}")
+
+
+def archive(conn, archive_dir: str, cutoff: datetime, batch_size: int = 50_000, delete_batch: int = 5_000,
+            pause: float = 0.0, delete: bool = True, vacuum: bool = False) -> Dict[str, int]:
+    index = load_index(archive_dir)
+    with conn.cursor() as cur:
+        cur.execute("SELECT pg_try_advisory_lock(%s)", (ADVISORY_LOCK_KEY,))
+        if not cur.fetchone()[0]:
+            raise ArchiveError("Another audit log archiver holds the advisory lock")
+        if not _has_created_at_index(cur):
+            print(f"⚠️  No index on {TABLE}(created_at); batches will scan the table. "
+                  f"Consider: CREATE INDEX CONCURRENTLY ON {TABLE} (created_at, id)")
+    conn.commit()
+
+    totals = {"archived": 0, "deleted": 0, "batches": 0}
+    after: Optional[Tuple[str, int]] = None
+    try:
+        while True:
+            # The spool moves to disk past SPOOL_MEMORY_BYTES and is read back one row at a time
+            with tempfile.SpooledTemporaryFile(max_size=SPOOL_MEMORY_BYTES, mode="w+b") as spool:
+                _copy_batch(conn, cutoff, after, batch_size, spool)
+                spool.seek(0)
+                ids, last_created = write_batch(archive_dir, index, spool)
+            if not ids:
+                break
+            after = (last_created, ids[-1])
+            totals["archived"] += len(ids)
+            totals["batches"] += 1
+            if delete:
+                totals["deleted"] += _delete_ids(conn, ids, delete_batch, pause)
+            print(f"  batch {totals['batches']}: {len(ids)} rows through {last_created}")
+            if len(ids) < batch_size:
+                break
+    finally:
+        with conn.cursor() as cur:
+            cur.execute("SELECT pg_advisory_unlock(%s)", (ADVISORY_LOCK_KEY,))
+        conn.commit()
+
+    if totals["archived"]:
+        index["runs"].append({"at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+                              "cutoff": cutoff.isoformat(), **totals})
+        save_index(archive_dir, index)
+    if vacuum and totals["deleted"]:
+        # VACUUM cannot run inside a transaction block
+        conn.autocommit = True
+        with conn.cursor() as cur:
+            cur.execute(sql.SQL("VACUUM (ANALYZE) {}").format(sql.Identifier(TABLE)))
+        conn.autocommit = False
+    return totals
+
+
+# Restore
+
+def restore(conn, archive_dir: str, start: str, end: Optional[str] = None) -> Dict[str, int]:
+    index = load_index(archive_dir)
+    days = _days(index, start, end or start)
+    totals = {"days": 0, "rows": 0, "inserted": 0}
+    cols = _column_list()
+    for day in days:
+        entry = index["partitions"][day]
+        path = os.path.join(archive_dir, entry["file"])
+        with conn.cursor() as cur:
+            cur.execute(sql.SQL("CREATE TEMP TABLE audit_logs_restore (LIKE {} INCLUDING DEFAULTS) ON COMMIT DROP")
+                        .format(sql.Identifier(TABLE)))
+            with gzip.open(path, "rb") as f:
+                cur.copy_expert(sql.SQL("COPY audit_logs_restore ({}) FROM STDIN").format(cols).as_string(conn), f)
+            cur.execute(sql.SQL("INSERT INTO {table} ({cols}) SELECT {cols} FROM audit_logs_restore "
+                                "ON CONFLICT (id) DO NOTHING").format(table=sql.Identifier(TABLE), cols=cols))
+            inserted = cur.rowcount
+        conn.commit()
+        totals["days"] += 1
+        totals["rows"] += entry["rows"]
+        totals["inserted"] += inserted
+        print(f"  {day}: {inserted} of {entry['rows']} rows inserted")
+    return totals
+
+
+# CLI
+
+def _parse_day(value: str) -> str:
+    try:
+        return date.fromisoformat(value).isoformat()
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected YYYY-MM-DD, got {value!r}")
+
+
+def _cutoff(args) -> datetime:
+    if args.before:
+        parsed = datetime.fromisoformat(args.before)
+        return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+    return datetime.now(timezone.utc) - timedelta(days=args.older_than)
+
+
+def cmd_list(args) -> None:
+    index = load_index(args.archive_dir)
+    days = _days(index, args.start, args.end)
+    rows = sum(index["partitions"][d]["rows"] for d in days)
+    size = sum(index["partitions"][d].get("bytes", 0) for d in days)
+    for day in days:
+        p = index["partitions"][day]
+        print(f"  {day}  {p['rows']:>9} rows  {p.get('bytes', 0) / 1024:>9.1f}K  ids {p['minId']}-{p['maxId']}")
+    print(f"{len(days)} days, {rows} rows, {size / 1024 / 1024:.1f}M in {args.archive_dir}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Archive, compact and restore the audit_logs table")
+    parser.add_argument("--archive-dir", default=DEFAULT_ARCHIVE_DIR)
+    parser.add_argument("--database-url", help="defaults to DATABASE_URL or DB_* variables")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p_archive = sub.add_parser("archive", help="move old rows into the archive")
+    when = p_archive.add_mutually_exclusive_group()
+    when.add_argument("--older-than", type=int, default=90, metavar="DAYS")
+    when.add_argument("--before", help="ISO date or datetime cutoff (UTC unless an offset is given)")
+    p_archive.add_argument("--batch-size", type=int, default=50_000, help="rows per COPY batch")
+    p_archive.add_argument("--delete-batch", type=int, default=5_000, help="rows per DELETE transaction")
+    p_archive.add_argument("--pause", type=float, default=0.0, help="seconds to sleep between DELETE transactions")
+    p_archive.add_argument("--no-delete", action="store_true", help="archive without deleting rows")
+    p_archive.add_argument("--vacuum", action="store_true", help="VACUUM ANALYZE the table afterwards")
+    p_archive.add_argument("--dry-run", action="store_true", help="only report how many rows would be archived")
+
+    p_restore = sub.add_parser("restore", help="load archived days back into the table")
+    p_restore.add_argument("--from", dest="start", type=_parse_day, required=True)
+    p_restore.add_argument("--to", dest="end", type=_parse_day, help="inclusive; defaults to --from")
+
+    p_list = sub.add_parser("list", help="show archived partitions")
+    p_list.add_argument("--from", dest="start", type=_parse_day)
+    p_list.add_argument("--to", dest="end", type=_parse_day)
+
+    args = parser.parse_args()
+    try:
+        if args.command == "list":
+            cmd_list(args)
+            return
+        conn = connect(args.database_url)
+        try:
+            if args.command == "archive":
+                cutoff = _cutoff(args)
+                if args.dry_run:
+                    dry_run(conn, cutoff)
+                    return
+                print(f"Archiving {TABLE} rows before {cutoff.isoformat()} to {args.archive_dir}")
+                totals = archive(conn, args.archive_dir, cutoff, args.batch_size, args.delete_batch,
+                                 args.pause, delete=not args.no_delete, vacuum=args.vacuum)
+                print(f"✅ Archived {totals['archived']} rows in {totals['batches']} batches, deleted {totals['deleted']}")
+            else:
+                totals = restore(conn, args.archive_dir, args.start, args.end)
+                print(f"✅ Restored {totals['inserted']} rows from {totals['days']} days "
+                      f"({totals['rows'] - totals['inserted']} already present)")
+        finally:
+            conn.close()
+    except (ArchiveError, OSError) as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+    except Exception as e:
+        if psycopg2 is not None and isinstance(e, psycopg2.Error):
+            print(f"❌ Database error: {e}")
+            sys.exit(1)
+        raise
+
+
+if __name__ == "__main__":
+    main()
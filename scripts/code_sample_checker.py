@@ -0,0 +1,391 @@
+#!/usr/bin/env python3
+"""
+Syntax checker for lesson code samples.
+
+Every lesson's `code.example` is dispatched to a checker for its
+`code.language` (Python `ast`, JSON, or a local command-line parser when one
+is installed) across a process pool. Parsers are looked up on PATH and in
+node_modules/.bin at the repo root, apps/api and apps/web: esbuild for
+JavaScript and TypeScript, falling back to `node --check` for plain
+JavaScript (JSX is then skipped), plus php -l and bash -n. C# and SQL have no
+default parser and need a checker config. Results are cached by snippet hash
+so unchanged samples are never rechecked.
+
+Usage:
+    python scripts/code_sample_checker.py [content_dir] [--jobs N] [--timeout S]
+        [--cache <file>] [--no-cache] [--checkers <config.json>] [--report <file>] [--strict]
+
+A checker config maps a language to an argv list, e.g.
+    {"sql": ["sqlfluff", "parse", "--dialect", "postgres", "{file}"]}
+`{file}` is replaced with a temporary file holding the snippet; without it the
+snippet is piped to stdin.
+"""
+
+import argparse
+import ast
+import hashlib
+import json
+import multiprocessing
+import os
+import shutil
+import signal
+import subprocess
+import sys
+import tempfile
+from typing import Any, Dict, List, Optional, Tuple
+
+from content_layout import list_modules, read_module_lessons
+
+REPO_ROOT = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+DEFAULT_CONTENT_DIR = os.path.join(REPO_ROOT, "content")
+DEFAULT_CACHE = os.path.join(REPO_ROOT, ".cache", "code_sample_results.json")
+CACHE_FORMAT = 1
+
+# Language aliases used in lesson files
+LANGUAGE_ALIASES = {
+    "js": "javascript",
+    "jsx": "javascript",
+    "ts": "typescript",
+    "tsx": "typescript",
+    "py": "python",
+    "c#": "csharp",
+    "cs": "csharp",
+    "sh": "bash",
+    "shell": "bash",
+}
+
+# Local parsers tried in order when installed; the first one found on PATH or
+# in a node_modules/.bin below NODE_BIN_DIRS wins.
+DEFAULT_EXTERNAL_CHECKERS: Dict[str, List[List[str]]] = {
+    "javascript": [["esbuild", "--loader=jsx", "--log-level=error"], ["node", "--check", "{file}"]],
+    "typescript": [["esbuild", "--loader=tsx", "--log-level=error"]],
+    "php": [["php", "-l", "{file}"]],
+    "bash": [["bash", "-n", "{file}"]],
+}
+
+FILE_SUFFIXES = {
+    "javascript": ".jsx",
+    "typescript": ".tsx",
+    "php": ".php",
+    "bash": ".sh",
+    "csharp": ".cs",
+    "sql": ".sql",
+}
+
+# esbuild and tsc come in as dev dependencies rather than global installs
+NODE_BIN_DIRS = [os.path.join(REPO_ROOT, *parts, "node_modules", ".bin")
+                 for parts in ((), ("apps", "api"), ("apps", "web"))]
+
+# node --check picks the module system from the extension: try ES module syntax, then CommonJS
+COMMAND_SUFFIXES = {"node": (".mjs", ".cjs")}
+# Errors meaning the checker cannot parse the dialect rather than a bad snippet
+UNSUPPORTED_SYNTAX = {"node": ("Unexpected token '<'",)}
+
+Snippet = Dict[str, Any]
+Result = Dict[str, Any]
+
+
+def normalize_language(language: Any) -> str:
+    lang = str(language or "").strip().lower()
+    return LANGUAGE_ALIASES.get(lang, lang)
+
+
+def collect_snippets(content_dir: str) -> List[Snippet]:
+    snippets: List[Snippet] = []
+    lessons_dir = os.path.join(content_dir, "lessons")
+    for module in list_modules(lessons_dir):
+        try:
+            lessons = read_module_lessons(lessons_dir, module)
+        except (OSError, ValueError) as e:
+            print(f"⚠️  Skipping {module}: {e}")
+            continue
+        if not isinstance(lessons, list):
+            continue
+        for i, lesson in enumerate(lessons):
+            code = lesson.get("code") if isinstance(lesson, dict) else None
+            if not isinstance(code, dict) or not isinstance(code.get("example"), str):
+                continue
+            if not code["example"].strip():
+                continue
+            snippets.append({
+                "id": f"{module}#{lesson.get('id', i + 1)}",
+                "language": normalize_language(code.get("language")),
+                "source": code["example"],
+            })
+    return snippets
+
+
+# Checkers. Each returns (status, message) where status is ok | error | skipped | timeout.
+
+def _check_python(source: str) -> Tuple[str, str]:
+    try:
+        ast.parse(source)
+    except SyntaxError as e:
+        return "error", f"line {e.lineno}: {e.msg}"
+    except (ValueError, RecursionError, MemoryError) as e:
+        return "error", str(e)
+    return "ok", ""
+
+
+def _check_json(source: str) -> Tuple[str, str]:
+    try:
+        json.loads(source)
+    except json.JSONDecodeError as e:
+        return "error", f"line {e.lineno}: {e.msg}"
+    except RecursionError as e:
+        return "error", str(e)
+    return "ok", ""
+
+
+BUILTIN_CHECKERS = {
+    "python": _check_python,
+    "json": _check_json,
+}
+
+
+def _run_command(argv: List[str], source: str, language: str, timeout: float) -> Tuple[str, str]:
+    command = os.path.basename(argv[0])
+    if "{file}" not in argv:
+        return _run_once(argv, source, None, timeout)
+    errors = []
+    for suffix in COMMAND_SUFFIXES.get(command, (FILE_SUFFIXES.get(language, ".txt"),)):
+        status, message = _run_once(argv, source, suffix, timeout)
+        if status != "error":
+            return status, message
+        errors.append(message)
+    if any(p in m for m in errors for p in UNSUPPORTED_SYNTAX.get(command, ())):
+        return "skipped", f"{command} cannot parse this {language} dialect"
+    # The first suffix is the preferred reading (ES module for node)
+    return "error", errors[0]
+
+
+def _run_once(argv: List[str], source: str, suffix: Optional[str], timeout: float) -> Tuple[str, str]:
+    """Run argv once, with the snippet in a temporary file when suffix is given, else on stdin."""
+    tmp_path = None
+    try:
+        if suffix is not None:
+            fd, tmp_path = tempfile.mkstemp(suffix=suffix)
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(source)
+            argv = [tmp_path if a == "{file}" else a for a in argv]
+            stdin = None
+        else:
+            stdin = source
+        proc = subprocess.run(argv, input=stdin, capture_output=True, text=True, timeout=timeout)
+    except subprocess.TimeoutExpired:
+        return "timeout", f"exceeded {timeout}s"
+    except OSError as e:
+        return "skipped", str(e)
+    finally:
+        if tmp_path:
+            os.unlink(tmp_path)
+    if proc.returncode == 0:
+        return "ok", ""
+    message = (proc.stderr or proc.stdout).strip()
+    if tmp_path:
+        message = message.replace(tmp_path, "<snippet>")
+    return "error", message[:500]
+
+
+class _Alarm(Exception):
+    pass
+
+
+def _raise_alarm(signum, frame):
+    raise _Alarm()
+
+
+def check_snippet(job: Tuple[str, str, Optional[List[str]], float]) -> Tuple[str, str]:
+    """Worker entry point: (language, source, external argv or None, timeout)."""
+    language, source, argv, timeout = job
+    if argv is not None:
+        return _run_command(argv, source, language, timeout)
+    checker = BUILTIN_CHECKERS[language]
+    # Bound in-process parsers too; SIGALRM is only available on Unix.
+    use_alarm = hasattr(signal, "setitimer")
+    if use_alarm:
+        previous = signal.signal(signal.SIGALRM, _raise_alarm)
+        signal.setitimer(signal.ITIMER_REAL, timeout)
+    try:
+        return checker(source)
+    except _Alarm:
+        return "timeout", f"exceeded {timeout}s"
+    finally:
+        if use_alarm:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+            signal.signal(signal.SIGALRM, previous)
+
+
+def find_command(name: str) -> Optional[str]:
+    """Path of an executable on PATH or in one of NODE_BIN_DIRS."""
+    return shutil.which(name) or shutil.which(name, path=os.pathsep.join(NODE_BIN_DIRS))
+
+
+def resolve_checkers(overrides: Optional[Dict[str, List[str]]] = None) -> Dict[str, Optional[List[str]]]:
+    """Map each language to an external argv, or None for builtin checkers."""
+    resolved: Dict[str, Optional[List[str]]] = {lang: None for lang in BUILTIN_CHECKERS}
+    for lang, candidates in DEFAULT_EXTERNAL_CHECKERS.items():
+        for argv in candidates:
+            path = find_command(argv[0])
+            if path:
+                resolved[lang] = [path] + argv[1:]
+                break
+    for lang, argv in (overrides or {}).items():
+        path = find_command(argv[0])
+        if path:
+            resolved[normalize_language(lang)] = [path] + argv[1:]
+        else:
+            print(f"⚠️  Checker for {lang} not installed: {argv[0]}")
+    return resolved
+
+
+def snippet_key(language: str, source: str, argv: Optional[List[str]]) -> str:
+    checker_id = "builtin" if argv is None else " ".join(argv)
+    h = hashlib.sha256()
+    for part in (checker_id, language, source):
+        h.update(part.encode("utf-8"))
+        h.update(b"\0")
+    return h.hexdigest()
+
+
+def load_cache(path: Optional[str]) -> Dict[str, List[str]]:
+    if not path or not os.path.exists(path):
+        return {}
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return {}
+    if data.get("format") != CACHE_FORMAT:
+        return {}
+    return data.get("results", {})
+
+
+def save_cache(path: Optional[str], results: Dict[str, List[str]]) -> None:
+    if not path:
+        return
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp = path + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump({"format": CACHE_FORMAT, "results": results}, f, separators=(",", ":"))
+    os.replace(tmp, path)
+
+
+def check_snippets(
+    snippets: List[Snippet],
+    checkers: Dict[str, Optional[List[str]]],
+    cache: Dict[str, List[str]],
+    jobs: Optional[int] = None,
+    timeout: float = 10.0,
+) -> Tuple[List[Result], Dict[str, List[str]]]:
+    """Check snippets in parallel; returns per-snippet results and the pruned cache."""
+    results: List[Result] = []
+    fresh_cache: Dict[str, List[str]] = {}
+    pending: Dict[str, List[Result]] = {}
+    jobs_by_key: Dict[str, Tuple[str, str, Optional[List[str]], float]] = {}
+
+    for snip in snippets:
+        lang = snip["language"]
+        result: Result = {"id": snip["id"], "language": lang, "status": "skipped", "message": "", "cached": False}
+        results.append(result)
+        if lang not in checkers:
+            result["message"] = f"no checker for '{lang or 'unknown'}'"
+            continue
+        argv = checkers[lang]
+        key = snippet_key(lang, snip["source"], argv)
+        if key in cache:
+            result["status"], result["message"] = cache[key]
+            result["cached"] = True
+            fresh_cache[key] = cache[key]
+            continue
+        pending.setdefault(key, []).append(result)
+        jobs_by_key[key] = (lang, snip["source"], argv, timeout)
+
+    def record(key: str, status: str, message: str) -> None:
+        if status in ("ok", "error"):
+            fresh_cache[key] = [status, message]
+        for result in pending[key]:
+            result["status"], result["message"] = status, message
+        del jobs_by_key[key]
+
+    # Each round runs until a snippet times out. SIGALRM cannot interrupt a
+    # long C-level parse, so that round's workers are terminated and whatever
+    # had not finished is resubmitted to a fresh pool.
+    while jobs_by_key:
+        pool = multiprocessing.Pool(jobs)
+        finished = False
+        try:
+            pending_results = {key: pool.apply_async(check_snippet, (job,)) for key, job in jobs_by_key.items()}
+            for key, async_result in pending_results.items():
+                try:
+                    # Earlier snippets are done, so this one is running or next; the grace
+                    # period on top of the worker's own limit covers process startup
+                    status, message = async_result.get(timeout=timeout * 2 + 5)
+                except multiprocessing.TimeoutError:
+                    record(key, "timeout", f"exceeded {timeout}s")
+                    break
+                except Exception as e:
+                    status, message = "error", f"checker crashed: {e}"
+                record(key, status, message)
+            for key, async_result in pending_results.items():
+                if key in jobs_by_key and async_result.ready() and async_result.successful():
+                    record(key, *async_result.get())
+            finished = all(r.ready() for r in pending_results.values())
+        finally:
+            if finished:
+                pool.close()
+            else:
+                pool.terminate()
+            pool.join()
+
+    return results, fresh_cache
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Syntax-check lesson code samples")
+    parser.add_argument("content_dir", nargs="?", default=DEFAULT_CONTENT_DIR)
+    parser.add_argument("--jobs", type=int, default=None, help="worker processes (default: CPU count)")
+    parser.add_argument("--timeout", type=float, default=10.0, help="per-snippet timeout in seconds")
+    parser.add_argument("--cache", default=DEFAULT_CACHE)
+    parser.add_argument("--no-cache", action="store_true")
+    parser.add_argument("--checkers", help="JSON file mapping language to checker argv")
+    parser.add_argument("--report", help="write a JSON report of all results")
+    parser.add_argument("--strict", action="store_true", help="exit 1 on syntax errors or timeouts")
+    args = parser.parse_args()
+
+    overrides = None
+    if args.checkers:
+        with open(args.checkers, "r", encoding="utf-8") as f:
+            overrides = json.load(f)
+
+    cache_path = None if args.no_cache else args.cache
+    snippets = collect_snippets(args.content_dir)
+    checkers = resolve_checkers(overrides)
+    results, fresh_cache = check_snippets(snippets, checkers, load_cache(cache_path), args.jobs, args.timeout)
+    save_cache(cache_path, fresh_cache)
+
+    counts: Dict[str, int] = {}
+    for r in results:
+        counts[r["status"]] = counts.get(r["status"], 0) + 1
+        if r["status"] in ("error", "timeout"):
+            print(f"❌ {r['id']} ({r['language']}): {r['message'].splitlines()[0] if r['message'] else r['status']}")
+
+    cached = sum(1 for r in results if r["cached"])
+    print("")
+    print("Summary:")
+    print(f"  Snippets:  {len(results)} ({cached} from cache)")
+    for status in ("ok", "error", "timeout", "skipped"):
+        print(f"  {status.capitalize():<10} {counts.get(status, 0)}")
+    print(f"  Checkers:  {', '.join(sorted(lang for lang in checkers))}")
+
+    if args.report:
+        with open(args.report, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2, ensure_ascii=False)
+
+    strict = args.strict or os.environ.get("VALIDATION_STRICT") == "true"
+    failed = counts.get("error", 0) + counts.get("timeout", 0)
+    sys.exit(1 if strict and failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+/**
+ * Lesson layout reader for Node tools
+ *
+ * A module's lessons live either in content/lessons/<module>.json or as
+ * per-lesson shards in content/lessons/<module>/ listed by manifest.json (see
+ * scripts/content_layout.py, which writes them). The monolithic file wins
+ * when both exist. apps/api/src/utils/content-layout.ts implements the same
+ * rules for the API.
+ */
+
+const fs = require('fs');
+const path = require('path');
+
+const MANIFEST_NAME = 'manifest.json';
+const MANIFEST_FORMAT = 1;
+
+function monolithicPath(lessonsDir, slug) {
+  return path.join(lessonsDir, `${slug}.json`);
+}
+
+function manifestPath(lessonsDir, slug) {
+  return path.join(lessonsDir, slug, MANIFEST_NAME);
+}
+
+function readManifest(lessonsDir, slug) {
+  const file = manifestPath(lessonsDir, slug);
+  if (!fs.existsSync(file)) {
+    return null;
+  }
+  const manifest = JSON.parse(fs.readFileSync(file, 'utf8'));
+  if (manifest.format !== MANIFEST_FORMAT) {
+    throw new Error(`Unsupported manifest format in ${file}: ${manifest.format}`);
+  }
+  return manifest;
+}
+
+function hasModuleLessons(lessonsDir, slug) {
+  return fs.existsSync(monolithicPath(lessonsDir, slug)) || fs.existsSync(manifestPath(lessonsDir, slug));
+}
+
+// Display path for messages: the monolithic file, or the manifest of a sharded module
+function moduleLessonsPath(lessonsDir, slug) {
+  const mono = monolithicPath(lessonsDir, slug);
+  return fs.existsSync(mono) || !fs.existsSync(manifestPath(lessonsDir, slug)) ? mono : manifestPath(lessonsDir, slug);
+}
+
+function readModuleLessons(lessonsDir, slug) {
+  const mono = monolithicPath(lessonsDir, slug);
+  if (fs.existsSync(mono)) {
+    return JSON.parse(fs.readFileSync(mono, 'utf8'));
+  }
+  const manifest = readManifest(lessonsDir, slug);
+  if (!manifest) {
+    const error = new Error(`No lessons found for module '${slug}'`);
+    error.code = 'ENOENT';
+    throw error;
+  }
+  return manifest.lessons.map((entry) =>
+    JSON.parse(fs.readFileSync(path.join(lessonsDir, slug, entry.file), 'utf8'))
+  );
+}
+
+function listLessonModules(lessonsDir) {
+  if (!fs.existsSync(lessonsDir)) {
+    return [];
+  }
+  const slugs = new Set();
+  for (const entry of fs.readdirSync(lessonsDir, { withFileTypes: true })) {
+    if (entry.isFile() && entry.name.endsWith('.json')) {
+      slugs.add(entry.name.replace(/\.json$/, ''));
+    } else if (entry.isDirectory() && fs.existsSync(path.join(lessonsDir, entry.name, MANIFEST_NAME))) {
+      slugs.add(entry.name);
+    }
+  }
+  return Array.from(slugs).sort();
+}
+
+module.exports = {
+  MANIFEST_NAME,
+  monolithicPath,
+  manifestPath,
+  readManifest,
+  hasModuleLessons,
+  moduleLessonsPath,
+  readModuleLessons,
+  listLessonModules,
+};
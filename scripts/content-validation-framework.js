@@ -7,6 +7,7 @@
 
 const fs = require('fs');
 const path = require('path');
+const { hasModuleLessons, listLessonModules, moduleLessonsPath, readModuleLessons } = require('./content-layout');
 
 // Configuration and validation modes
 const VALIDATION_MODES = {
@@ -219,10 +220,10 @@ class ContentValidationFramework {
 
   // LESSON VALIDATOR
   validateModuleLessons(module) {
-    const lessonsPath = path.join(this.lessonsDir, `${module.slug}.json`);
+    const lessonsPath = moduleLessonsPath(this.lessonsDir, module.slug);
     const context = { moduleSlug: module.slug, lessonsPath };
 
-    if (!fs.existsSync(lessonsPath)) {
+    if (!hasModuleLessons(this.lessonsDir, module.slug)) {
       if (isStrictMode) {
         this.addError(`Missing lessons file for module: ${module.slug}`, context);
         return false;
@@ -233,8 +234,7 @@ class ContentValidationFramework {
     }
 
     try {
-      const lessonsContent = fs.readFileSync(lessonsPath, 'utf8');
-      const lessons = JSON.parse(lessonsContent);
+      const lessons = readModuleLessons(this.lessonsDir, module.slug);
 
       if (!Array.isArray(lessons)) {
         this.addError(`Lessons file must contain an array: ${module.slug}`, context);
@@ -484,15 +484,9 @@ class ContentValidationFramework {
     const modulesSlugs = new Set(this.registry.modules.map(m => m.slug));
 
     // Check lessons directory
-    if (fs.existsSync(this.lessonsDir)) {
-      const lessonFiles = fs.readdirSync(this.lessonsDir)
-        .filter(file => file.endsWith('.json'))
-        .map(file => file.replace('.json', ''));
-
-      for (const lessonSlug of lessonFiles) {
-        if (!modulesSlugs.has(lessonSlug)) {
-          this.addWarning(`Orphaned lesson file: ${lessonSlug}.json`, null, 'low');
-        }
+    for (const lessonSlug of listLessonModules(this.lessonsDir)) {
+      if (!modulesSlugs.has(lessonSlug)) {
+        this.addWarning(`Orphaned lesson file: ${path.basename(moduleLessonsPath(this.lessonsDir, lessonSlug))}`, null, 'low');
       }
     }
 
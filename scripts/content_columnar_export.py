@@ -0,0 +1,302 @@
+#!/usr/bin/env python3
+"""
+Columnar export of the question bank and lessons for analytics.
+
+Flattens every question in content/quizzes and every lesson in content/lessons
+into two tables, `questions` and `lessons`, with stable ids, module
+slug/tier/track, difficulty, topic, tags, choice counts and text lengths.
+The uid is "<module>/<kind>/<id>", or "<id>@<position>" for ids that repeat
+within a module (see content_ids.content_uids). key is a hash of the uid.
+Repeated ids are reported, and the export fails rather than write a
+duplicate key. Only the "@<position>" uids are not stable across exports:
+they change when an item is inserted or removed above them, so joins
+against older exports should drop them or the content should renumber the
+reported ids.
+
+Output format, in order of preference:
+    parquet  - requires pyarrow with parquet support
+    arrow    - Arrow IPC (Feather v2) file, requires pyarrow
+    npz      - NumPy archive; string columns are dictionary-encoded as
+               <col>__codes (int32, -1 for null) plus <col>__dict, and the tags
+               column as tags__codes/tags__offsets/tags__dict
+
+Usage:
+    python scripts/content_columnar_export.py [content_dir] [--out-dir <dir>] [--format auto|parquet|arrow|npz]
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+from typing import Any, Dict, List, Optional, Tuple
+
+from content_ids import content_uids, report_duplicates
+from content_layout import list_modules, read_module_lessons
+
+REPO_ROOT = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+DEFAULT_CONTENT_DIR = os.path.join(REPO_ROOT, "content")
+DEFAULT_OUT_DIR = os.path.join(REPO_ROOT, ".cache", "analytics")
+
+try:
+    import pyarrow as pa
+except ImportError:  # optional
+    pa = None
+
+try:
+    import pyarrow.parquet as pq
+except ImportError:  # optional
+    pq = None
+
+try:
+    import numpy as np
+except ImportError:  # optional
+    np = None
+
+# Column kinds: int (int32, -1 for missing), key (int64), str (plain), dict (dictionary-encoded), tags (list of dict)
+QUESTION_COLUMNS: List[Tuple[str, str]] = [
+    ("key", "key"), ("uid", "str"), ("module_slug", "dict"), ("tier", "dict"), ("track", "dict"),
+    ("question_id", "str"), ("position", "int"), ("difficulty", "dict"), ("topic", "dict"),
+    ("question_type", "dict"), ("tags", "tags"), ("choice_count", "int"), ("correct_answer", "int"),
+    ("estimated_time", "int"), ("question_length", "int"), ("explanation_length", "int"),
+    ("industry_context_length", "int"), ("source_count", "int"),
+]
+
+LESSON_COLUMNS: List[Tuple[str, str]] = [
+    ("key", "key"), ("uid", "str"), ("module_slug", "dict"), ("tier", "dict"), ("track", "dict"),
+    ("lesson_id", "str"), ("position", "int"), ("order", "int"), ("title", "str"),
+    ("difficulty", "dict"), ("tags", "tags"), ("language", "dict"), ("estimated_minutes", "int"),
+    ("objective_count", "int"), ("pitfall_count", "int"), ("exercise_count", "int"),
+    ("intro_length", "int"), ("code_example_length", "int"), ("code_explanation_length", "int"),
+]
+
+
+def stable_key(uid: str) -> int:
+    """Signed 64-bit id derived from the uid, stable across exports."""
+    return int.from_bytes(hashlib.sha1(uid.encode("utf-8")).digest()[:8], "big", signed=True)
+
+
+def _int(value: Any) -> int:
+    return value if isinstance(value, int) and not isinstance(value, bool) else -1
+
+
+def _str(value: Any) -> Optional[str]:
+    return value if isinstance(value, str) else None
+
+
+def _len(value: Any) -> int:
+    return len(value) if isinstance(value, (str, list)) else 0
+
+
+def _count(value: Any) -> int:
+    """Number of items in a list field; a bare string counts as one item."""
+    if isinstance(value, list):
+        return len(value)
+    return 1 if isinstance(value, str) and value else 0
+
+
+def _tags(value: Any) -> List[str]:
+    return [t for t in value if isinstance(t, str)] if isinstance(value, list) else []
+
+
+def collect_rows(content_dir: str) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+    registry_path = os.path.join(content_dir, "registry.json")
+    modules: Dict[str, Dict[str, Any]] = {}
+    if os.path.exists(registry_path):
+        with open(registry_path, "r", encoding="utf-8") as f:
+            registry = json.load(f)
+        modules = {m["slug"]: m for m in registry.get("modules") or [] if isinstance(m, dict) and m.get("slug")}
+
+    def module_fields(slug: str) -> Dict[str, Any]:
+        entry = modules.get(slug, {})
+        return {"module_slug": slug, "tier": _str(entry.get("tier")), "track": _str(entry.get("track"))}
+
+    lessons: List[Dict[str, Any]] = []
+    lessons_dir = os.path.join(content_dir, "lessons")
+    for slug in list_modules(lessons_dir):
+        data = read_module_lessons(lessons_dir, slug)
+        uids, duplicates = content_uids(slug, "lessons", data)
+        report_duplicates(slug, "lessons", duplicates)
+        for pos, lesson in enumerate(data if isinstance(data, list) else []):
+            if not isinstance(lesson, dict):
+                continue
+            lesson_id = str(lesson.get("id", pos + 1))
+            uid = uids[pos]
+            code = lesson.get("code") if isinstance(lesson.get("code"), dict) else {}
+            lessons.append({
+                "key": stable_key(uid), "uid": uid, **module_fields(slug),
+                "lesson_id": lesson_id, "position": pos, "order": _int(lesson.get("order")),
+                "title": _str(lesson.get("title")), "difficulty": _str(lesson.get("difficulty")),
+                "tags": _tags(lesson.get("tags")), "language": _str(code.get("language")),
+                "estimated_minutes": _int(lesson.get("estimatedMinutes")),
+                "objective_count": _count(lesson.get("objectives")),
+                "pitfall_count": _count(lesson.get("pitfalls")),
+                "exercise_count": _count(lesson.get("exercises")),
+                "intro_length": _len(lesson.get("intro")),
+                "code_example_length": _len(code.get("example")) if code else _len(lesson.get("code")),
+                "code_explanation_length": _len(code.get("explanation")),
+            })
+
+    questions: List[Dict[str, Any]] = []
+    quizzes_dir = os.path.join(content_dir, "quizzes")
+    for name in sorted(os.listdir(quizzes_dir)) if os.path.isdir(quizzes_dir) else []:
+        if not name.endswith(".json"):
+            continue
+        slug = name[:-len(".json")]
+        with open(os.path.join(quizzes_dir, name), "r", encoding="utf-8") as f:
+            quiz = json.load(f)
+        items = quiz if isinstance(quiz, list) else quiz.get("questions") or []
+        uids, duplicates = content_uids(slug, "questions", items)
+        report_duplicates(slug, "questions", duplicates)
+        for pos, q in enumerate(items):
+            if not isinstance(q, dict):
+                continue
+            question_id = str(q.get("id", pos + 1))
+            uid = uids[pos]
+            correct = q.get("correctAnswer", q.get("correctIndex"))
+            questions.append({
+                "key": stable_key(uid), "uid": uid, **module_fields(slug),
+                "question_id": question_id, "position": pos,
+                "difficulty": _str(q.get("difficulty")), "topic": _str(q.get("topic")),
+                "question_type": _str(q.get("questionType") or q.get("type")),
+                "tags": _tags(q.get("tags")),
+                "choice_count": _count(q.get("choices")),
+                "correct_answer": _int(correct),
+                "estimated_time": _int(q.get("estimatedTime")),
+                "question_length": _len(q.get("question")),
+                "explanation_length": _len(q.get("explanation")),
+                "industry_context_length": _len(q.get("industryContext")),
+                "source_count": _count(q.get("sources")),
+            })
+
+    # Analysts join on these; never write an ambiguous key
+    for table_name, rows in (("questions", questions), ("lessons", lessons)):
+        seen: Dict[int, str] = {}
+        for row in rows:
+            if row["key"] in seen:
+                raise RuntimeError(f"Duplicate key in {table_name}: {row['uid']} collides with {seen[row['key']]}")
+            seen[row["key"]] = row["uid"]
+    return questions, lessons
+
+
+# Writers
+
+def _arrow_table(rows: List[Dict[str, Any]], columns: List[Tuple[str, str]]):
+    arrays, names = [], []
+    for name, kind in columns:
+        values = [row[name] for row in rows]
+        if kind == "key":
+            arr = pa.array(values, type=pa.int64())
+        elif kind == "int":
+            arr = pa.array(values, type=pa.int32())
+        elif kind == "str":
+            arr = pa.array(values, type=pa.string())
+        elif kind == "dict":
+            arr = pa.array(values, type=pa.string()).dictionary_encode()
+        else:
+            arr = pa.array(values, type=pa.list_(pa.dictionary(pa.int32(), pa.string())))
+        arrays.append(arr)
+        names.append(name)
+    return pa.Table.from_arrays(arrays, names=names)
+
+
+def _encode_strings(values: List[Optional[str]]) -> Tuple[Any, Any]:
+    dictionary: Dict[str, int] = {}
+    codes = [-1 if v is None else dictionary.setdefault(v, len(dictionary)) for v in values]
+    return np.asarray(codes, dtype=np.int32), np.asarray(list(dictionary), dtype=str)
+
+
+def _npz_arrays(rows: List[Dict[str, Any]], columns: List[Tuple[str, str]]) -> Dict[str, Any]:
+    out: Dict[str, Any] = {}
+    for name, kind in columns:
+        values = [row[name] for row in rows]
+        if kind == "key":
+            out[name] = np.asarray(values, dtype=np.int64)
+        elif kind == "int":
+            out[name] = np.asarray(values, dtype=np.int32)
+        elif kind in ("str", "dict"):
+            # Plain strings are dictionary-encoded too: .npz has no variable-length string type
+            out[name + "__codes"], out[name + "__dict"] = _encode_strings(values)
+        else:
+            flat = [tag for tags in values for tag in tags]
+            offsets = [0]
+            for tags in values:
+                offsets.append(offsets[-1] + len(tags))
+            out[name + "__codes"], out[name + "__dict"] = _encode_strings(flat)
+            out[name + "__offsets"] = np.asarray(offsets, dtype=np.int64)
+    return out
+
+
+def read_npz_table(path: str) -> Dict[str, Any]:
+    """Decode an exported .npz table into plain columns (lists for string columns)."""
+    with np.load(path, allow_pickle=False) as data:
+        files = set(data.files)
+        out: Dict[str, Any] = {}
+        for key in sorted(files):
+            if "__" not in key:
+                out[key] = data[key]
+            elif key.endswith("__codes"):
+                name = key[:-len("__codes")]
+                dictionary = data[name + "__dict"].tolist()
+                decoded = [None if c < 0 else dictionary[c] for c in data[key].tolist()]
+                if name + "__offsets" in files:
+                    offsets = data[name + "__offsets"].tolist()
+                    decoded = [decoded[offsets[i]:offsets[i + 1]] for i in range(len(offsets) - 1)]
+                out[name] = decoded
+        return out
+
+
+def resolve_format(requested: str) -> str:
+    if requested == "auto":
+        if pq is not None:
+            return "parquet"
+        if pa is not None:
+            return "arrow"
+        return "npz"
+    return requested
+
+
+def export(content_dir: str, out_dir: str, fmt: str = "auto") -> List[str]:
+    fmt = resolve_format(fmt)
+    if (fmt in ("parquet", "arrow") and pa is None) or (fmt == "parquet" and pq is None):
+        raise RuntimeError(f"Format '{fmt}' requires pyarrow" + (" with parquet support" if fmt == "parquet" else ""))
+    if fmt == "npz" and np is None:
+        raise RuntimeError("Format 'npz' requires numpy (or install pyarrow for parquet/arrow)")
+
+    questions, lessons = collect_rows(content_dir)
+    os.makedirs(out_dir, exist_ok=True)
+    written = []
+    for table_name, rows, columns in (("questions", questions, QUESTION_COLUMNS), ("lessons", lessons, LESSON_COLUMNS)):
+        if fmt == "npz":
+            path = os.path.join(out_dir, table_name + ".npz")
+            np.savez_compressed(path, **_npz_arrays(rows, columns))
+        else:
+            table = _arrow_table(rows, columns)
+            if fmt == "parquet":
+                path = os.path.join(out_dir, table_name + ".parquet")
+                pq.write_table(table, path, compression="zstd")
+            else:
+                path = os.path.join(out_dir, table_name + ".arrow")
+                with pa.OSFile(path, "wb") as sink:
+                    with pa.ipc.new_file(sink, table.schema) as writer:
+                        writer.write_table(table)
+        written.append(path)
+        print(f"✅ {table_name}: {len(rows)} rows -> {os.path.relpath(path)}")
+    return written
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Export questions and lessons as columnar tables")
+    parser.add_argument("content_dir", nargs="?", default=DEFAULT_CONTENT_DIR)
+    parser.add_argument("--out-dir", default=DEFAULT_OUT_DIR)
+    parser.add_argument("--format", choices=("auto", "parquet", "arrow", "npz"), default="auto")
+    args = parser.parse_args()
+    try:
+        export(args.content_dir, args.out_dir, args.format)
+    except RuntimeError as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
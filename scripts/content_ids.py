@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+"""
+Unique item ids for lessons and questions across content tools.
+
+Lesson and question ids are only unique within a module, and a few modules
+repeat them. content_uids() gives every item a uid that is unique across the
+corpus; the columnar export, the related-content builder and the payload
+budget report key their output on it.
+"""
+
+import sys
+from typing import Any, Dict, List, Optional, Tuple
+
+
+def content_uids(slug: str, kind: str, items: Any) -> Tuple[List[Optional[str]], List[str]]:
+    """Unique ids "<module>/<kind>/<id>" for a module's lessons or questions.
+
+    Returns (uids, duplicates). uids parallels items, with None for non-object
+    entries. An item without an id uses its 1-based position. When an id
+    repeats within the module, every item carrying it gets "<id>@<position>"
+    (0-based) instead, so no uid is ambiguous. duplicates lists those ids so
+    callers can report them.
+
+    The "@<position>" form is only as stable as the module's item order:
+    inserting or removing an item above a repeated id changes it. Renumber
+    repeated ids in the content to get keys that never move.
+    """
+    entries = items if isinstance(items, list) else []
+    ids = [str(item.get("id", pos + 1)) if isinstance(item, dict) else None for pos, item in enumerate(entries)]
+    counts: Dict[str, int] = {}
+    for item_id in ids:
+        if item_id is not None:
+            counts[item_id] = counts.get(item_id, 0) + 1
+    duplicates = sorted((i for i, n in counts.items() if n > 1), key=lambda i: (len(i), i))
+    uids = [None if item_id is None else
+            f"{slug}/{kind}/{item_id}@{pos}" if counts[item_id] > 1 else f"{slug}/{kind}/{item_id}"
+            for pos, item_id in enumerate(ids)]
+    return uids, duplicates
+
+
+def report_duplicates(slug: str, kind: str, duplicates: List[str]) -> None:
+    """Warn on stderr about ids that content_uids had to qualify with a position."""
+    if duplicates:
+        print(f"⚠️  {slug}: repeated {kind[:-1]} ids {', '.join(duplicates)}; their uids carry the "
+              f"position as <id>@<position> and change if items above them move", file=sys.stderr)
@@ -0,0 +1,296 @@
+#!/usr/bin/env python3
+"""
+Per-lesson sharded content layout for Glass Code Academy.
+
+A module's lessons live either in the monolithic array
+content/lessons/<module>.json or as one file per lesson in
+content/lessons/<module>/lesson-NNN.json next to a manifest.json listing, in
+array order, each lesson's order, id, file, sha256 and size. `split`
+converts a module to shards and removes the monolithic file; `join` converts
+it back. If both exist (split --keep), the monolithic file wins in every
+reader and `check` reports any divergence.
+
+Every reader understands both layouts: the Python tools through this module,
+the Node scripts (validate-content.js, content-validation-framework.js,
+link-checker.js, end-to-end-validation.js, validate-data-structure.js and
+apps/api/scripts/seed-content.js) through scripts/content-layout.js, and the
+API loaders through apps/api/src/utils/content-layout.ts. read_lesson() reads
+a single shard, and the API's lesson-id index reads only manifests. The one
+exception is the one-off migration importer (scripts/migration/importer.ts),
+which still reads only monolithic files; `split` says so.
+
+After editing a shard by hand, run `refresh` to update its manifest entry.
+
+Usage:
+    python scripts/content_layout.py split [content_dir] [--module <slug>] [--keep]
+    python scripts/content_layout.py join [content_dir] [--module <slug>] [--replace]
+    python scripts/content_layout.py refresh [content_dir] [--module <slug>]
+    python scripts/content_layout.py check [content_dir]
+"""
+
+import hashlib
+import json
+import os
+import sys
+from typing import Any, Dict, List, Optional
+
+MANIFEST_NAME = "manifest.json"
+MANIFEST_FORMAT = 1
+# Readers that only understand content/lessons/<module>.json
+MONOLITHIC_ONLY_READERS = ("scripts/migration/importer.ts",)
+DEFAULT_CONTENT_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "content")
+
+
+def _dump(data: Any) -> bytes:
+    # Same formatting as the other content tools
+    return json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+def _digest(raw: bytes) -> str:
+    return hashlib.sha256(raw).hexdigest()
+
+
+def _write_atomic(path: str, raw: bytes) -> None:
+    tmp = path + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(raw)
+    os.replace(tmp, path)
+
+
+def monolithic_path(lessons_dir: str, slug: str) -> str:
+    return os.path.join(lessons_dir, slug + ".json")
+
+
+def manifest_path(lessons_dir: str, slug: str) -> str:
+    return os.path.join(lessons_dir, slug, MANIFEST_NAME)
+
+
+def is_shard_support_file(path: str) -> bool:
+    """True for files inside a module directory that are not lessons."""
+    return os.path.basename(path) in (MANIFEST_NAME, "sources.json")
+
+
+def list_modules(lessons_dir: str) -> List[str]:
+    """Module slugs with lessons in either layout."""
+    slugs = set()
+    if not os.path.isdir(lessons_dir):
+        return []
+    for name in os.listdir(lessons_dir):
+        path = os.path.join(lessons_dir, name)
+        if name.endswith(".json") and os.path.isfile(path):
+            slugs.add(name[:-len(".json")])
+        elif os.path.isfile(os.path.join(path, MANIFEST_NAME)):
+            slugs.add(name)
+    return sorted(slugs)
+
+
+def read_manifest(lessons_dir: str, slug: str) -> Optional[Dict[str, Any]]:
+    path = manifest_path(lessons_dir, slug)
+    if not os.path.exists(path):
+        return None
+    with open(path, "r", encoding="utf-8") as f:
+        manifest = json.load(f)
+    if manifest.get("format") != MANIFEST_FORMAT:
+        raise ValueError(f"Unsupported manifest format in {path}: {manifest.get('format')}")
+    return manifest
+
+
+def read_module_lessons(lessons_dir: str, slug: str) -> Any:
+    """Return the module's lesson array from whichever layout is present.
+
+    The monolithic payload is returned unchanged (it may not be a list);
+    sharded modules are reassembled in manifest order.
+    """
+    path = monolithic_path(lessons_dir, slug)
+    if os.path.exists(path):
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    manifest = read_manifest(lessons_dir, slug)
+    if manifest is None:
+        raise FileNotFoundError(f"No lessons found for module '{slug}'")
+    module_dir = os.path.join(lessons_dir, slug)
+    lessons = []
+    for entry in manifest["lessons"]:
+        with open(os.path.join(module_dir, entry["file"]), "r", encoding="utf-8") as f:
+            lessons.append(json.load(f))
+    return lessons
+
+
+def read_lesson(lessons_dir: str, slug: str, position: int) -> Any:
+    """Load the lesson at a 0-based array position, or None when out of range.
+
+    Lesson ids repeat within some modules, so lessons are addressed by
+    position. A sharded module reads only that lesson's shard.
+    """
+    if position < 0:
+        return None
+    if not os.path.exists(monolithic_path(lessons_dir, slug)):
+        manifest = read_manifest(lessons_dir, slug)
+        if manifest is not None:
+            if position >= len(manifest["lessons"]):
+                return None
+            with open(os.path.join(lessons_dir, slug, manifest["lessons"][position]["file"]), "r", encoding="utf-8") as f:
+                return json.load(f)
+    lessons = read_module_lessons(lessons_dir, slug)
+    return lessons[position] if isinstance(lessons, list) and position < len(lessons) else None
+
+
+def _manifest_entry(name: str, lesson: Any, raw: bytes) -> Dict[str, Any]:
+    return {
+        "order": lesson.get("order") if isinstance(lesson, dict) else None,
+        "id": lesson.get("id") if isinstance(lesson, dict) else None,
+        "file": name,
+        "sha256": _digest(raw),
+        "size": len(raw),
+    }
+
+
+def split_module(lessons_dir: str, slug: str, keep: bool = False) -> Dict[str, Any]:
+    """Write per-lesson shards and a manifest from the monolithic file, then remove it unless keep."""
+    with open(monolithic_path(lessons_dir, slug), "r", encoding="utf-8") as f:
+        lessons = json.load(f)
+    if not isinstance(lessons, list):
+        raise ValueError(f"{slug}.json should contain an array of lessons")
+
+    module_dir = os.path.join(lessons_dir, slug)
+    os.makedirs(module_dir, exist_ok=True)
+    previous = read_manifest(lessons_dir, slug)
+    entries = []
+    for i, lesson in enumerate(lessons):
+        name = f"lesson-{i + 1:03d}.json"
+        raw = _dump(lesson)
+        _write_atomic(os.path.join(module_dir, name), raw)
+        entries.append(_manifest_entry(name, lesson, raw))
+
+    # Drop shards left over from a previous, longer split
+    if previous:
+        current = {e["file"] for e in entries}
+        for entry in previous["lessons"]:
+            if entry["file"] not in current:
+                stale = os.path.join(module_dir, entry["file"])
+                if os.path.exists(stale):
+                    os.unlink(stale)
+
+    manifest = {"format": MANIFEST_FORMAT, "moduleSlug": slug, "lessons": entries}
+    _write_atomic(manifest_path(lessons_dir, slug), _dump(manifest))
+    if not keep:
+        os.unlink(monolithic_path(lessons_dir, slug))
+    return manifest
+
+
+def join_module(lessons_dir: str, slug: str, replace: bool = False) -> int:
+    """Rebuild the monolithic file from shards; optionally remove the shards."""
+    manifest = read_manifest(lessons_dir, slug)
+    if manifest is None:
+        raise FileNotFoundError(f"No manifest for module '{slug}'")
+    module_dir = os.path.join(lessons_dir, slug)
+    lessons = []
+    for entry in manifest["lessons"]:
+        with open(os.path.join(module_dir, entry["file"]), "r", encoding="utf-8") as f:
+            lessons.append(json.load(f))
+    _write_atomic(monolithic_path(lessons_dir, slug), _dump(lessons))
+    if replace:
+        for entry in manifest["lessons"]:
+            os.unlink(os.path.join(module_dir, entry["file"]))
+        os.unlink(manifest_path(lessons_dir, slug))
+    return len(lessons)
+
+
+def refresh_manifest(lessons_dir: str, slug: str, files: Optional[List[str]] = None) -> int:
+    """Re-hash shards edited in place (all of them, or just files); returns how many entries changed."""
+    manifest = read_manifest(lessons_dir, slug)
+    if manifest is None:
+        raise FileNotFoundError(f"No manifest for module '{slug}'")
+    changed = 0
+    for i, entry in enumerate(manifest["lessons"]):
+        if files is not None and entry["file"] not in files:
+            continue
+        with open(os.path.join(lessons_dir, slug, entry["file"]), "rb") as f:
+            raw = f.read()
+        fresh = _manifest_entry(entry["file"], json.loads(raw), raw)
+        if fresh != entry:
+            manifest["lessons"][i] = fresh
+            changed += 1
+    if changed:
+        _write_atomic(manifest_path(lessons_dir, slug), _dump(manifest))
+    return changed
+
+
+def check_module(lessons_dir: str, slug: str) -> List[str]:
+    """Verify shard hashes and sizes against the manifest, and the monolith if both exist."""
+    errors: List[str] = []
+    manifest = read_manifest(lessons_dir, slug)
+    if manifest is None:
+        return errors
+    module_dir = os.path.join(lessons_dir, slug)
+    shards = []
+    for entry in manifest["lessons"]:
+        path = os.path.join(module_dir, entry["file"])
+        try:
+            with open(path, "rb") as f:
+                raw = f.read()
+        except OSError as e:
+            errors.append(f"{entry['file']}: {e}")
+            continue
+        if len(raw) != entry.get("size") or _digest(raw) != entry.get("sha256"):
+            errors.append(f"{entry['file']}: content does not match manifest; run refresh after editing shards")
+        shards.append(json.loads(raw))
+    mono = monolithic_path(lessons_dir, slug)
+    if not errors and os.path.exists(mono):
+        with open(mono, "r", encoding="utf-8") as f:
+            if json.load(f) != shards:
+                errors.append(f"{slug}.json and shards have diverged; {slug}.json wins until it is removed or rejoined")
+    return errors
+
+
+def main():
+    args = sys.argv[1:]
+    if not args or args[0] not in ("split", "join", "refresh", "check"):
+        print(__doc__.strip().split("Usage:")[1].rstrip())
+        sys.exit(2)
+    command, rest = args[0], args[1:]
+    replace = "--replace" in rest
+    keep = "--keep" in rest
+    rest = [a for a in rest if a not in ("--replace", "--keep")]
+    only = None
+    if "--module" in rest:
+        i = rest.index("--module")
+        only = rest[i + 1] if i + 1 < len(rest) else None
+        del rest[i:i + 2]
+    content_dir = rest[0] if rest else DEFAULT_CONTENT_DIR
+    lessons_dir = os.path.join(content_dir, "lessons")
+
+    failed = 0
+    for slug in [only] if only else list_modules(lessons_dir):
+        try:
+            if command == "split":
+                if not os.path.exists(monolithic_path(lessons_dir, slug)):
+                    continue
+                manifest = split_module(lessons_dir, slug, keep)
+                print(f"✅ Split {slug} into {len(manifest['lessons'])} lessons")
+            elif command == "join":
+                if read_manifest(lessons_dir, slug) is None:
+                    continue
+                print(f"✅ Joined {slug} ({join_module(lessons_dir, slug, replace)} lessons)")
+            elif command == "refresh":
+                if read_manifest(lessons_dir, slug) is None:
+                    continue
+                print(f"✅ Refreshed {slug} ({refresh_manifest(lessons_dir, slug)} entries changed)")
+            else:
+                errors = check_module(lessons_dir, slug)
+                if errors:
+                    failed += 1
+                    print(f"❌ {slug}")
+                    for e in errors:
+                        print(f"  - {e}")
+        except (OSError, ValueError) as e:
+            failed += 1
+            print(f"❌ {slug}: {e}")
+
+    if command == "split" and not keep:
+        print(f"⚠️  {', '.join(MONOLITHIC_ONLY_READERS)} reads only monolithic files; run join before using it")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,601 @@
+#!/usr/bin/env python3
+"""
+Asyncio load generator and latency benchmark for the content API read paths.
+
+Exercises the routes in apps/api/src/routes (modules, lessons, quizzes and
+search) with either a closed-loop model (N workers issuing back-to-back
+requests) or an open-loop model (Poisson arrivals at a fixed rate, latency
+measured from the scheduled start so queueing is not hidden). Latencies go
+into an HDR-style log-linear histogram.
+
+A stub server built from the content tree serves the same routes, so a run
+needs no database, Redis or Node process.
+
+Usage:
+    python scripts/content_load_test.py scenario [content_dir] [--out <scenario.json>]
+    python scripts/content_load_test.py serve [content_dir] [--port 8787]
+    python scripts/content_load_test.py run [base_url] [--stub] [--scenario <file>]
+        [--concurrency N] [--duration S | --requests N] [--rate R]
+        [--output <results.json>] [--baseline <results.json>]
+
+Lesson and quiz ids follow the stub's numbering (registry order, starting at 1);
+against a real database, generate the scenario from the same content that was seeded.
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import multiprocessing
+import os
+import random
+import sys
+import time
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, quote, urlsplit
+
+from content_layout import list_modules, read_module_lessons
+
+DEFAULT_CONTENT_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "content")
+DEFAULT_PORT = 8787
+SCENARIO_FORMAT = 1
+
+
+# Latency histogram
+
+class LatencyHistogram:
+    """Log-linear histogram in microseconds.
+
+    Each power-of-two range is split into 2**precision_bits linear
+    sub-buckets, giving a bounded relative error (about 1.6% at the default
+    of 6 bits) with constant memory regardless of the number of samples.
+    """
+
+    def __init__(self, precision_bits: int = 6):
+        self.precision_bits = precision_bits
+        self.sub_buckets = 1 << precision_bits
+        self.counts: Dict[int, int] = {}
+        self.total = 0
+        self.min_us: Optional[int] = None
+        self.max_us = 0
+        self.sum_us = 0
+
+    def _index(self, value: int) -> int:
+        if value < self.sub_buckets:
+            return value
+        exponent = value.bit_length() - self.precision_bits - 1
+        return (exponent << self.precision_bits) + (value >> exponent)
+
+    def _lower_bound(self, index: int) -> int:
+        if index < self.sub_buckets:
+            return index
+        exponent = (index >> self.precision_bits) - 1
+        mantissa = index & (self.sub_buckets - 1) | self.sub_buckets
+        return mantissa << exponent
+
+    def record(self, seconds: float) -> None:
+        value = max(0, int(seconds * 1_000_000))
+        idx = self._index(value)
+        self.counts[idx] = self.counts.get(idx, 0) + 1
+        self.total += 1
+        self.sum_us += value
+        self.max_us = max(self.max_us, value)
+        self.min_us = value if self.min_us is None else min(self.min_us, value)
+
+    def merge(self, other: "LatencyHistogram") -> None:
+        for idx, n in other.counts.items():
+            self.counts[idx] = self.counts.get(idx, 0) + n
+        self.total += other.total
+        self.sum_us += other.sum_us
+        self.max_us = max(self.max_us, other.max_us)
+        if other.min_us is not None:
+            self.min_us = other.min_us if self.min_us is None else min(self.min_us, other.min_us)
+
+    def percentile(self, pct: float) -> float:
+        """Value at `pct` (0-100) in milliseconds."""
+        if not self.total:
+            return 0.0
+        rank = max(1, math.ceil(self.total * pct / 100.0))
+        seen = 0
+        for idx in sorted(self.counts):
+            seen += self.counts[idx]
+            if seen >= rank:
+                return min(self._lower_bound(idx), self.max_us) / 1000.0
+        return self.max_us / 1000.0
+
+    def summary(self) -> Dict[str, float]:
+        return {
+            "count": self.total,
+            "min_ms": (self.min_us or 0) / 1000.0,
+            "mean_ms": self.sum_us / self.total / 1000.0 if self.total else 0.0,
+            "p50_ms": self.percentile(50),
+            "p90_ms": self.percentile(90),
+            "p99_ms": self.percentile(99),
+            "p999_ms": self.percentile(99.9),
+            "max_ms": self.max_us / 1000.0,
+        }
+
+
+# Content index shared by the scenario generator and the stub server
+
+class ContentIndex:
+    """Modules, lessons and questions with stub ids assigned in registry order."""
+
+    def __init__(self, content_dir: str):
+        with open(os.path.join(content_dir, "registry.json"), "r", encoding="utf-8") as f:
+            registry = json.load(f)
+        self.modules: List[Dict[str, Any]] = [m for m in registry.get("modules") or [] if isinstance(m, dict)]
+        lessons_dir = os.path.join(content_dir, "lessons")
+        available = set(list_modules(lessons_dir))
+
+        self.lessons: Dict[int, Dict[str, Any]] = {}
+        self.questions: Dict[int, Dict[str, Any]] = {}
+        self.lessons_by_module: Dict[str, List[int]] = {}
+        self.questions_by_module: Dict[str, List[int]] = {}
+        self.questions_by_lesson: Dict[int, List[int]] = {}
+
+        for module_id, module in enumerate(self.modules, start=1):
+            module["id"] = module_id
+            slug = module["slug"]
+            lessons = read_module_lessons(lessons_dir, slug) if slug in available else []
+            lesson_ids = []
+            for lesson in lessons if isinstance(lessons, list) else []:
+                lesson_id = len(self.lessons) + 1
+                self.lessons[lesson_id] = dict(lesson, id=lesson_id, moduleId=module_id)
+                lesson_ids.append(lesson_id)
+            self.lessons_by_module[slug] = lesson_ids
+
+            quiz_path = os.path.join(content_dir, "quizzes", slug + ".json")
+            questions: List[Any] = []
+            if os.path.exists(quiz_path):
+                with open(quiz_path, "r", encoding="utf-8") as f:
+                    quiz = json.load(f)
+                questions = quiz if isinstance(quiz, list) else quiz.get("questions") or []
+            question_ids = []
+            for n, question in enumerate(q for q in questions if isinstance(q, dict)):
+                question_id = len(self.questions) + 1
+                # Spread module questions over its lessons, as the seeded database does per lesson
+                lesson_id = lesson_ids[n % len(lesson_ids)] if lesson_ids else None
+                self.questions[question_id] = dict(question, id=question_id, lessonId=lesson_id)
+                question_ids.append(question_id)
+                if lesson_id is not None:
+                    self.questions_by_lesson.setdefault(lesson_id, []).append(question_id)
+            self.questions_by_module[slug] = question_ids
+
+        self.by_slug = {m["slug"]: m for m in self.modules}
+
+
+def generate_scenario(content_dir: str) -> Dict[str, Any]:
+    """Weighted request mix over every module, lesson and question in the tree."""
+    index = ContentIndex(content_dir)
+    requests: List[Dict[str, Any]] = []
+    for module in index.modules:
+        slug = module["slug"]
+        requests.append({"route": "module-lessons", "path": f"/api/modules/{slug}/lessons", "weight": 4})
+        requests.append({"route": "module-quiz", "path": f"/api/modules/{slug}/quiz", "weight": 2})
+        requests.append({"route": "module-by-id", "path": f"/api/modules/{module['id']}", "weight": 1})
+        for tech in module.get("technologies") or []:
+            requests.append({"route": "search", "path": f"/api/search?q={quote(tech)}", "weight": 0.5})
+    for lesson_id in index.lessons:
+        requests.append({"route": "lesson", "path": f"/api/lessons/{lesson_id}", "weight": 3})
+        requests.append({"route": "lesson-quizzes", "path": f"/api/lessons/{lesson_id}/quizzes", "weight": 1})
+    for question_id in index.questions:
+        requests.append({"route": "quiz", "path": f"/api/quizzes/{question_id}", "weight": 0.5})
+    return {"format": SCENARIO_FORMAT, "name": "content-read-paths", "requests": requests}
+
+
+def load_scenario(path: Optional[str], content_dir: str) -> Dict[str, Any]:
+    if not path:
+        return generate_scenario(content_dir)
+    with open(path, "r", encoding="utf-8") as f:
+        scenario = json.load(f)
+    if scenario.get("format") != SCENARIO_FORMAT:
+        raise ValueError(f"Unsupported scenario format: {scenario.get('format')}")
+    return scenario
+
+
+# Stub server
+
+class StubServer:
+    """Minimal HTTP/1.1 keep-alive server answering the content read routes from memory."""
+
+    def __init__(self, content_dir: str):
+        self.index = ContentIndex(content_dir)
+        self._cache: Dict[str, Tuple[int, bytes]] = {}
+
+    def _json(self, status: int, payload: Any) -> Tuple[int, bytes]:
+        return status, json.dumps(payload, ensure_ascii=False).encode("utf-8")
+
+    def route(self, target: str) -> Tuple[int, bytes]:
+        cached = self._cache.get(target)
+        if cached is not None:
+            return cached
+        url = urlsplit(target)
+        parts = [p for p in url.path.split("/") if p]
+        response = self._route(parts, parse_qs(url.query))
+        if not url.path.startswith("/api/search"):
+            self._cache[target] = response
+        return response
+
+    def _route(self, parts: List[str], query: Dict[str, List[str]]) -> Tuple[int, bytes]:
+        idx = self.index
+        if parts == ["api", "health"]:
+            return self._json(200, {"status": "ok"})
+        if len(parts) == 4 and parts[:2] == ["api", "modules"] and parts[3] in ("lessons", "quiz"):
+            module = idx.by_slug.get(parts[2])
+            if module is None:
+                return self._json(404, {"error": "Module not found"})
+            if parts[3] == "lessons":
+                return self._json(200, [idx.lessons[i] for i in idx.lessons_by_module[module["slug"]]])
+            return self._json(200, [idx.questions[i] for i in idx.questions_by_module[module["slug"]]])
+        if len(parts) == 3 and parts[:2] == ["api", "modules"]:
+            if not parts[2].isdigit():
+                return self._json(400, {"error": "Invalid module ID"})
+            module_id = int(parts[2])
+            if not 1 <= module_id <= len(idx.modules):
+                return self._json(404, {"error": "Module not found"})
+            return self._json(200, idx.modules[module_id - 1])
+        if len(parts) >= 3 and parts[:2] == ["api", "lessons"]:
+            if not parts[2].isdigit():
+                return self._json(400, {"error": "Invalid lesson ID"})
+            lesson_id = int(parts[2])
+            if parts[3:] == ["quizzes"]:
+                return self._json(200, [idx.questions[i] for i in idx.questions_by_lesson.get(lesson_id, [])])
+            lesson = idx.lessons.get(lesson_id)
+            return self._json(200, lesson) if lesson else self._json(404, {"error": "Lesson not found"})
+        if len(parts) == 3 and parts[:2] == ["api", "quizzes"]:
+            question = idx.questions.get(int(parts[2])) if parts[2].isdigit() else None
+            return self._json(200, question) if question else self._json(404, {"error": "Quiz not found"})
+        if parts == ["api", "search"]:
+            return self._search(query)
+        return self._json(404, {"error": "Not found"})
+
+    def _search(self, query: Dict[str, List[str]]) -> Tuple[int, bytes]:
+        term = (query.get("q") or [""])[0].strip().lower()
+        if not term or len(term) > 100:
+            return self._json(400, {"error": 'Search query parameter "q" is required'})
+        kind = (query.get("type") or ["all"])[0]
+        only = (query.get("module") or [None])[0]
+        results = []
+        for module in self.index.modules:
+            slug = module["slug"]
+            if only and only != slug:
+                continue
+            if kind in ("all", "lessons"):
+                for i in self.index.lessons_by_module[slug]:
+                    lesson = self.index.lessons[i]
+                    title = str(lesson.get("title", ""))
+                    if term in title.lower():
+                        results.append({"type": "lesson", "moduleId": slug, "title": title, "relevance": 10})
+                    elif term in str(lesson.get("intro", "")).lower():
+                        results.append({"type": "lesson", "moduleId": slug, "title": title, "relevance": 5})
+            if kind in ("all", "quizzes"):
+                for i in self.index.questions_by_module[slug]:
+                    text = str(self.index.questions[i].get("question", ""))
+                    if term in text.lower():
+                        results.append({"type": "quiz", "moduleId": slug, "title": text, "relevance": 7})
+        results.sort(key=lambda r: -r["relevance"])
+        return self._json(200, {"query": term, "totalResults": len(results), "results": results[:50]})
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                keep_alive = True
+                while True:
+                    header = await reader.readline()
+                    if header in (b"\r\n", b"\n", b""):
+                        break
+                    if header.lower().startswith(b"connection:") and b"close" in header.lower():
+                        keep_alive = False
+                try:
+                    method, target, _ = request_line.decode("latin-1").split(" ", 2)
+                except ValueError:
+                    break
+                status, body = self.route(target) if method == "GET" else self._json(405, {"error": "Method not allowed"})
+                writer.write(
+                    f"HTTP/1.1 {status} {'OK' if status == 200 else 'Error'}\r\n"
+                    f"Content-Type: application/json; charset=utf-8\r\n"
+                    f"Content-Length: {len(body)}\r\n\r\n".encode("latin-1") + body
+                )
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def serve(self, host: str, port: int, ready=None) -> None:
+        server = await asyncio.start_server(self.handle, host, port, backlog=1024)
+        bound = server.sockets[0].getsockname()[1]
+        if ready is not None:
+            ready.put(bound)
+        else:
+            print(f"✅ Stub content API on http://{host}:{bound}")
+        async with server:
+            await server.serve_forever()
+
+
+def _run_stub(content_dir: str, port: int, ready) -> None:
+    asyncio.run(StubServer(content_dir).serve("127.0.0.1", port, ready))
+
+
+# Load generator
+
+class Connection:
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self.reader = reader
+        self.writer = writer
+
+    @classmethod
+    async def open(cls, host: str, port: int, use_ssl: bool) -> "Connection":
+        reader, writer = await asyncio.open_connection(host, port, ssl=use_ssl or None)
+        return cls(reader, writer)
+
+    async def get(self, host: str, path: str) -> Tuple[int, int]:
+        """Issue a GET and read the full body; returns (status, body bytes)."""
+        self.writer.write(f"GET {path} HTTP/1.1\r\nHost: {host}\r\nAccept: application/json\r\n\r\n".encode("latin-1"))
+        await self.writer.drain()
+        status_line = await self.reader.readline()
+        if not status_line:
+            raise ConnectionError("connection closed")
+        status = int(status_line.split(b" ", 2)[1])
+        length, chunked = 0, False
+        while True:
+            line = await self.reader.readline()
+            if line in (b"\r\n", b"\n", b""):
+                break
+            name, _, value = line.decode("latin-1").partition(":")
+            name = name.strip().lower()
+            if name == "content-length":
+                length = int(value.strip())
+            elif name == "transfer-encoding" and "chunked" in value.lower():
+                chunked = True
+        if not chunked:
+            await self.reader.readexactly(length)
+            return status, length
+        total = 0
+        while True:
+            size = int((await self.reader.readline()).split(b";")[0], 16)
+            await self.reader.readexactly(size + 2)
+            total += size
+            if size == 0:
+                return status, total
+
+    def close(self) -> None:
+        self.writer.close()
+
+
+class LoadRun:
+    def __init__(self, base_url: str, scenario: Dict[str, Any], seed: int = 1):
+        url = urlsplit(base_url)
+        self.host = url.hostname or "127.0.0.1"
+        self.use_ssl = url.scheme == "https"
+        self.port = url.port or (443 if self.use_ssl else 80)
+        self.prefix = url.path.rstrip("/")
+        self.requests = scenario["requests"]
+        self.weights = [float(r.get("weight", 1)) for r in self.requests]
+        self.rng = random.Random(seed)
+        self.overall = LatencyHistogram()
+        self.by_route: Dict[str, LatencyHistogram] = {}
+        self.statuses: Dict[str, int] = {}
+        self.errors = 0
+        self.bytes = 0
+        self._pool: List[Connection] = []
+
+    def _pick(self) -> Dict[str, Any]:
+        return self.rng.choices(self.requests, weights=self.weights, k=1)[0]
+
+    async def _acquire(self) -> Connection:
+        if self._pool:
+            return self._pool.pop()
+        return await Connection.open(self.host, self.port, self.use_ssl)
+
+    async def _issue(self, request: Dict[str, Any], started: float, record: bool) -> None:
+        conn = None
+        try:
+            conn = await self._acquire()
+            status, size = await conn.get(self.host, self.prefix + request["path"])
+            self._pool.append(conn)
+        except (OSError, ValueError, IndexError, asyncio.IncompleteReadError):
+            if conn is not None:
+                conn.close()
+            if record:
+                self.errors += 1
+            return
+        if not record:
+            return
+        elapsed = time.perf_counter() - started
+        self.overall.record(elapsed)
+        route = request.get("route", request["path"])
+        self.by_route.setdefault(route, LatencyHistogram()).record(elapsed)
+        self.statuses[str(status)] = self.statuses.get(str(status), 0) + 1
+        self.bytes += size
+
+    async def closed_loop(self, concurrency: int, deadline: float, budget: Optional[int], warmup_until: float) -> None:
+        remaining = [budget]
+
+        async def worker():
+            while time.perf_counter() < deadline:
+                if remaining[0] is not None:
+                    if remaining[0] <= 0:
+                        return
+                    remaining[0] -= 1
+                started = time.perf_counter()
+                await self._issue(self._pick(), started, started >= warmup_until)
+
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+
+    async def open_loop(self, rate: float, max_in_flight: int, deadline: float, budget: Optional[int],
+                        warmup_until: float) -> None:
+        """Poisson arrivals; latency counts from the scheduled send time."""
+        in_flight = asyncio.Semaphore(max_in_flight)
+        tasks = set()
+        scheduled = time.perf_counter()
+        sent = 0
+
+        async def fire(request, at):
+            async with in_flight:
+                await self._issue(request, at, at >= warmup_until)
+
+        while scheduled < deadline and (budget is None or sent < budget):
+            delay = scheduled - time.perf_counter()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            task = asyncio.ensure_future(fire(self._pick(), scheduled))
+            tasks.add(task)
+            task.add_done_callback(tasks.discard)
+            sent += 1
+            scheduled += self.rng.expovariate(rate)
+        if tasks:
+            await asyncio.gather(*tasks)
+
+    def close(self) -> None:
+        for conn in self._pool:
+            conn.close()
+        self._pool.clear()
+
+    def results(self, elapsed: float, config: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            "config": config,
+            "elapsedSeconds": round(elapsed, 3),
+            "throughputRps": round(self.overall.total / elapsed, 2) if elapsed > 0 else 0.0,
+            "bytes": self.bytes,
+            "errors": self.errors,
+            "statuses": self.statuses,
+            "latency": self.overall.summary(),
+            "routes": {route: h.summary() for route, h in sorted(self.by_route.items())},
+        }
+
+
+async def run_load(base_url: str, scenario: Dict[str, Any], concurrency: int, duration: Optional[float],
+                   requests: Optional[int], rate: Optional[float], warmup: float, seed: int) -> Dict[str, Any]:
+    run = LoadRun(base_url, scenario, seed)
+    start = time.perf_counter()
+    warmup_until = start + warmup
+    deadline = start + warmup + duration if duration else math.inf
+    try:
+        if rate:
+            await run.open_loop(rate, concurrency, deadline, requests, warmup_until)
+        else:
+            await run.closed_loop(concurrency, deadline, requests, warmup_until)
+    finally:
+        run.close()
+    now = time.perf_counter()
+    elapsed = now - min(warmup_until, now)
+    config = {
+        "baseUrl": base_url, "scenario": scenario.get("name"), "model": "open" if rate else "closed",
+        "concurrency": concurrency, "rate": rate, "duration": duration, "requests": requests,
+        "warmup": warmup, "seed": seed,
+    }
+    return run.results(elapsed, config)
+
+
+def print_results(results: Dict[str, Any], baseline: Optional[Dict[str, Any]] = None) -> None:
+    lat = results["latency"]
+    print(f"Requests:   {lat['count']} in {results['elapsedSeconds']}s ({results['errors']} errors)")
+    print(f"Throughput: {results['throughputRps']} req/s")
+    print(f"Statuses:   {', '.join(f'{k}={v}' for k, v in sorted(results['statuses'].items()))}")
+    print("Latency (ms):")
+    for key in ("p50_ms", "p90_ms", "p99_ms", "p999_ms", "max_ms"):
+        line = f"  {key[:-3]:<5} {lat[key]:9.2f}"
+        if baseline:
+            before = baseline["latency"][key]
+            change = (lat[key] - before) / before * 100 if before else 0.0
+            line += f"   (baseline {before:.2f}, {change:+.1f}%)"
+        print(line)
+    if baseline:
+        before = baseline["throughputRps"]
+        change = (results["throughputRps"] - before) / before * 100 if before else 0.0
+        print(f"Throughput vs baseline: {before} -> {results['throughputRps']} req/s ({change:+.1f}%)")
+    print("Per route p50 / p99 (ms):")
+    for route, summary in results["routes"].items():
+        print(f"  {route:<16} {summary['p50_ms']:8.2f} {summary['p99_ms']:8.2f}  n={summary['count']}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Content API load generator and stub server")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p_scenario = sub.add_parser("scenario", help="write a scenario derived from the content tree")
+    p_scenario.add_argument("content_dir", nargs="?", default=DEFAULT_CONTENT_DIR)
+    p_scenario.add_argument("--out")
+
+    p_serve = sub.add_parser("serve", help="run the stub content API")
+    p_serve.add_argument("content_dir", nargs="?", default=DEFAULT_CONTENT_DIR)
+    p_serve.add_argument("--host", default="127.0.0.1")
+    p_serve.add_argument("--port", type=int, default=DEFAULT_PORT)
+
+    p_run = sub.add_parser("run", help="generate load and report latency")
+    p_run.add_argument("base_url", nargs="?")
+    p_run.add_argument("--stub", action="store_true", help="start a stub server in a child process")
+    p_run.add_argument("--content-dir", default=DEFAULT_CONTENT_DIR)
+    p_run.add_argument("--scenario")
+    p_run.add_argument("--concurrency", type=int, default=16,
+                       help="workers (closed loop) or max in-flight requests (open loop)")
+    p_run.add_argument("--duration", type=float, help="seconds to measure (default 10 unless --requests)")
+    p_run.add_argument("--requests", type=int, help="stop after this many requests")
+    p_run.add_argument("--rate", type=float, help="open-loop arrival rate in req/s")
+    p_run.add_argument("--warmup", type=float, default=0.0, help="seconds of unrecorded load first")
+    p_run.add_argument("--seed", type=int, default=1)
+    p_run.add_argument("--output", help="write results JSON")
+    p_run.add_argument("--baseline", help="compare against a previous results JSON")
+
+    args = parser.parse_args()
+
+    if args.command == "scenario":
+        text = json.dumps(generate_scenario(args.content_dir), indent=2, ensure_ascii=False)
+        if args.out:
+            with open(args.out, "w", encoding="utf-8") as f:
+                f.write(text)
+            print(f"✅ Wrote scenario to {args.out}")
+        else:
+            print(text)
+        return
+
+    if args.command == "serve":
+        try:
+            asyncio.run(StubServer(args.content_dir).serve(args.host, args.port))
+        except KeyboardInterrupt:
+            pass
+        return
+
+    if not args.base_url and not args.stub:
+        parser.error("run needs a base_url or --stub")
+    duration = args.duration if args.duration or args.requests else 10.0
+
+    stub = None
+    base_url = args.base_url
+    if args.stub:
+        ready = multiprocessing.Queue()
+        stub = multiprocessing.Process(target=_run_stub, args=(args.content_dir, 0, ready), daemon=True)
+        stub.start()
+        base_url = f"http://127.0.0.1:{ready.get(timeout=60)}"
+        print(f"Stub content API on {base_url}")
+
+    try:
+        scenario = load_scenario(args.scenario, args.content_dir)
+        results = asyncio.run(run_load(base_url, scenario, args.concurrency, duration, args.requests,
+                                       args.rate, args.warmup, args.seed))
+    finally:
+        if stub is not None:
+            stub.terminate()
+            stub.join()
+
+    baseline = None
+    if args.baseline:
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+    print_results(results, baseline)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+        print(f"\n📊 Results written to {args.output}")
+    sys.exit(1 if results["errors"] else 0)
+
+
+if __name__ == "__main__":
+    main()
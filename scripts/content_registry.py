@@ -0,0 +1,345 @@
+#!/usr/bin/env python3
+"""
+Registry query engine for Glass Code Academy content.
+Loads content/registry.json once into indexed structures and precomputes the
+module prerequisite graph so lookups never rescan the module list.
+
+Usage:
+    python scripts/content_registry.py [registry.json] [--export <artifact.json>]
+"""
+
+import hashlib
+import json
+import os
+import sys
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Tuple
+
+DEFAULT_REGISTRY = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "content", "registry.json")
+ARTIFACT_FORMAT = 1
+
+
+class RegistryError(ValueError):
+    """Raised when the registry cannot be indexed (bad fields, unknown or cyclic prerequisites)."""
+
+
+def _normalize(key: str) -> str:
+    return key.strip().lower()
+
+
+def _int_field(owner: str, data: Dict[str, Any], key: str) -> int:
+    value = data.get(key, 0)
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        raise RegistryError(f"{owner} has invalid {key} {value!r}") from None
+
+
+def _text_field(owner: str, key: str, value: Any) -> str:
+    if not isinstance(value, str):
+        raise RegistryError(f"{owner} has invalid {key} {value!r}")
+    return value
+
+
+def _file_digest(raw: bytes) -> str:
+    return hashlib.sha256(raw).hexdigest()
+
+
+def topological_order(modules: List[Dict[str, Any]], tier_levels: Dict[str, int]) -> List[str]:
+    """Order module slugs so every module follows its prerequisites.
+
+    Ties are broken by tier level, then module order, then slug, so the
+    result is stable and matches the curriculum layout.
+    """
+    slugs = {m["slug"] for m in modules}
+    rank: Dict[str, Tuple[int, int, str]] = {}
+    indegree: Dict[str, int] = {}
+    dependents: Dict[str, List[str]] = {s: [] for s in slugs}
+
+    for m in modules:
+        slug = m["slug"]
+        rank[slug] = (tier_levels.get(m.get("tier", ""), 0), _int_field(f"Module '{slug}'", m, "order"), slug)
+        # A repeated prerequisite is one edge; counting it twice would release the module early
+        prereqs = list(dict.fromkeys(m.get("prerequisites") or []))
+        for p in prereqs:
+            if p not in slugs:
+                raise RegistryError(f"Module '{slug}' has unknown prerequisite '{p}'")
+            dependents[p].append(slug)
+        indegree[slug] = len(prereqs)
+
+    ready = sorted((s for s, d in indegree.items() if d == 0), key=rank.__getitem__)
+    ordered: List[str] = []
+    while ready:
+        slug = ready.pop(0)
+        ordered.append(slug)
+        released = []
+        for dep in dependents[slug]:
+            indegree[dep] -= 1
+            if indegree[dep] == 0:
+                released.append(dep)
+        if released:
+            ready = sorted(ready + released, key=rank.__getitem__)
+
+    if len(ordered) != len(slugs):
+        cyclic = sorted(s for s, d in indegree.items() if d > 0)
+        raise RegistryError(f"Prerequisite cycle involving: {', '.join(cyclic)}")
+    return ordered
+
+
+class ContentRegistry:
+    """Indexed, read-only view of the content registry.
+
+    All indexes and the prerequisite closures are built once in the
+    constructor; every query afterwards is a dictionary lookup.
+    """
+
+    def __init__(self, registry: Dict[str, Any], source_digest: Optional[str] = None):
+        self.raw = registry
+        self.version: str = str(registry.get("version", ""))
+        self.source_digest = source_digest
+        self.tiers: Dict[str, Dict[str, Any]] = registry.get("tiers") or {}
+        self.modules: List[Dict[str, Any]] = [m for m in registry.get("modules") or [] if isinstance(m, dict) and m.get("slug")]
+
+        tier_levels = {name: _int_field(f"Tier '{name}'", t, "level") for name, t in self.tiers.items()}
+
+        self.by_slug: Dict[str, Dict[str, Any]] = {}
+        self.slug_aliases: Dict[str, str] = {}
+        self.by_tier: Dict[str, List[str]] = {}
+        self.by_track: Dict[str, List[str]] = {}
+        self.by_technology: Dict[str, List[str]] = {}
+        self.by_route: Dict[str, str] = {}
+
+        for m in self.modules:
+            slug = m["slug"]
+            if slug in self.by_slug:
+                raise RegistryError(f"Duplicate module slug '{slug}'")
+            self.by_slug[slug] = m
+            self.slug_aliases[_normalize(slug)] = slug
+        # Legacy slugs never shadow a canonical slug
+        for m in self.modules:
+            for legacy in m.get("legacySlugs") or []:
+                self.slug_aliases.setdefault(_normalize(_text_field(f"Module '{m['slug']}'", "legacy slug", legacy)), m["slug"])
+
+        self.order = topological_order(self.modules, tier_levels)
+        self.position: Dict[str, int] = {slug: i for i, slug in enumerate(self.order)}
+
+        def in_order(slugs: Iterable[str]) -> List[str]:
+            return sorted(slugs, key=self.position.__getitem__)
+
+        for slug in self.order:
+            m = self.by_slug[slug]
+            self.by_tier.setdefault(m.get("tier", ""), []).append(slug)
+            self.by_track.setdefault(_normalize(_text_field(f"Module '{slug}'", "track", m.get("track", ""))), []).append(slug)
+            for tech in m.get("technologies") or []:
+                self.by_technology.setdefault(_normalize(_text_field(f"Module '{slug}'", "technology", tech)), []).append(slug)
+            for path in (m.get("routes") or {}).values():
+                if isinstance(path, str):
+                    self.by_route[path] = slug
+
+        self.prerequisites: Dict[str, List[str]] = {
+            slug: in_order(set(self.by_slug[slug].get("prerequisites") or [])) for slug in self.order
+        }
+        self.dependents: Dict[str, List[str]] = {slug: [] for slug in self.order}
+        for slug in self.order:
+            for p in self.prerequisites[slug]:
+                self.dependents[p].append(slug)
+        self.root_slugs: List[str] = [s for s in self.order if not self.prerequisites[s]]
+
+        # Transitive closures: one pass in topological order for ancestors,
+        # one pass in reverse for descendants.
+        ancestors: Dict[str, FrozenSet[str]] = {}
+        for slug in self.order:
+            acc = set(self.prerequisites[slug])
+            for p in self.prerequisites[slug]:
+                acc |= ancestors[p]
+            ancestors[slug] = frozenset(acc)
+        descendants: Dict[str, FrozenSet[str]] = {}
+        for slug in reversed(self.order):
+            acc = set(self.dependents[slug])
+            for d in self.dependents[slug]:
+                acc |= descendants[d]
+            descendants[slug] = frozenset(acc)
+        self.ancestors = ancestors
+        self.descendants = descendants
+
+        # Learning path = every transitive prerequisite in curriculum order, then the module itself
+        self.learning_paths: Dict[str, List[str]] = {
+            slug: in_order(ancestors[slug]) + [slug] for slug in self.order
+        }
+
+    # Construction helpers
+
+    @classmethod
+    def load(cls, path: str = DEFAULT_REGISTRY) -> "ContentRegistry":
+        with open(path, "rb") as f:
+            raw = f.read()
+        return cls(json.loads(raw.decode("utf-8")), _file_digest(raw))
+
+    @classmethod
+    def from_artifact(cls, path: str, registry_path: Optional[str] = None) -> "ContentRegistry":
+        """Rebuild from an exported artifact, falling back to the registry if it is stale."""
+        with open(path, "r", encoding="utf-8") as f:
+            artifact = json.load(f)
+        if artifact.get("format") != ARTIFACT_FORMAT:
+            raise RegistryError(f"Unsupported registry artifact format: {artifact.get('format')}")
+        if registry_path is not None:
+            with open(registry_path, "rb") as f:
+                raw = f.read()
+            if _file_digest(raw) != artifact.get("sourceDigest"):
+                return cls(json.loads(raw.decode("utf-8")), _file_digest(raw))
+        return _ArtifactRegistry(artifact)
+
+    # Queries
+
+    def resolve(self, slug: str) -> Optional[str]:
+        """Return the canonical slug for a canonical or legacy slug, or None."""
+        return self.slug_aliases.get(_normalize(slug))
+
+    def get(self, slug: str) -> Optional[Dict[str, Any]]:
+        canonical = self.resolve(slug)
+        return self.by_slug.get(canonical) if canonical else None
+
+    def modules_for_tier(self, tier: str) -> List[str]:
+        return self.by_tier.get(tier, [])
+
+    def modules_for_track(self, track: str) -> List[str]:
+        return self.by_track.get(_normalize(track), [])
+
+    def modules_for_technology(self, technology: str) -> List[str]:
+        return self.by_technology.get(_normalize(technology), [])
+
+    def module_for_route(self, path: str) -> Optional[str]:
+        return self.by_route.get(path.rstrip("/") or "/")
+
+    def requires(self, slug: str, prerequisite: str) -> bool:
+        """True if `prerequisite` is a direct or transitive prerequisite of `slug`."""
+        canonical, required = self.resolve(slug), self.resolve(prerequisite)
+        return bool(canonical and required) and required in self.ancestors[canonical]
+
+    def unlocks(self, slug: str) -> List[str]:
+        """Modules that list `slug` as a direct prerequisite."""
+        canonical = self.resolve(slug)
+        return self.dependents.get(canonical, []) if canonical else []
+
+    def learning_path(self, slug: str) -> List[str]:
+        canonical = self.resolve(slug)
+        return self.learning_paths.get(canonical, []) if canonical else []
+
+    def remaining_path(self, slug: str, completed: Iterable[str]) -> List[str]:
+        done = {self.resolve(s) or s for s in completed}
+        return [s for s in self.learning_path(slug) if s not in done]
+
+    def available_next(self, completed: Iterable[str]) -> List[str]:
+        """Modules not yet completed whose prerequisites are all completed.
+
+        Only the dependents of completed modules and the root modules can
+        become available, so the scan is bounded by the completed frontier.
+        """
+        done = {self.resolve(s) or s for s in completed}
+        candidates = set(self.root_slugs)
+        for slug in done:
+            candidates.update(self.dependents.get(slug, []))
+        ready = [s for s in candidates if s not in done and all(p in done for p in self.prerequisites[s])]
+        return sorted(ready, key=self.position.__getitem__)
+
+    def roots(self) -> List[str]:
+        return list(self.root_slugs)
+
+    # Export
+
+    def to_artifact(self) -> Dict[str, Any]:
+        """Compact artifact: module slugs are referenced by topological index."""
+        idx = self.position
+
+        def ids(slugs: Iterable[str]) -> List[int]:
+            return sorted(idx[s] for s in slugs)
+
+        return {
+            "format": ARTIFACT_FORMAT,
+            "version": self.version,
+            "sourceDigest": self.source_digest,
+            "order": self.order,
+            "aliases": {alias: idx[slug] for alias, slug in sorted(self.slug_aliases.items())},
+            "tiers": {k: ids(v) for k, v in sorted(self.by_tier.items())},
+            "tracks": {k: ids(v) for k, v in sorted(self.by_track.items())},
+            "technologies": {k: ids(v) for k, v in sorted(self.by_technology.items())},
+            "routes": {k: idx[v] for k, v in sorted(self.by_route.items())},
+            "prerequisites": [ids(self.prerequisites[s]) for s in self.order],
+            "ancestors": [ids(self.ancestors[s]) for s in self.order],
+            "modules": [self.by_slug[s] for s in self.order],
+            "tierDefinitions": self.tiers,
+        }
+
+    def export(self, path: str) -> None:
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.to_artifact(), f, ensure_ascii=False, separators=(",", ":"))
+
+
+class _ArtifactRegistry(ContentRegistry):
+    """ContentRegistry rebuilt from an exported artifact without re-sorting the graph."""
+
+    def __init__(self, artifact: Dict[str, Any]):
+        order: List[str] = artifact["order"]
+        self.raw = {"version": artifact.get("version"), "tiers": artifact.get("tierDefinitions") or {}, "modules": artifact["modules"]}
+        self.version = str(artifact.get("version", ""))
+        self.source_digest = artifact.get("sourceDigest")
+        self.tiers = artifact.get("tierDefinitions") or {}
+        self.modules = artifact["modules"]
+        self.order = order
+        self.position = {slug: i for i, slug in enumerate(order)}
+
+        def slugs(ids: List[int]) -> List[str]:
+            return [order[i] for i in ids]
+
+        self.by_slug = {m["slug"]: m for m in self.modules}
+        self.slug_aliases = {alias: order[i] for alias, i in artifact["aliases"].items()}
+        self.by_tier = {k: slugs(v) for k, v in artifact["tiers"].items()}
+        self.by_track = {k: slugs(v) for k, v in artifact["tracks"].items()}
+        self.by_technology = {k: slugs(v) for k, v in artifact["technologies"].items()}
+        self.by_route = {k: order[i] for k, i in artifact["routes"].items()}
+        self.prerequisites = {order[i]: slugs(p) for i, p in enumerate(artifact["prerequisites"])}
+        self.dependents = {slug: [] for slug in order}
+        for slug in order:
+            for p in self.prerequisites[slug]:
+                self.dependents[p].append(slug)
+        self.root_slugs = [s for s in order if not self.prerequisites[s]]
+        self.ancestors = {order[i]: frozenset(slugs(a)) for i, a in enumerate(artifact["ancestors"])}
+        descendants: Dict[str, set] = {slug: set() for slug in order}
+        for slug, anc in self.ancestors.items():
+            for a in anc:
+                descendants[a].add(slug)
+        self.descendants = {k: frozenset(v) for k, v in descendants.items()}
+        self.learning_paths = {
+            slug: sorted(self.ancestors[slug], key=self.position.__getitem__) + [slug] for slug in order
+        }
+
+
+def main():
+    args = sys.argv[1:]
+    export_path = None
+    if "--export" in args:
+        i = args.index("--export")
+        if i + 1 >= len(args):
+            print("Usage: python scripts/content_registry.py [registry.json] [--export <artifact.json>]")
+            sys.exit(2)
+        export_path = args[i + 1]
+        del args[i:i + 2]
+    registry_path = args[0] if args else DEFAULT_REGISTRY
+
+    try:
+        registry = ContentRegistry.load(registry_path)
+    except (OSError, json.JSONDecodeError, RegistryError) as e:
+        print(f"❌ Could not load registry: {e}")
+        sys.exit(1)
+
+    print(f"✅ Registry {registry.version}: {len(registry.order)} modules, {len(registry.slug_aliases)} slug aliases")
+    for slug in registry.order:
+        path = registry.learning_paths[slug]
+        print(f"  {slug}: {' -> '.join(path)}")
+
+    if export_path:
+        registry.export(export_path)
+        print(f"\n📦 Wrote registry artifact to {export_path}")
+
+
+if __name__ == "__main__":
+    main()
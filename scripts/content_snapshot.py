@@ -0,0 +1,333 @@
+#!/usr/bin/env python3
+"""
+Content-addressed snapshot store for Glass Code Academy content releases.
+
+A snapshot is a Merkle tree over the release document
+
+    {"registry": {...registry without modules...},
+     "modules": {<slug>: {"registry": {...}, "lessons": [...], "quiz": {...}}}}
+
+where every question, lesson, quiz field, registry entry and module is a
+node stored once under the SHA-256 of its encoding. Unchanged subtrees are
+shared between snapshots, and diffs skip any subtree whose hash is equal, so
+a delta costs time proportional to what changed. Deltas are RFC 6902 JSON
+Patch documents against the release document.
+
+Usage:
+    python scripts/content_snapshot.py snapshot [content_dir] [--name <name>] [--store <dir>]
+    python scripts/content_snapshot.py list [--store <dir>]
+    python scripts/content_snapshot.py diff <from> <to> [--out <patch.json>] [--store <dir>]
+"""
+
+import copy
+import difflib
+import hashlib
+import json
+import os
+import sys
+import time
+import zlib
+from typing import Any, Dict, List, Optional, Tuple
+
+from content_layout import list_modules, read_module_lessons
+
+REPO_ROOT = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+DEFAULT_CONTENT_DIR = os.path.join(REPO_ROOT, "content")
+DEFAULT_STORE = os.path.join(REPO_ROOT, ".snapshots")
+
+Path = Tuple[Any, ...]
+Patch = List[Dict[str, Any]]
+
+
+def load_release(content_dir: str) -> Dict[str, Any]:
+    """Assemble the release document from the content tree (either lesson layout)."""
+    with open(os.path.join(content_dir, "registry.json"), "r", encoding="utf-8") as f:
+        registry = json.load(f)
+    entries = {m["slug"]: m for m in registry.get("modules") or [] if isinstance(m, dict) and m.get("slug")}
+    meta = {k: v for k, v in registry.items() if k != "modules"}
+    meta["moduleOrder"] = list(entries)
+
+    lessons_dir = os.path.join(content_dir, "lessons")
+    quizzes_dir = os.path.join(content_dir, "quizzes")
+    quiz_slugs = []
+    if os.path.isdir(quizzes_dir):
+        quiz_slugs = [n[:-len(".json")] for n in os.listdir(quizzes_dir) if n.endswith(".json")]
+    slugs = sorted(set(entries) | set(list_modules(lessons_dir)) | set(quiz_slugs))
+
+    modules: Dict[str, Any] = {}
+    for slug in slugs:
+        module: Dict[str, Any] = {"registry": entries.get(slug)}
+        try:
+            module["lessons"] = read_module_lessons(lessons_dir, slug)
+        except FileNotFoundError:
+            module["lessons"] = None
+        quiz_path = os.path.join(quizzes_dir, slug + ".json")
+        if os.path.exists(quiz_path):
+            with open(quiz_path, "r", encoding="utf-8") as f:
+                module["quiz"] = json.load(f)
+        else:
+            module["quiz"] = None
+        modules[slug] = module
+    return {"registry": meta, "modules": modules}
+
+
+def _splits(path: Path) -> bool:
+    """Whether the container at `path` becomes a tree node rather than a leaf."""
+    depth = len(path)
+    if depth <= 1:
+        return path != ("registry",)
+    if depth == 2:
+        return path[0] == "modules"
+    if depth == 3:
+        return path[2] in ("lessons", "quiz")
+    # Question lists inside quiz objects
+    return depth == 4 and path[2] == "quiz" and path[3] == "questions"
+
+
+def _escape(token: Any) -> str:
+    return str(token).replace("~", "~0").replace("/", "~1")
+
+
+def _pointer(path: Path) -> str:
+    return "".join("/" + _escape(p) for p in path)
+
+
+class SnapshotStore:
+    """Objects under <store>/objects/<aa>/<rest>, snapshot refs under <store>/refs/<name>.json."""
+
+    def __init__(self, root: str = DEFAULT_STORE):
+        self.root = root
+        self.objects_dir = os.path.join(root, "objects")
+        self.refs_dir = os.path.join(root, "refs")
+        self._cache: Dict[str, Any] = {}
+
+    # Objects
+
+    def _object_path(self, digest: str) -> str:
+        return os.path.join(self.objects_dir, digest[:2], digest[2:])
+
+    def put(self, node: Dict[str, Any]) -> str:
+        raw = json.dumps(node, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        digest = hashlib.sha256(raw).hexdigest()
+        path = self._object_path(digest)
+        if not os.path.exists(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp = path + ".tmp"
+            with open(tmp, "wb") as f:
+                f.write(zlib.compress(raw, 6))
+            os.replace(tmp, path)
+        return digest
+
+    def get(self, digest: str) -> Dict[str, Any]:
+        node = self._cache.get(digest)
+        if node is None:
+            with open(self._object_path(digest), "rb") as f:
+                node = json.loads(zlib.decompress(f.read()).decode("utf-8"))
+            self._cache[digest] = node
+        return node
+
+    def write_tree(self, value: Any, path: Path = ()) -> str:
+        if isinstance(value, dict) and _splits(path):
+            entries = {k: self.write_tree(v, path + (k,)) for k, v in value.items()}
+            return self.put({"t": "map", "entries": entries})
+        if isinstance(value, list) and _splits(path):
+            items = [self.write_tree(v, path + (i,)) for i, v in enumerate(value)]
+            return self.put({"t": "list", "items": items})
+        return self.put({"t": "blob", "v": value})
+
+    def read_tree(self, digest: str) -> Any:
+        node = self.get(digest)
+        if node["t"] == "map":
+            return {k: self.read_tree(h) for k, h in node["entries"].items()}
+        if node["t"] == "list":
+            return [self.read_tree(h) for h in node["items"]]
+        return node["v"]
+
+    # Refs
+
+    def save_ref(self, name: str, root: str, meta: Dict[str, Any]) -> Dict[str, Any]:
+        os.makedirs(self.refs_dir, exist_ok=True)
+        ref = {"name": name, "root": root, **meta}
+        with open(os.path.join(self.refs_dir, name + ".json"), "w", encoding="utf-8") as f:
+            json.dump(ref, f, indent=2)
+        return ref
+
+    def resolve(self, name_or_root: str) -> str:
+        path = os.path.join(self.refs_dir, name_or_root + ".json")
+        if os.path.exists(path):
+            with open(path, "r", encoding="utf-8") as f:
+                return json.load(f)["root"]
+        if os.path.exists(self._object_path(name_or_root)):
+            return name_or_root
+        raise KeyError(f"Unknown snapshot: {name_or_root}")
+
+    def refs(self) -> List[Dict[str, Any]]:
+        if not os.path.isdir(self.refs_dir):
+            return []
+        refs = []
+        for name in os.listdir(self.refs_dir):
+            if name.endswith(".json"):
+                with open(os.path.join(self.refs_dir, name), "r", encoding="utf-8") as f:
+                    refs.append(json.load(f))
+        return sorted(refs, key=lambda r: r.get("created", ""))
+
+    def snapshot(self, content_dir: str, name: Optional[str] = None) -> Dict[str, Any]:
+        release = load_release(content_dir)
+        root = self.write_tree(release)
+        version = release["registry"].get("version", "")
+        created = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
+        name = name or f"{version}-{created.replace(':', '').replace('-', '')}"
+        return self.save_ref(name, root, {"version": version, "created": created})
+
+    # Deltas
+
+    def diff(self, old: str, new: str) -> Patch:
+        patch: Patch = []
+        self._diff_nodes(old, new, (), patch)
+        return patch
+
+    def _diff_nodes(self, old: str, new: str, path: Path, patch: Patch) -> None:
+        if old == new:
+            return
+        a, b = self.get(old), self.get(new)
+        if a["t"] != b["t"]:
+            patch.append({"op": "replace", "path": _pointer(path), "value": self.read_tree(new)})
+        elif a["t"] == "map":
+            ea, eb = a["entries"], b["entries"]
+            for key in ea:
+                if key not in eb:
+                    patch.append({"op": "remove", "path": _pointer(path + (key,))})
+            for key, h in eb.items():
+                if key not in ea:
+                    patch.append({"op": "add", "path": _pointer(path + (key,)), "value": self.read_tree(h)})
+                else:
+                    self._diff_nodes(ea[key], h, path + (key,), patch)
+        elif a["t"] == "list":
+            _diff_sequences(a["items"], b["items"], path, patch,
+                            lambda i, j, p: self._diff_nodes(a["items"][i], b["items"][j], p, patch),
+                            lambda j: self.read_tree(b["items"][j]))
+        else:
+            diff_values(a["v"], b["v"], path, patch)
+
+
+def _diff_sequences(old: List[str], new: List[str], path: Path, patch: Patch, recurse, value_at) -> None:
+    """Emit ops turning `old` into `new` given per-item hashes.
+
+    Opcodes are applied back to front so earlier indexes stay valid while
+    the patch is applied in order.
+    """
+    matcher = difflib.SequenceMatcher(a=old, b=new, autojunk=False)
+    for tag, i1, i2, j1, j2 in reversed(matcher.get_opcodes()):
+        if tag == "equal":
+            continue
+        if tag == "replace" and i2 - i1 == j2 - j1:
+            for k in reversed(range(i2 - i1)):
+                recurse(i1 + k, j1 + k, path + (i1 + k,))
+            continue
+        for i in reversed(range(i1, i2)):
+            patch.append({"op": "remove", "path": _pointer(path + (i,))})
+        for k, j in enumerate(range(j1, j2)):
+            patch.append({"op": "add", "path": _pointer(path + (i1 + k,)), "value": value_at(j)})
+
+
+def _key(value: Any) -> str:
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+
+
+def diff_values(a: Any, b: Any, path: Path, patch: Patch) -> None:
+    """Field-level JSON Patch between two plain JSON values."""
+    if type(a) is not type(b):
+        patch.append({"op": "replace", "path": _pointer(path), "value": copy.deepcopy(b)})
+    elif isinstance(a, dict):
+        for key in a:
+            if key not in b:
+                patch.append({"op": "remove", "path": _pointer(path + (key,))})
+        for key, v in b.items():
+            if key not in a:
+                patch.append({"op": "add", "path": _pointer(path + (key,)), "value": copy.deepcopy(v)})
+            else:
+                diff_values(a[key], v, path + (key,), patch)
+    elif isinstance(a, list):
+        _diff_sequences([_key(v) for v in a], [_key(v) for v in b], path, patch,
+                        lambda i, j, p: diff_values(a[i], b[j], p, patch),
+                        lambda j: copy.deepcopy(b[j]))
+    elif a != b:
+        patch.append({"op": "replace", "path": _pointer(path), "value": copy.deepcopy(b)})
+
+
+def apply_patch(document: Any, patch: Patch) -> Any:
+    """Apply add/remove/replace ops (the subset emitted by diff) to a copy of `document`."""
+    doc = copy.deepcopy(document)
+    for op in patch:
+        tokens = [t.replace("~1", "/").replace("~0", "~") for t in op["path"].split("/")[1:]]
+        if not tokens:
+            doc = copy.deepcopy(op["value"])
+            continue
+        parent = doc
+        for t in tokens[:-1]:
+            parent = parent[int(t)] if isinstance(parent, list) else parent[t]
+        last = tokens[-1]
+        if isinstance(parent, list):
+            index = len(parent) if last == "-" else int(last)
+            if op["op"] == "add":
+                parent.insert(index, copy.deepcopy(op["value"]))
+            elif op["op"] == "remove":
+                del parent[index]
+            else:
+                parent[index] = copy.deepcopy(op["value"])
+        else:
+            if op["op"] == "remove":
+                del parent[last]
+            else:
+                parent[last] = copy.deepcopy(op["value"])
+    return doc
+
+
+def _pop_option(args: List[str], flag: str) -> Optional[str]:
+    if flag not in args:
+        return None
+    i = args.index(flag)
+    if i + 1 >= len(args):
+        print(f"{flag} requires a value")
+        sys.exit(2)
+    value = args[i + 1]
+    del args[i:i + 2]
+    return value
+
+
+def main():
+    args = sys.argv[1:]
+    store = SnapshotStore(_pop_option(args, "--store") or DEFAULT_STORE)
+    if not args or args[0] not in ("snapshot", "list", "diff"):
+        print(__doc__.strip().split("Usage:")[1].rstrip())
+        sys.exit(2)
+    command, rest = args[0], args[1:]
+
+    if command == "snapshot":
+        name = _pop_option(rest, "--name")
+        ref = store.snapshot(rest[0] if rest else DEFAULT_CONTENT_DIR, name)
+        print(f"📸 Snapshot {ref['name']}: {ref['root']}")
+    elif command == "list":
+        for ref in store.refs():
+            print(f"{ref['name']}\t{ref['root'][:12]}\t{ref.get('version', '')}\t{ref.get('created', '')}")
+    else:
+        out = _pop_option(rest, "--out")
+        if len(rest) != 2:
+            print("Usage: python scripts/content_snapshot.py diff <from> <to> [--out <patch.json>]")
+            sys.exit(2)
+        try:
+            patch = store.diff(store.resolve(rest[0]), store.resolve(rest[1]))
+        except KeyError as e:
+            print(f"❌ {e.args[0]}")
+            sys.exit(1)
+        text = json.dumps(patch, indent=2, ensure_ascii=False)
+        if out:
+            with open(out, "w", encoding="utf-8") as f:
+                f.write(text)
+            print(f"✅ Wrote {len(patch)} operations to {out}")
+        else:
+            print(text)
+
+
+if __name__ == "__main__":
+    main()
@@ -11,6 +11,7 @@ const https = require('https');
 const http = require('http');
 const fs = require('fs').promises;
 const path = require('path');
+const { readModuleLessons } = require('./content-layout');
 const { exec } = require('child_process');
 const { promisify } = require('util');
 
@@ -239,9 +240,7 @@ async function validateLessonFiles(modules) {
   
   for (const module of modules.slice(0, 3)) { // Test first 3 modules
     try {
-      const lessonPath = path.join(CONTENT_DIR, 'lessons', `${module.slug}.json`);
-      const content = await fs.readFile(lessonPath, 'utf8');
-      const data = JSON.parse(content);
+      const data = readModuleLessons(path.join(CONTENT_DIR, 'lessons'), module.slug);
       
       if (!Array.isArray(data)) {
         throw new Error('Lessons file should be an array');
@@ -7,6 +7,7 @@
 
 const fs = require('fs');
 const path = require('path');
+const { hasModuleLessons, moduleLessonsPath, readModuleLessons } = require('./content-layout');
 const https = require('https');
 const http = require('http');
 
@@ -274,17 +275,16 @@ class LinkChecker {
 
   // Check all lessons for a module
   async checkModuleLessons(module) {
-    const lessonsPath = path.join(this.lessonsDir, `${module.slug}.json`);
+    const lessonsPath = moduleLessonsPath(this.lessonsDir, module.slug);
     const context = { moduleSlug: module.slug, lessonsPath };
 
-    if (!fs.existsSync(lessonsPath)) {
+    if (!hasModuleLessons(this.lessonsDir, module.slug)) {
       this.addWarning(`Missing lessons file for module`, context);
       return;
     }
 
     try {
-      const lessonsContent = fs.readFileSync(lessonsPath, 'utf8');
-      const lessons = JSON.parse(lessonsContent);
+      const lessons = readModuleLessons(this.lessonsDir, module.slug);
 
       if (!Array.isArray(lessons)) {
         this.addError(`Lessons file must contain an array`, context);
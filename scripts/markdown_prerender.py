@@ -0,0 +1,373 @@
+#!/usr/bin/env python3
+"""
+Offline Markdown pre-rendering for lesson and quiz text.
+
+Renders lesson intro, code.explanation, pitfalls and exercises, and quiz
+question, choices and explanation to sanitized HTML, one JSON file per
+module. Fragments are rendered in parallel and cached by a hash of their
+source, so a rebuild only renders fields that changed.
+
+The renderer covers the Markdown used in content (paragraphs, headings,
+lists, blockquotes, fenced code, inline code, bold, italics and links).
+Output is safe by construction: all source text is HTML-escaped, only a
+fixed set of tags is emitted, and links are limited to http(s), mailto and
+relative URLs. Fenced code is highlighted with Pygments when it is installed
+(class-based spans); otherwise it is emitted escaped with a language-* class
+for client-side highlighting.
+
+Usage:
+    python scripts/markdown_prerender.py [content_dir] [--out-dir <dir>] [--jobs N]
+        [--cache <file>] [--no-cache]
+"""
+
+import argparse
+import hashlib
+import html
+import json
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
+
+from content_layout import list_modules, read_module_lessons
+
+try:
+    from pygments import highlight
+    from pygments.formatters import HtmlFormatter
+    from pygments.lexers import get_lexer_by_name
+    from pygments.util import ClassNotFound
+except ImportError:  # optional
+    highlight = None
+
+REPO_ROOT = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+DEFAULT_CONTENT_DIR = os.path.join(REPO_ROOT, "content")
+DEFAULT_OUT_DIR = os.path.join(REPO_ROOT, ".cache", "rendered")
+DEFAULT_CACHE = os.path.join(REPO_ROOT, ".cache", "markdown_fragments.json")
+
+# Bump when rendering output changes so cached fragments are discarded
+RENDERER_VERSION = "2"
+CACHE_FORMAT = 1
+
+# Keys inside pitfalls/exercises that are metadata, not prose
+NON_MARKDOWN_KEYS = {"severity"}
+
+_FENCE = re.compile(r"^(`{3,}|~{3,})\s*([\w#+.-]*)\s*$")
+_HEADING = re.compile(r"^(#{1,6})\s+(.*?)\s*#*\s*$")
+_BULLET = re.compile(r"^\s*[-*+]\s+(.*)$")
+_ORDERED = re.compile(r"^\s*(\d{1,9})[.)]\s+(.*)$")
+_QUOTE = re.compile(r"^\s*>\s?(.*)$")
+_CODE_SPAN = re.compile(r"(`+)(.+?)\1", re.S)
+_LINK = re.compile(r"\[([^\]]+)\]\(((?:[^()\s]|\([^()\s]*\))+)\)")
+_BOLD = re.compile(r"\*\*(?=\S)(.+?)(?<=\S)\*\*|__(?=\S)(.+?)(?<=\S)__")
+_EM = re.compile(r"(?<![\w*])\*(?=\S)(.+?)(?<=\S)\*(?![\w*])")
+_PLACEHOLDER = re.compile(r"\0(\d+)\0")
+# "//host" and "/\host" are protocol-relative, i.e. off-site, so a leading slash must not be doubled
+_SAFE_URL = re.compile(r"^(?![/\\]{2})(?:https?:|mailto:|/|#|\./|\.\./|[\w./-]+$)", re.I)
+
+
+def highlighter_id() -> str:
+    if highlight is None:
+        return "none"
+    import pygments
+    return "pygments-" + pygments.__version__
+
+
+# Rendering
+
+def render_inline(text: str) -> str:
+    parts = []
+    last = 0
+    for m in _CODE_SPAN.finditer(text):
+        parts.append(_render_emphasis(text[last:m.start()]))
+        parts.append(f"<code>{html.escape(m.group(2).strip(), quote=False)}</code>")
+        last = m.end()
+    parts.append(_render_emphasis(text[last:]))
+    return "".join(parts)
+
+
+def _emphasis(escaped: str) -> str:
+    escaped = _BOLD.sub(lambda m: f"<strong>{m.group(1) or m.group(2)}</strong>", escaped)
+    return _EM.sub(lambda m: f"<em>{m.group(1)}</em>", escaped)
+
+
+def _render_emphasis(text: str) -> str:
+    # NUL delimits link placeholders, so it cannot be allowed through from the source
+    escaped = html.escape(text.replace("\0", ""), quote=True)
+    links: List[str] = []
+
+    def link(m):
+        url = html.unescape(m.group(2))
+        if not _SAFE_URL.match(url):
+            return m.group(1)
+        # Emphasis runs on the label only; the generated tag is swapped out until the end
+        links.append(f'<a href="{html.escape(url, quote=True)}" rel="noopener noreferrer">{_emphasis(m.group(1))}</a>')
+        return f"\0{len(links) - 1}\0"
+
+    escaped = _emphasis(_LINK.sub(link, escaped))
+    return _PLACEHOLDER.sub(lambda m: links[int(m.group(1))], escaped) if links else escaped
+
+
+def render_code_block(code: str, language: str) -> str:
+    lang = language.lower()
+    cls = f' class="language-{html.escape(lang)}"' if lang else ""
+    if highlight is not None and lang:
+        try:
+            lexer = get_lexer_by_name(lang)
+        except ClassNotFound:
+            lexer = None
+        if lexer is not None:
+            body = highlight(code, lexer, HtmlFormatter(nowrap=True, classprefix="hl-"))
+            return f"<pre><code{cls}>{body.rstrip()}</code></pre>"
+    return f"<pre><code{cls}>{html.escape(code)}</code></pre>"
+
+
+def render_block(text: str) -> str:
+    lines = text.replace("\r\n", "\n").split("\n")
+    out: List[str] = []
+    paragraph: List[str] = []
+    list_tag: Optional[str] = None
+    list_items: List[str] = []
+    i = 0
+
+    def flush_paragraph():
+        if paragraph:
+            out.append(f"<p>{render_inline(chr(10).join(paragraph))}</p>")
+            paragraph.clear()
+
+    def flush_list():
+        nonlocal list_tag
+        if list_tag:
+            items = "".join(f"<li>{render_inline(item)}</li>" for item in list_items)
+            out.append(f"<{list_tag}>{items}</{list_tag}>")
+            list_tag = None
+            list_items.clear()
+
+    while i < len(lines):
+        line = lines[i]
+        fence = _FENCE.match(line.strip())
+        if fence:
+            flush_paragraph()
+            flush_list()
+            marker, language = fence.group(1), fence.group(2)
+            body = []
+            i += 1
+            while i < len(lines) and not lines[i].strip().startswith(marker):
+                body.append(lines[i])
+                i += 1
+            out.append(render_code_block("\n".join(body), language))
+            i += 1
+            continue
+        if not line.strip():
+            flush_paragraph()
+            flush_list()
+            i += 1
+            continue
+        heading = _HEADING.match(line)
+        bullet = _BULLET.match(line)
+        ordered = _ORDERED.match(line)
+        quote = _QUOTE.match(line)
+        if heading:
+            flush_paragraph()
+            flush_list()
+            level = len(heading.group(1))
+            out.append(f"<h{level}>{render_inline(heading.group(2))}</h{level}>")
+        elif bullet or ordered:
+            flush_paragraph()
+            tag = "ul" if bullet else "ol"
+            if list_tag != tag:
+                flush_list()
+                list_tag = tag
+            list_items.append(bullet.group(1) if bullet else ordered.group(2))
+        elif quote:
+            flush_paragraph()
+            flush_list()
+            quoted = []
+            while i < len(lines) and _QUOTE.match(lines[i]):
+                quoted.append(_QUOTE.match(lines[i]).group(1))
+                i += 1
+            out.append(f"<blockquote>{render_block(chr(10).join(quoted))}</blockquote>")
+            continue
+        elif list_tag and line.startswith((" ", "\t")):
+            # Continuation of the previous list item
+            list_items[-1] += "\n" + line.strip()
+        else:
+            flush_list()
+            paragraph.append(line)
+        i += 1
+    flush_paragraph()
+    flush_list()
+    return "".join(out)
+
+
+def render_fragment(job: Tuple[str, str]) -> str:
+    """Worker entry point: (mode, source) where mode is 'block' or 'inline'."""
+    mode, source = job
+    return render_block(source) if mode == "block" else render_inline(source)
+
+
+# Build
+
+def fragment_key(mode: str, source: str) -> str:
+    h = hashlib.sha256()
+    for part in (RENDERER_VERSION, highlighter_id(), mode, source):
+        h.update(part.encode("utf-8"))
+        h.update(b"\0")
+    return h.hexdigest()
+
+
+class FragmentSet:
+    """Collects fragments to render and later substitutes rendered HTML back in."""
+
+    def __init__(self):
+        self.jobs: Dict[str, Tuple[str, str]] = {}
+
+    def add(self, mode: str, value: Any) -> Any:
+        if not isinstance(value, str) or not value:
+            return value
+        key = fragment_key(mode, value)
+        self.jobs[key] = (mode, value)
+        return {"__fragment__": key}
+
+    def add_nested(self, value: Any) -> Any:
+        """Inline-render every string leaf of a pitfall/exercise structure."""
+        if isinstance(value, dict):
+            return {k: (v if k in NON_MARKDOWN_KEYS else self.add_nested(v)) for k, v in value.items()}
+        if isinstance(value, list):
+            return [self.add_nested(v) for v in value]
+        return self.add("inline", value)
+
+
+def _resolve(value: Any, rendered: Dict[str, str]) -> Any:
+    if isinstance(value, dict):
+        if set(value) == {"__fragment__"}:
+            return rendered[value["__fragment__"]]
+        return {k: _resolve(v, rendered) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_resolve(v, rendered) for v in value]
+    return value
+
+
+def collect(content_dir: str, fragments: FragmentSet) -> Dict[str, Dict[str, Any]]:
+    modules: Dict[str, Dict[str, Any]] = {}
+    lessons_dir = os.path.join(content_dir, "lessons")
+    for slug in list_modules(lessons_dir):
+        lessons = read_module_lessons(lessons_dir, slug)
+        entries = []
+        for pos, lesson in enumerate(lessons if isinstance(lessons, list) else []):
+            if not isinstance(lesson, dict):
+                continue
+            code = lesson.get("code") if isinstance(lesson.get("code"), dict) else {}
+            entries.append({
+                "id": lesson.get("id", pos + 1),
+                "intro": fragments.add("block", lesson.get("intro")),
+                "codeExplanation": fragments.add("block", code.get("explanation")),
+                "pitfalls": fragments.add_nested(lesson.get("pitfalls") or []),
+                "exercises": fragments.add_nested(lesson.get("exercises") or []),
+            })
+        modules.setdefault(slug, {"moduleSlug": slug})["lessons"] = entries
+
+    quizzes_dir = os.path.join(content_dir, "quizzes")
+    for name in sorted(os.listdir(quizzes_dir)) if os.path.isdir(quizzes_dir) else []:
+        if not name.endswith(".json"):
+            continue
+        slug = name[:-len(".json")]
+        with open(os.path.join(quizzes_dir, name), "r", encoding="utf-8") as f:
+            quiz = json.load(f)
+        questions = quiz if isinstance(quiz, list) else quiz.get("questions") or []
+        entries = []
+        for pos, q in enumerate(questions):
+            if not isinstance(q, dict):
+                continue
+            choices = q.get("choices") if isinstance(q.get("choices"), list) else []
+            entries.append({
+                "id": q.get("id", pos + 1),
+                "question": fragments.add("inline", q.get("question")),
+                "choices": [fragments.add("inline", c) for c in choices],
+                "explanation": fragments.add("block", q.get("explanation")),
+            })
+        modules.setdefault(slug, {"moduleSlug": slug})["questions"] = entries
+    return modules
+
+
+def load_cache(path: Optional[str]) -> Dict[str, str]:
+    if not path or not os.path.exists(path):
+        return {}
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return {}
+    return data.get("fragments", {}) if data.get("format") == CACHE_FORMAT else {}
+
+
+def save_cache(path: Optional[str], fragments: Dict[str, str]) -> None:
+    if not path:
+        return
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp = path + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump({"format": CACHE_FORMAT, "fragments": fragments}, f, ensure_ascii=False, separators=(",", ":"))
+    os.replace(tmp, path)
+
+
+def render_all(jobs: Dict[str, Tuple[str, str]], cache: Dict[str, str], workers: Optional[int]) -> Tuple[Dict[str, str], int]:
+    """Render uncached fragments in a process pool; returns (all fragments, number rendered)."""
+    rendered = {key: cache[key] for key in jobs if key in cache}
+    missing = [key for key in jobs if key not in rendered]
+    if len(missing) < 64 or workers == 1:
+        # Pool start-up costs more than rendering a handful of fragments
+        for key in missing:
+            rendered[key] = render_fragment(jobs[key])
+    elif missing:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            chunk = max(16, len(missing) // ((workers or os.cpu_count() or 1) * 4))
+            for key, result in zip(missing, pool.map(render_fragment, [jobs[k] for k in missing], chunksize=chunk)):
+                rendered[key] = result
+    return rendered, len(missing)
+
+
+def write_module(out_dir: str, slug: str, payload: Dict[str, Any]) -> bool:
+    """Write a module's rendered payload; skip the write when nothing changed."""
+    path = os.path.join(out_dir, slug + ".json")
+    raw = json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    if os.path.exists(path):
+        with open(path, "rb") as f:
+            if f.read() == raw:
+                return False
+    tmp = path + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(raw)
+    os.replace(tmp, path)
+    return True
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Pre-render lesson and quiz Markdown to sanitized HTML")
+    parser.add_argument("content_dir", nargs="?", default=DEFAULT_CONTENT_DIR)
+    parser.add_argument("--out-dir", default=DEFAULT_OUT_DIR)
+    parser.add_argument("--jobs", type=int, default=None, help="worker processes (default: CPU count)")
+    parser.add_argument("--cache", default=DEFAULT_CACHE)
+    parser.add_argument("--no-cache", action="store_true")
+    args = parser.parse_args()
+
+    cache_path = None if args.no_cache else args.cache
+    fragments = FragmentSet()
+    modules = collect(args.content_dir, fragments)
+    rendered, count = render_all(fragments.jobs, load_cache(cache_path), args.jobs)
+    # Keep only live fragments so the cache does not grow without bound
+    save_cache(cache_path, rendered)
+
+    os.makedirs(args.out_dir, exist_ok=True)
+    changed = 0
+    for slug, payload in sorted(modules.items()):
+        if write_module(args.out_dir, slug, _resolve(payload, rendered)):
+            changed += 1
+
+    print(f"✅ {len(fragments.jobs)} fragments ({count} rendered, {len(fragments.jobs) - count} cached)")
+    print(f"   {len(modules)} modules written to {args.out_dir} ({changed} changed)")
+    if highlight is None:
+        print("   Pygments not installed: code blocks are escaped without highlighting")
+
+
+if __name__ == "__main__":
+    main()
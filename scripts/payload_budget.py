@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+"""
+Payload size budget analyzer for Glass Code Academy content.
+
+Walks the content tree once and reports the raw (as stored), minified,
+gzip and brotli size of every module's lesson payload, each lesson and each
+quiz, plus the fields contributing the most bytes (e.g. code.example,
+explanation, industryContext). Lessons are named by their uid
+("<module>/lessons/<id>", see content_ids), which stays unique when an id
+repeats within a module. Budgets from scripts/payload-budgets.json are
+enforced and the run fails when any is exceeded.
+
+Brotli sizes are reported only when the `brotli` package is installed;
+budgets on brotli are skipped otherwise.
+
+Usage:
+    python scripts/payload_budget.py [content_dir] [--budgets <file>] [--top N] [--report <file>] [--quiet]
+"""
+
+import argparse
+import gzip
+import json
+import os
+import sys
+from typing import Any, Dict, List, Optional, Tuple
+
+from content_ids import content_uids, report_duplicates
+from content_layout import list_modules, read_module_lessons
+
+try:
+    import brotli
+except ImportError:  # optional
+    brotli = None
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_CONTENT_DIR = os.path.join(SCRIPT_DIR, "..", "content")
+DEFAULT_BUDGETS = os.path.join(SCRIPT_DIR, "payload-budgets.json")
+METRICS = ("raw", "minified", "gzip", "brotli")
+
+
+def _minified(value: Any) -> bytes:
+    # Matches JSON.stringify output as sent by the API
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def measure(value: Any) -> Dict[str, Optional[int]]:
+    minified = _minified(value)
+    raw = json.dumps(value, indent=2, ensure_ascii=False).encode("utf-8")
+    return {
+        "raw": len(raw),
+        "minified": len(minified),
+        "gzip": len(gzip.compress(minified, 6, mtime=0)),
+        "brotli": len(brotli.compress(minified, quality=11)) if brotli is not None else None,
+    }
+
+
+def field_sizes(obj: Dict[str, Any], prefix: str = "") -> Dict[str, int]:
+    """Minified bytes per field; one level of nested objects is split (code.example)."""
+    sizes: Dict[str, int] = {}
+    for key, value in obj.items():
+        path = prefix + key
+        if isinstance(value, dict) and not prefix:
+            sizes.update(field_sizes(value, path + "."))
+        else:
+            sizes[path] = len(_minified(value))
+    return sizes
+
+
+class Analysis:
+    def __init__(self):
+        self.items: List[Dict[str, Any]] = []
+        self.fields: Dict[str, Dict[str, int]] = {}
+
+    def add(self, kind: str, name: str, value: Any) -> Dict[str, Any]:
+        item = {"kind": kind, "name": name, **measure(value)}
+        self.items.append(item)
+        return item
+
+    def add_fields(self, kind: str, obj: Dict[str, Any]) -> None:
+        for path, size in field_sizes(obj).items():
+            key = f"{kind}.{path}"
+            stats = self.fields.setdefault(key, {"bytes": 0, "count": 0, "max": 0})
+            stats["bytes"] += size
+            stats["count"] += 1
+            stats["max"] = max(stats["max"], size)
+
+    def top_fields(self, n: int) -> List[Tuple[str, Dict[str, int]]]:
+        return sorted(self.fields.items(), key=lambda kv: -kv[1]["bytes"])[:n]
+
+
+def analyze(content_dir: str) -> Analysis:
+    analysis = Analysis()
+    lessons_dir = os.path.join(content_dir, "lessons")
+    for slug in list_modules(lessons_dir):
+        lessons = read_module_lessons(lessons_dir, slug)
+        analysis.add("module", slug, lessons)
+        uids, duplicates = content_uids(slug, "lessons", lessons)
+        report_duplicates(slug, "lessons", duplicates)
+        for uid, lesson in zip(uids, lessons if isinstance(lessons, list) else []):
+            if uid is None:
+                continue
+            analysis.add("lesson", uid, lesson)
+            analysis.add_fields("lesson", lesson)
+
+    quizzes_dir = os.path.join(content_dir, "quizzes")
+    for name in sorted(os.listdir(quizzes_dir)) if os.path.isdir(quizzes_dir) else []:
+        if not name.endswith(".json"):
+            continue
+        with open(os.path.join(quizzes_dir, name), "r", encoding="utf-8") as f:
+            quiz = json.load(f)
+        analysis.add("quiz", name[:-len(".json")], quiz)
+        questions = quiz if isinstance(quiz, list) else quiz.get("questions") or []
+        for q in questions:
+            if isinstance(q, dict):
+                analysis.add_fields("question", q)
+    return analysis
+
+
+def load_budgets(path: Optional[str]) -> Dict[str, Any]:
+    if not path or not os.path.exists(path):
+        return {}
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def check_budgets(analysis: Analysis, budgets: Dict[str, Any]) -> List[str]:
+    """Compare measurements against budgets.
+
+    Shape: {"module"|"lesson"|"quiz": {metric: bytes},
+            "fields": {"lesson.code.example": {"max": bytes}},
+            "overrides": {"<kind>:<name>": {metric: bytes}}}
+
+    Modules and quizzes are named by slug and lessons by their uid
+    (content_ids.content_uids), e.g. "lesson:react-basics/lessons/3" or, for
+    an id that repeats within its module, "lesson:react-basics/lessons/3@2".
+    """
+    violations: List[str] = []
+    for item in analysis.items:
+        limits = budgets.get(item["kind"]) or {}
+        overrides = (budgets.get("overrides") or {}).get(f"{item['kind']}:{item['name']}") or {}
+        for metric in METRICS:
+            limit = overrides.get(metric, limits.get(metric))
+            size = item.get(metric)
+            if limit is not None and size is not None and size > limit:
+                violations.append(f"{item['kind']} {item['name']}: {metric} {size} B exceeds budget {limit} B")
+    for field, limits in (budgets.get("fields") or {}).items():
+        stats = analysis.fields.get(field)
+        if stats and limits.get("max") is not None and stats["max"] > limits["max"]:
+            violations.append(f"field {field}: largest value {stats['max']} B exceeds budget {limits['max']} B")
+    return violations
+
+
+def _kb(n: Optional[int]) -> str:
+    return "-" if n is None else f"{n / 1024:.1f}K"
+
+
+def print_report(analysis: Analysis, top: int) -> None:
+    for kind, title in (("module", "Module lesson payloads"), ("quiz", "Quizzes"), ("lesson", "Lessons")):
+        items = sorted((i for i in analysis.items if i["kind"] == kind), key=lambda i: -i["gzip"])
+        if kind == "lesson":
+            print(f"\nLargest {min(top, len(items))} lessons (raw / minified / gzip / brotli):")
+            items = items[:top]
+        else:
+            print(f"\n{title} (raw / minified / gzip / brotli):")
+        for i in items:
+            print(f"  {i['name']:<40} {_kb(i['raw']):>8} {_kb(i['minified']):>8} {_kb(i['gzip']):>8} {_kb(i['brotli']):>8}")
+    total = sum(s["bytes"] for s in analysis.fields.values()) or 1
+    print(f"\nTop {top} fields by minified bytes:")
+    for field, stats in analysis.top_fields(top):
+        share = stats["bytes"] / total * 100
+        print(f"  {field:<32} {_kb(stats['bytes']):>8} {share:5.1f}%  max {_kb(stats['max'])} over {stats['count']}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Report and enforce content payload size budgets")
+    parser.add_argument("content_dir", nargs="?", default=DEFAULT_CONTENT_DIR)
+    parser.add_argument("--budgets", default=DEFAULT_BUDGETS)
+    parser.add_argument("--top", type=int, default=10)
+    parser.add_argument("--report", help="write all measurements as JSON")
+    parser.add_argument("--quiet", action="store_true", help="only print budget violations")
+    args = parser.parse_args()
+
+    analysis = analyze(args.content_dir)
+    if not args.quiet:
+        print_report(analysis, args.top)
+    if args.report:
+        with open(args.report, "w", encoding="utf-8") as f:
+            json.dump({"items": analysis.items, "fields": analysis.fields}, f, indent=2)
+
+    violations = check_budgets(analysis, load_budgets(args.budgets))
+    if violations:
+        print("\n❌ Payload budgets exceeded:")
+        for v in violations:
+            print(f"  - {v}")
+        sys.exit(1)
+    if not args.quiet:
+        print("\n✅ All payload budgets met")
+
+
+if __name__ == "__main__":
+    main()
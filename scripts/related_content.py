@@ -0,0 +1,307 @@
+#!/usr/bin/env python3
+"""
+Precomputed related-content table from sparse TF-IDF similarity.
+
+Every lesson (title, objectives, tags, intro) and every quiz question
+(question, topic, tags, explanation) becomes a sparse TF-IDF vector. Both
+also get the owning module's `technologies` from registry.json. The cosine
+similarity of every item against every other is computed in row blocks, as
+X[block] · Xᵀ. For each item, the top-k lessons and top-k questions across
+all modules are kept.
+
+The multiply uses scipy.sparse when it is installed. Otherwise it uses a
+pure-Python inverted index over the same vectors. Both produce the same
+table.
+
+Output (default .cache/related-content.json) is a compact neighbor table:
+    {"format": 1, "k": 5, "items": ["<module>/lessons/<id>", "<module>/questions/<id>", ...],
+     "lessons":   [[itemIndex, scoreMilli, itemIndex, scoreMilli, ...], ...],
+     "questions": [[...], ...]}
+`lessons[i]` and `questions[i]` are the neighbors of `items[i]`, best first,
+with cosine scores scaled to 0-1000. Ids that repeat within a module appear
+as "<id>@<position>" (content_ids.content_uids). Every uid in `items` is
+unique, so the API can index `items` once at load and then answer "related
+content" with a constant-time lookup.
+
+Usage:
+    python scripts/related_content.py [content_dir] [--output <file>] [--k N] [--min-score S]
+        [--block-size N] [--exclude-same-module] [--engine auto|scipy|python] [--show <uid>]
+"""
+
+import argparse
+import heapq
+import json
+import math
+import os
+import re
+import sys
+from collections import Counter
+from typing import Any, Dict, Iterable, Iterator, List, Tuple
+
+from content_ids import content_uids, report_duplicates
+from content_layout import list_modules, read_module_lessons
+
+try:
+    import numpy as np
+    import scipy.sparse as sp
+except ImportError:  # optional
+    np = None
+    sp = None
+
+REPO_ROOT = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+DEFAULT_CONTENT_DIR = os.path.join(REPO_ROOT, "content")
+DEFAULT_OUTPUT = os.path.join(REPO_ROOT, ".cache", "related-content.json")
+TABLE_FORMAT = 1
+
+# Keeps tech names whole: c#, c++, node.js, asp.net, next.js
+_TOKEN = re.compile(r"[a-z0-9][a-z0-9+#]*(?:\.[a-z0-9+#]+)*")
+STOPWORDS = frozenset("""
+a about after all also an and any are as at be because been before being between both but by can could
+do does each for from has have how however if in into is it its just less like may more most much must
+no not of on one only or other our out over same should so some such than that the their them then there
+these they this those through to under up use used uses using very was we well what when where which
+while who why will with within without would you your
+""".split())
+
+# Repetitions per field: fields that describe an item more precisely weigh more
+LESSON_FIELDS = (("title", 3), ("objectives", 1), ("tags", 2), ("intro", 1))
+QUESTION_FIELDS = (("question", 3), ("topic", 2), ("tags", 2), ("explanation", 1))
+PHRASE_FIELDS = frozenset({"tags", "topic"})
+TECHNOLOGY_WEIGHT = 1
+
+
+def tokenize(text: str) -> List[str]:
+    return [t for t in _TOKEN.findall(text.lower()) if t not in STOPWORDS and (len(t) > 1 or t in "cr")]
+
+
+def _texts(value: Any) -> Iterator[str]:
+    if isinstance(value, str):
+        yield value
+    elif isinstance(value, list):
+        for v in value:
+            if isinstance(v, str):
+                yield v
+
+
+def _phrase(text: str) -> str:
+    return "=" + " ".join(text.lower().split())
+
+
+def document(item: Dict[str, Any], fields: Iterable[Tuple[str, int]], technologies: List[str]) -> Counter:
+    """Weighted term counts; tags, topic and technologies also count as whole phrases."""
+    counts: Counter = Counter()
+    for field, weight in fields:
+        for text in _texts(item.get(field)):
+            for token in tokenize(text):
+                counts[token] += weight
+            if field in PHRASE_FIELDS:
+                counts[_phrase(text)] += weight
+    for tech in technologies:
+        for token in tokenize(tech):
+            counts[token] += TECHNOLOGY_WEIGHT
+        counts[_phrase(tech)] += TECHNOLOGY_WEIGHT
+    return counts
+
+
+def collect_documents(content_dir: str) -> Tuple[List[str], List[str], List[Counter]]:
+    """Returns (uids, module slug per uid, term counts per uid), lessons first.
+
+    uids come from content_ids.content_uids, so they are unique even when
+    an id repeats within a module.
+    """
+    technologies: Dict[str, List[str]] = {}
+    registry_path = os.path.join(content_dir, "registry.json")
+    if os.path.exists(registry_path):
+        with open(registry_path, "r", encoding="utf-8") as f:
+            registry = json.load(f)
+        for m in registry.get("modules") or []:
+            if isinstance(m, dict) and m.get("slug"):
+                technologies[m["slug"]] = list(_texts(m.get("technologies")))
+
+    uids: List[str] = []
+    modules: List[str] = []
+    docs: List[Counter] = []
+
+    def add_uids(slug: str, kind: str, items: Any) -> List[Any]:
+        item_uids, duplicates = content_uids(slug, kind, items)
+        report_duplicates(slug, kind, duplicates)
+        return item_uids
+
+    lessons_dir = os.path.join(content_dir, "lessons")
+    for slug in list_modules(lessons_dir):
+        lessons = read_module_lessons(lessons_dir, slug)
+        lesson_uids = add_uids(slug, "lessons", lessons)
+        for pos, lesson in enumerate(lessons if isinstance(lessons, list) else []):
+            if isinstance(lesson, dict):
+                uids.append(lesson_uids[pos])
+                modules.append(slug)
+                docs.append(document(lesson, LESSON_FIELDS, technologies.get(slug, [])))
+
+    quizzes_dir = os.path.join(content_dir, "quizzes")
+    for name in sorted(os.listdir(quizzes_dir)) if os.path.isdir(quizzes_dir) else []:
+        if not name.endswith(".json"):
+            continue
+        slug = name[:-len(".json")]
+        with open(os.path.join(quizzes_dir, name), "r", encoding="utf-8") as f:
+            quiz = json.load(f)
+        questions = quiz if isinstance(quiz, list) else quiz.get("questions") or []
+        question_uids = add_uids(slug, "questions", questions)
+        for pos, q in enumerate(questions):
+            if isinstance(q, dict):
+                uids.append(question_uids[pos])
+                modules.append(slug)
+                docs.append(document(q, QUESTION_FIELDS, technologies.get(slug, [])))
+    return uids, modules, docs
+
+
+# Vectorizing
+
+def tfidf(docs: List[Counter], max_df: float = 0.5, min_df: int = 2) -> Tuple[List[Dict[int, float]], List[str]]:
+    """L2-normalized sublinear TF-IDF rows as {term index: weight}.
+
+    Terms in fewer than min_df documents cannot link two items, and terms in
+    more than max_df of them link everything, so both are dropped; this also
+    keeps the postings short for the multiply.
+    """
+    df: Counter = Counter()
+    for counts in docs:
+        df.update(counts.keys())
+    n = len(docs)
+    vocabulary = sorted(t for t, d in df.items() if min_df <= d <= max_df * n)
+    term_index = {t: i for i, t in enumerate(vocabulary)}
+    idf = [math.log((1 + n) / (1 + df[t])) + 1 for t in vocabulary]
+
+    rows: List[Dict[int, float]] = []
+    for counts in docs:
+        row = {term_index[t]: (1 + math.log(c)) * idf[term_index[t]] for t, c in counts.items() if t in term_index}
+        norm = math.sqrt(sum(w * w for w in row.values()))
+        rows.append({i: w / norm for i, w in row.items()} if norm else {})
+    return rows, vocabulary
+
+
+# Similarity
+
+Candidate = Tuple[float, int]
+
+
+def _select(scores: Iterable[Candidate], k: int) -> List[Candidate]:
+    # Highest score first; ties go to the lower item index so both engines agree
+    return heapq.nsmallest(k, ((-s, j) for s, j in scores))
+
+
+def _neighbors_python(rows: List[Dict[int, float]], block_size: int) -> Iterator[Tuple[int, Dict[int, float]]]:
+    """Yield (row, {col: score}) using an inverted index, one block of rows at a time."""
+    postings: Dict[int, List[Tuple[int, float]]] = {}
+    for j, row in enumerate(rows):
+        for t, w in row.items():
+            postings.setdefault(t, []).append((j, w))
+    for start in range(0, len(rows), block_size):
+        for i in range(start, min(start + block_size, len(rows))):
+            acc: Dict[int, float] = {}
+            for t, w in rows[i].items():
+                for j, wj in postings[t]:
+                    acc[j] = acc.get(j, 0.0) + w * wj
+            yield i, acc
+
+
+def _neighbors_scipy(rows: List[Dict[int, float]], vocabulary_size: int, block_size: int) -> Iterator[Tuple[int, Dict[int, float]]]:
+    """Yield (row, {col: score}) from X[block] · Xᵀ in CSR form."""
+    indptr = [0]
+    indices: List[int] = []
+    data: List[float] = []
+    for row in rows:
+        for t in sorted(row):
+            indices.append(t)
+            data.append(row[t])
+        indptr.append(len(indices))
+    x = sp.csr_matrix((np.asarray(data, dtype=np.float64), np.asarray(indices, dtype=np.int32),
+                       np.asarray(indptr, dtype=np.int64)), shape=(len(rows), vocabulary_size))
+    xt = x.T.tocsc()
+    for start in range(0, len(rows), block_size):
+        block = (x[start:start + block_size] @ xt).tocsr()
+        for r in range(block.shape[0]):
+            lo, hi = block.indptr[r], block.indptr[r + 1]
+            yield start + r, dict(zip(block.indices[lo:hi].tolist(), block.data[lo:hi].tolist()))
+
+
+def resolve_engine(requested: str) -> str:
+    if requested == "auto":
+        return "scipy" if sp is not None else "python"
+    if requested == "scipy" and sp is None:
+        raise RuntimeError("Engine 'scipy' requires numpy and scipy")
+    return requested
+
+
+def build_table(content_dir: str, k: int = 5, min_score: float = 0.05, block_size: int = 256,
+                exclude_same_module: bool = False, engine: str = "auto") -> Dict[str, Any]:
+    engine = resolve_engine(engine)
+    uids, modules, docs = collect_documents(content_dir)
+    rows, vocabulary = tfidf(docs)
+    is_lesson = ["/lessons/" in uid for uid in uids]
+
+    if engine == "scipy":
+        scored = _neighbors_scipy(rows, len(vocabulary), block_size)
+    else:
+        scored = _neighbors_python(rows, block_size)
+
+    lessons: List[List[int]] = [[] for _ in uids]
+    questions: List[List[int]] = [[] for _ in uids]
+    for i, acc in scored:
+        candidates = [(s, j) for j, s in acc.items()
+                      if j != i and s >= min_score and not (exclude_same_module and modules[j] == modules[i])]
+        for target, want_lesson in ((lessons, True), (questions, False)):
+            for neg, j in _select(((s, j) for s, j in candidates if is_lesson[j] == want_lesson), k):
+                target[i].extend((j, min(1000, round(-neg * 1000))))
+    return {
+        "format": TABLE_FORMAT, "k": k, "minScore": min_score, "engine": engine,
+        "vocabulary": len(vocabulary), "items": uids, "lessons": lessons, "questions": questions,
+    }
+
+
+def neighbors(table: Dict[str, Any], uid: str) -> Dict[str, List[Tuple[str, float]]]:
+    """Decode one item's neighbors as {"lessons"|"questions": [(uid, score)]}."""
+    i = table["items"].index(uid)
+    out = {}
+    for kind in ("lessons", "questions"):
+        flat = table[kind][i]
+        out[kind] = [(table["items"][flat[n]], flat[n + 1] / 1000) for n in range(0, len(flat), 2)]
+    return out
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Precompute related lessons and questions via TF-IDF similarity")
+    parser.add_argument("content_dir", nargs="?", default=DEFAULT_CONTENT_DIR)
+    parser.add_argument("--output", default=DEFAULT_OUTPUT)
+    parser.add_argument("--k", type=int, default=5, help="neighbors kept per item for each of lessons and questions")
+    parser.add_argument("--min-score", type=float, default=0.05, help="minimum cosine similarity")
+    parser.add_argument("--block-size", type=int, default=256, help="rows per block of the similarity multiply")
+    parser.add_argument("--exclude-same-module", action="store_true", help="only keep neighbors from other modules")
+    parser.add_argument("--engine", choices=("auto", "scipy", "python"), default="auto")
+    parser.add_argument("--show", metavar="UID", help="print the neighbors of one item after building")
+    args = parser.parse_args()
+
+    try:
+        table = build_table(args.content_dir, args.k, args.min_score, args.block_size,
+                            args.exclude_same_module, args.engine)
+    except RuntimeError as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+
+    os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(table, f, separators=(",", ":"))
+    print(f"✅ {len(table['items'])} items, {table['vocabulary']} terms ({table['engine']} engine) "
+          f"-> {os.path.relpath(args.output)} ({os.path.getsize(args.output) / 1024:.1f}K)")
+
+    if args.show:
+        if args.show not in table["items"]:
+            print(f"❌ Unknown item: {args.show}")
+            sys.exit(1)
+        for kind, items in neighbors(table, args.show).items():
+            print(f"\nRelated {kind}:")
+            for uid, score in items:
+                print(f"  {score:.3f}  {uid}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,12 @@
 import os
 import sys
 import json
+from collections.abc import Mapping
 from typing import Any, Dict, List, Tuple, Union, Optional, cast
 
+from validation_limits import (LimitExceeded, ValidationLimits, check_deadline, load_json_limited, loads_limited,
+                               start_deadline)
+
 # Flexible type checker supporting tuples of types and optional fields
 
 def validate_type(value: Any, expected: Union[type, Tuple[type, ...], List[type]], optional: bool = False) -> bool:
@@ -179,11 +183,12 @@ def validate_question(q: Dict[str, Any], file_path: str, idx: int) -> List[str]:
     return errors
 
 
-def validate_quiz(quiz: Union[Dict[str, Any], List[Any]], file_path: str) -> List[str]:
+def validate_quiz(quiz: Union[Dict[str, Any], List[Any]], file_path: str,
+                  deadline: Optional[float] = None, limits: Optional[ValidationLimits] = None) -> List[str]:
     errors: List[str] = []
 
     # Top-level quiz fields are optional; perform light checks if present
-    if isinstance(quiz, dict):
+    if isinstance(quiz, Mapping):
         if "id" in quiz and not validate_type(quiz.get("id"), (int, str)):
             errors.append("Quiz id should be int or str")
         if "title" in quiz and not isinstance(quiz.get("title"), str):
@@ -209,6 +214,7 @@ def validate_quiz(quiz: Union[Dict[str, Any], List[Any]], file_path: str) -> Lis
 
     # Validate each question
     for idx, q in enumerate(questions):
+        check_deadline(deadline, limits)
         if not isinstance(q, dict):
             errors.append(f"Question {idx}: should be an object")
             continue
@@ -221,6 +227,9 @@ def validate_quiz(quiz: Union[Dict[str, Any], List[Any]], file_path: str) -> Lis
 def infer_file_type(file_path: str) -> str:
     lower = file_path.lower()
     name = os.path.basename(lower)
+    if name == "manifest.json":
+        # Shard manifest written by content_layout.py
+        return "unknown"
     if name.endswith("-lesson.json"):
         return "lesson"
     if name.endswith("-quiz.json"):
@@ -232,32 +241,62 @@ def infer_file_type(file_path: str) -> str:
     return "unknown"
 
 
-def validate_file(file_path: str) -> Tuple[str, List[str]]:
+def validate_file(file_path: str, limits: Optional[ValidationLimits] = None) -> Tuple[str, List[str]]:
+    # One time budget covers reading, parsing and validating the file
+    deadline = start_deadline(limits)
     try:
-        with open(file_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        data = load_json_limited(file_path, limits, deadline)
+    except LimitExceeded as e:
+        return "unknown", [f"Resource limit exceeded: {e}"]
     except json.JSONDecodeError as e:
         return "unknown", [f"Invalid JSON: {e}"]
     except Exception as e:
         return "unknown", [f"Error reading file: {e}"]
 
+    return _validate_within(data, file_path, deadline, limits)
+
+
+def validate_text(text: str, file_path: str, limits: Optional[ValidationLimits] = None) -> Tuple[str, List[str]]:
+    """Validate an unsaved buffer as if it were stored at file_path."""
+    deadline = start_deadline(limits)
+    try:
+        data = loads_limited(text, limits, deadline)
+    except LimitExceeded as e:
+        return "unknown", [f"Resource limit exceeded: {e}"]
+    except json.JSONDecodeError as e:
+        return "unknown", [f"Invalid JSON: {e}"]
+    return _validate_within(data, file_path, deadline, limits)
+
+
+def _validate_within(data: Any, file_path: str, deadline: float,
+                     limits: Optional[ValidationLimits]) -> Tuple[str, List[str]]:
+    try:
+        return validate_data(data, file_path, deadline, limits)
+    except LimitExceeded as e:
+        return infer_file_type(file_path), [f"Resource limit exceeded: {e}"]
+
+
+def validate_data(data: Any, file_path: str, deadline: Optional[float] = None,
+                  limits: Optional[ValidationLimits] = None) -> Tuple[str, List[str]]:
+    """Validate parsed content; with a deadline, raises LimitExceeded once it passes."""
     file_type = infer_file_type(file_path)
 
     errors: List[str] = []
     if file_type == "lesson":
         if isinstance(data, list):
             for idx, item in enumerate(data):
-                if not isinstance(item, dict):
+                check_deadline(deadline, limits)
+                if not isinstance(item, Mapping):
                     errors.append(f"Lesson {idx}: should be an object")
                     continue
                 errors.extend(validate_lesson(item, file_path, idx))
-        elif isinstance(data, dict):
+        elif isinstance(data, Mapping):
             errors.extend(validate_lesson(data, file_path))
         else:
             errors.append("Lesson file should be an object or array")
     elif file_type == "quiz":
-        if isinstance(data, dict) or isinstance(data, list):
-            errors.extend(validate_quiz(data, file_path))
+        if isinstance(data, (Mapping, list)):
+            errors.extend(validate_quiz(data, file_path, deadline, limits))
         else:
             errors.append("Quiz file should be an object or array")
     else:
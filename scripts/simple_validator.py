@@ -7,17 +7,22 @@ Provides basic validation against C# BaseLesson and BaseInterviewQuestion schema
 import json
 import os
 import sys
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional
 
-def validate_lesson_file(file_path: str) -> List[str]:
+from validation_limits import LimitExceeded, ValidationLimits, load_json_limited
+
+def validate_lesson_file(file_path: str, limits: Optional[ValidationLimits] = None) -> List[str]:
     """Validate a lesson file with basic checks."""
     errors = []
     
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        data = load_json_limited(file_path, limits)
+    except LimitExceeded as e:
+        return [f"Resource limit exceeded: {e}"]
     except json.JSONDecodeError as e:
         return [f"JSON parsing error: {e}"]
+    except UnicodeDecodeError as e:
+        return [f"Encoding error: {e}"]
     except FileNotFoundError:
         return ["File not found"]
     
@@ -54,15 +59,18 @@ def validate_lesson_file(file_path: str) -> List[str]:
     
     return errors
 
-def validate_quiz_file(file_path: str) -> List[str]:
+def validate_quiz_file(file_path: str, limits: Optional[ValidationLimits] = None) -> List[str]:
     """Validate a quiz file with basic checks."""
     errors = []
     
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        data = load_json_limited(file_path, limits)
+    except LimitExceeded as e:
+        return [f"Resource limit exceeded: {e}"]
     except json.JSONDecodeError as e:
         return [f"JSON parsing error: {e}"]
+    except UnicodeDecodeError as e:
+        return [f"Encoding error: {e}"]
     except FileNotFoundError:
         return ["File not found"]
     
@@ -184,7 +192,7 @@ def main():
         
         for root, dirs, files in os.walk(path):
             for file in files:
-                if file.endswith('.json'):
+                if file.endswith('.json') and file != 'manifest.json':
                     file_path = os.path.join(root, file)
                     total_files += 1
                     
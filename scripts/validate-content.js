@@ -15,6 +15,7 @@ const pathModule = require('path');
  */
 
 const path = require('path');
+const { hasModuleLessons, moduleLessonsPath, readModuleLessons } = require('./content-layout');
 
 // Validation modes
 const MODES = {
@@ -209,10 +210,10 @@ class ContentValidator {
   }
 
   validateModuleLessons(module) {
-    const lessonsPath = path.join(this.lessonsDir, `${module.slug}.json`);
+    const lessonsPath = moduleLessonsPath(this.lessonsDir, module.slug);
     const context = { moduleSlug: module.slug, lessonsPath };
 
-    if (!fs.existsSync(lessonsPath)) {
+    if (!hasModuleLessons(this.lessonsDir, module.slug)) {
       if (isStrictMode) {
         this.addError(`Missing lessons file for module: ${module.slug}`, context);
         return false;
@@ -223,8 +224,7 @@ class ContentValidator {
     }
 
     try {
-      const lessonsContent = fs.readFileSync(lessonsPath, 'utf8');
-      const lessons = JSON.parse(lessonsContent);
+      const lessons = readModuleLessons(this.lessonsDir, module.slug);
 
       if (!Array.isArray(lessons)) {
         this.addError(`Lessons file must contain an array: ${module.slug}`, context);
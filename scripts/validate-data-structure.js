@@ -5,6 +5,7 @@
 
 const fs = require('fs');
 const path = require('path');
+const { MANIFEST_NAME, listLessonModules, moduleLessonsPath, readModuleLessons } = require('./content-layout');
 
 // Define the expected structures based on C# BaseLesson and BaseInterviewQuestion models
 const lessonStructure = {
@@ -215,7 +216,10 @@ function validateItem(item, structure, fileName) {
 // Function to validate a JSON file
 function validateJsonFile(filePath, structure) {
   try {
-    const data = JSON.parse(fs.readFileSync(filePath, 'utf8'));
+    // A sharded module is passed as its manifest; validate the reassembled lessons
+    const data = path.basename(filePath) === MANIFEST_NAME
+      ? readModuleLessons(path.dirname(path.dirname(filePath)), path.basename(path.dirname(filePath)))
+      : JSON.parse(fs.readFileSync(filePath, 'utf8'));
     const errors = [];
     
     let itemsToValidate;
@@ -268,18 +272,14 @@ function findAllDataFiles() {
   
   // Check lessons directory
   const lessonsDir = path.join(contentDir, 'lessons');
-  if (fs.existsSync(lessonsDir)) {
-    const files = fs.readdirSync(lessonsDir);
-    for (const file of files) {
-      if (file.endsWith('.json')) {
-        dataFiles.push({
-          module: file.replace('.json', ''),
-          file,
-          path: path.join(lessonsDir, file),
-          type: 'lessons'
-        });
-      }
-    }
+  for (const slug of listLessonModules(lessonsDir)) {
+    const lessonsPath = moduleLessonsPath(lessonsDir, slug);
+    dataFiles.push({
+      module: slug,
+      file: path.relative(lessonsDir, lessonsPath),
+      path: lessonsPath,
+      type: 'lessons'
+    });
   }
   
   // Check quizzes directory
@@ -0,0 +1,287 @@
+#!/usr/bin/env python3
+"""
+Resident content validation daemon for Glass Code Academy.
+
+Keeps schema_validator results for the content tree in memory, keyed by file
+mtime and size, and answers validation requests over a Unix domain socket so
+pre-commit hooks and editors skip interpreter startup and full re-parses.
+
+Protocol: one JSON object per line in each direction.
+    {"op": "validate", "paths": ["content/lessons/react-fundamentals.json"]}
+    {"op": "validate_buffer", "path": "content/quizzes/x.json", "content": "..."}
+    {"op": "ping"} | {"op": "stats"} | {"op": "shutdown"}
+
+Usage:
+    python scripts/validation_daemon.py serve [content_dir] [--socket <path>]
+    python scripts/validation_daemon.py check <file_or_directory>... [--socket <path>]
+    python scripts/validation_daemon.py stop|stats [--socket <path>]
+"""
+
+import json
+import os
+import socket
+import socketserver
+import sys
+import tempfile
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from schema_validator import validate_file, validate_text
+from validation_limits import DEFAULT_LIMITS
+
+DEFAULT_SOCKET = os.environ.get(
+    "GLASSCODE_VALIDATOR_SOCKET",
+    os.path.join(tempfile.gettempdir(), "glasscode-validator.sock"),
+)
+CLIENT_TIMEOUT_SECONDS = 30.0
+# A validate_buffer request carries the buffer JSON-escaped (up to 6 bytes per character)
+MAX_REQUEST_BYTES = DEFAULT_LIMITS.max_file_bytes * 6 + 64 * 1024
+
+FileResult = Dict[str, Any]
+
+
+def expand_paths(paths: List[str]) -> List[str]:
+    """Expand directories into the JSON files beneath them, in walk order."""
+    files: List[str] = []
+    for path in paths:
+        if os.path.isdir(path):
+            for root, _, names in os.walk(path):
+                for name in sorted(names):
+                    if name.endswith(".json"):
+                        files.append(os.path.join(root, name))
+        else:
+            files.append(path)
+    return files
+
+
+def _result(path: str, file_type: str, errors: List[str], cached: bool = False) -> FileResult:
+    return {"path": path, "type": file_type, "errors": errors, "cached": cached}
+
+
+def validate_in_process(paths: List[str]) -> List[FileResult]:
+    results = []
+    for path in expand_paths(paths):
+        file_type, errors = validate_file(path)
+        results.append(_result(path, file_type, errors))
+    return results
+
+
+class ValidationCache:
+    """Validation results keyed by absolute path and invalidated by (mtime_ns, size)."""
+
+    def __init__(self):
+        self._entries: Dict[str, Tuple[int, int, str, List[str]]] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def validate(self, path: str) -> FileResult:
+        abs_path = os.path.abspath(path)
+        try:
+            st = os.stat(abs_path)
+        except OSError as e:
+            with self._lock:
+                self._entries.pop(abs_path, None)
+            return _result(path, "unknown", [f"Error reading file: {e}"])
+
+        with self._lock:
+            entry = self._entries.get(abs_path)
+            if entry and entry[0] == st.st_mtime_ns and entry[1] == st.st_size:
+                self.hits += 1
+                return _result(path, entry[2], list(entry[3]), cached=True)
+
+        file_type, errors = validate_file(abs_path)
+        with self._lock:
+            self.misses += 1
+            self._entries[abs_path] = (st.st_mtime_ns, st.st_size, file_type, errors)
+        return _result(path, file_type, list(errors))
+
+    def warm(self, content_dir: str) -> int:
+        files = expand_paths([content_dir])
+        for path in files:
+            self.validate(path)
+        return len(files)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {"entries": len(self._entries), "hits": self.hits, "misses": self.misses}
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    def handle(self):
+        while True:
+            line = self.rfile.readline(MAX_REQUEST_BYTES + 1)
+            if not line:
+                return
+            if len(line) > MAX_REQUEST_BYTES:
+                # Drop the connection rather than buffer an unbounded request
+                self._reply({"ok": False, "error": f"request exceeds {MAX_REQUEST_BYTES} bytes"})
+                return
+            if not line.strip():
+                continue
+            try:
+                request = json.loads(line)
+                response = self.server.dispatch(request)
+            except Exception as e:
+                response = {"ok": False, "error": str(e)}
+            self._reply(response)
+            if response.get("shutdown"):
+                threading.Thread(target=self.server.shutdown, daemon=True).start()
+                return
+
+    def _reply(self, response: Dict[str, Any]) -> None:
+        self.wfile.write(json.dumps(response).encode("utf-8") + b"\n")
+        self.wfile.flush()
+
+
+class ValidationServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+    def __init__(self, socket_path: str, cache: ValidationCache):
+        self.socket_path = socket_path
+        self.cache = cache
+        self.started = time.time()
+        super().__init__(socket_path, _RequestHandler)
+
+    def dispatch(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        op = request.get("op")
+        if op == "ping":
+            return {"ok": True, "pid": os.getpid()}
+        if op == "stats":
+            return {"ok": True, "uptime": round(time.time() - self.started, 3), **self.cache.stats()}
+        if op == "validate":
+            paths = request.get("paths")
+            if not isinstance(paths, list) or not all(isinstance(p, str) for p in paths):
+                return {"ok": False, "error": "'paths' should be a list of strings"}
+            return {"ok": True, "results": [self.cache.validate(p) for p in expand_paths(paths)]}
+        if op == "validate_buffer":
+            path, content = request.get("path"), request.get("content")
+            if not isinstance(path, str) or not isinstance(content, str):
+                return {"ok": False, "error": "'path' and 'content' should be strings"}
+            file_type, errors = validate_text(content, path)
+            return {"ok": True, "results": [_result(path, file_type, errors)]}
+        if op == "shutdown":
+            return {"ok": True, "shutdown": True}
+        return {"ok": False, "error": f"Unknown op: {op}"}
+
+    def server_close(self):
+        super().server_close()
+        try:
+            os.unlink(self.socket_path)
+        except OSError:
+            pass
+
+
+def serve(content_dir: Optional[str], socket_path: str = DEFAULT_SOCKET) -> None:
+    if os.path.exists(socket_path):
+        if _request(socket_path, {"op": "ping"}) is not None:
+            print(f"Validation daemon already running on {socket_path}")
+            sys.exit(1)
+        os.unlink(socket_path)  # stale socket from a crashed daemon
+
+    cache = ValidationCache()
+    if content_dir:
+        started = time.time()
+        count = cache.warm(content_dir)
+        print(f"🔥 Warmed cache with {count} files in {time.time() - started:.2f}s")
+
+    server = ValidationServer(socket_path, cache)
+    print(f"✅ Validation daemon listening on {socket_path}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+# Client
+
+def _request(socket_path: str, payload: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Send one request; return None when no daemon is reachable."""
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(CLIENT_TIMEOUT_SECONDS)
+            sock.connect(socket_path)
+            sock.sendall(json.dumps(payload).encode("utf-8") + b"\n")
+            with sock.makefile("rb") as stream:
+                line = stream.readline()
+    except (OSError, AttributeError):
+        # AttributeError: platforms without AF_UNIX
+        return None
+    if not line:
+        return None
+    return json.loads(line)
+
+
+def validate(paths: List[str], socket_path: str = DEFAULT_SOCKET) -> List[FileResult]:
+    """Validate through the daemon if it is running, otherwise in-process."""
+    response = _request(socket_path, {"op": "validate", "paths": [os.path.abspath(p) for p in paths]})
+    if response is None:
+        return validate_in_process(paths)
+    if not response.get("ok"):
+        raise RuntimeError(response.get("error", "validation daemon error"))
+    return response["results"]
+
+
+def validate_buffer(path: str, content: str, socket_path: str = DEFAULT_SOCKET) -> FileResult:
+    response = _request(socket_path, {"op": "validate_buffer", "path": path, "content": content})
+    if response is None:
+        file_type, errors = validate_text(content, path)
+        return _result(path, file_type, errors)
+    if not response.get("ok"):
+        raise RuntimeError(response.get("error", "validation daemon error"))
+    return response["results"][0]
+
+
+def _check(paths: List[str], socket_path: str) -> int:
+    results = validate(paths, socket_path)
+    invalid = 0
+    for r in results:
+        if r["type"] == "unknown" and not r["errors"]:
+            continue
+        if r["errors"]:
+            invalid += 1
+            print(f"❌ Invalid ({r['type']}): {r['path']}")
+            for e in r["errors"][:20]:
+                print(f"  - {e}")
+            if len(r["errors"]) > 20:
+                print(f"  ... {len(r['errors']) - 20} more issues")
+    print(f"Checked {len(results)} files, {invalid} invalid")
+    return 1 if invalid else 0
+
+
+def main():
+    args = sys.argv[1:]
+    socket_path = DEFAULT_SOCKET
+    if "--socket" in args:
+        i = args.index("--socket")
+        if i + 1 >= len(args):
+            print("--socket requires a path")
+            sys.exit(2)
+        socket_path = args[i + 1]
+        del args[i:i + 2]
+
+    if not args or args[0] not in ("serve", "check", "stop", "stats"):
+        print(__doc__.strip().split("Usage:")[1].rstrip())
+        sys.exit(2)
+
+    command, rest = args[0], args[1:]
+    if command == "serve":
+        serve(rest[0] if rest else None, socket_path)
+    elif command == "check":
+        if not rest:
+            print("Usage: python scripts/validation_daemon.py check <file_or_directory>...")
+            sys.exit(2)
+        sys.exit(_check(rest, socket_path))
+    else:
+        response = _request(socket_path, {"op": "shutdown" if command == "stop" else "stats"})
+        if response is None:
+            print(f"No validation daemon running on {socket_path}")
+            sys.exit(1)
+        print(json.dumps(response))
+
+
+if __name__ == "__main__":
+    main()
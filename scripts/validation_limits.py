@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+"""
+Resource limits for validating untrusted content JSON.
+
+Both validators parse files with `load_json_limited`/`loads_limited`, which
+reject oversized input before it is parsed:
+
+    max_file_bytes     file/buffer size, checked before reading
+    max_depth          nesting of arrays/objects
+    max_array_length   elements in any single array, or members in any object
+    max_string_length  characters in any string, measured on the encoded form
+    time_budget        seconds allowed for validating one file: scan, parse and checks
+
+Depth, array length and string length are enforced by a single linear token
+scan of the text, so a deeply nested or million-element payload is rejected
+without building it in memory.
+
+The time budget is one deadline per file (see start_deadline). The scan
+checks it every few thousand tokens and the validators check it between
+items. json.loads runs in C and cannot be interrupted, so its cost is capped
+by max_file_bytes instead and the deadline is checked as soon as it returns.
+
+Defaults sit well above the largest real content (about 260 KB per file,
+depth 6, 60 elements per array). Override them per process with the
+GLASSCODE_VALIDATOR_MAX_BYTES, _MAX_DEPTH, _MAX_ARRAY, _MAX_STRING and
+_TIME_BUDGET environment variables. DEFAULT_LIMITS warns about a malformed
+value and keeps that default rather than failing at import.
+"""
+
+import json
+import os
+import re
+import sys
+import time
+from typing import Any, Optional
+
+_TOKEN = re.compile(r'[\[\]{},"]')
+_DEADLINE_CHECK_EVERY = 4096
+
+ENV_PREFIX = "GLASSCODE_VALIDATOR_"
+
+
+class LimitExceeded(ValueError):
+    """Raised when input exceeds a configured resource limit."""
+
+
+class ValidationLimits:
+    __slots__ = ("max_file_bytes", "max_depth", "max_array_length", "max_string_length", "time_budget")
+
+    def __init__(self, max_file_bytes: int = 4 * 1024 * 1024, max_depth: int = 32,
+                 max_array_length: int = 10_000, max_string_length: int = 256 * 1024,
+                 time_budget: float = 2.0):
+        self.max_file_bytes = max_file_bytes
+        self.max_depth = max_depth
+        self.max_array_length = max_array_length
+        self.max_string_length = max_string_length
+        self.time_budget = time_budget
+
+    @classmethod
+    def from_env(cls, environ: Optional[dict] = None, strict: bool = True) -> "ValidationLimits":
+        """Limits from GLASSCODE_VALIDATOR_* variables.
+
+        A malformed value raises ValueError, or with strict=False prints a
+        warning and keeps that field's default.
+        """
+        env = os.environ if environ is None else environ
+        limits = cls()
+        for name, attr, cast in (("MAX_BYTES", "max_file_bytes", int), ("MAX_DEPTH", "max_depth", int),
+                                 ("MAX_ARRAY", "max_array_length", int), ("MAX_STRING", "max_string_length", int),
+                                 ("TIME_BUDGET", "time_budget", float)):
+            raw = env.get(ENV_PREFIX + name)
+            if raw:
+                try:
+                    setattr(limits, attr, cast(raw))
+                except ValueError:
+                    message = f"{ENV_PREFIX + name} should be a number, got {raw!r}"
+                    if strict:
+                        raise ValueError(message)
+                    print(f"⚠️  {message}; using {getattr(limits, attr)}", file=sys.stderr)
+        return limits
+
+    def __repr__(self):
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.__slots__)
+        return f"ValidationLimits({fields})"
+
+
+DEFAULT_LIMITS = ValidationLimits.from_env(strict=False)
+
+
+def start_deadline(limits: Optional[ValidationLimits] = None) -> float:
+    """Monotonic deadline for validating one file."""
+    return time.monotonic() + (limits or DEFAULT_LIMITS).time_budget
+
+
+def check_deadline(deadline: Optional[float], limits: Optional[ValidationLimits] = None,
+                   stage: str = "validating") -> None:
+    if deadline is not None and time.monotonic() > deadline:
+        raise LimitExceeded(f"time budget of {(limits or DEFAULT_LIMITS).time_budget}s exceeded while {stage}")
+
+
+def _string_end(text: str, start: int) -> int:
+    """Index just past the string literal opening at start, or -1 when unterminated.
+
+    Uses str.find so long or escape-heavy strings cost no per-character Python
+    work and no regex backtracking state.
+    """
+    pos = start + 1
+    while True:
+        quote = text.find('"', pos)
+        if quote < 0:
+            return -1
+        # The quote is escaped when preceded by an odd run of backslashes; the run
+        # cannot extend before pos, which is the start or just past another quote
+        segment = text[pos:quote]
+        if (len(segment) - len(segment.rstrip("\\"))) % 2 == 0:
+            return quote + 1
+        pos = quote + 1
+
+
+def scan(text: str, limits: ValidationLimits, deadline: Optional[float] = None) -> None:
+    """Check depth, array length and string length in one pass without parsing."""
+    if deadline is None:
+        deadline = time.monotonic() + limits.time_budget
+    # Element count per open container
+    stack = []
+    tokens = 0
+    pos = 0
+    complete = False
+    while True:
+        m = _TOKEN.search(text, pos)
+        if m is None or complete:
+            # Anything after a complete top-level value is "Extra data" for json.loads
+            return
+        tokens += 1
+        if tokens % _DEADLINE_CHECK_EVERY == 0 and time.monotonic() > deadline:
+            raise LimitExceeded(f"time budget of {limits.time_budget}s exceeded while scanning")
+        c = m.group()
+        pos = m.end()
+        if c == '"':
+            end = _string_end(text, m.start())
+            if end < 0:
+                # Unterminated; json.loads reports the syntax error
+                return
+            if end - m.start() - 2 > limits.max_string_length:
+                raise LimitExceeded(
+                    f"string of {end - m.start() - 2} characters at offset {m.start()} exceeds max_string_length {limits.max_string_length}")
+            pos = end
+            complete = not stack
+        elif c in "[{":
+            if len(stack) >= limits.max_depth:
+                raise LimitExceeded(f"nesting deeper than max_depth {limits.max_depth} at offset {m.start()}")
+            stack.append(1)
+        elif c in "]}":
+            if stack:
+                stack.pop()
+            complete = not stack
+        elif stack:
+            stack[-1] += 1
+            if stack[-1] > limits.max_array_length:
+                raise LimitExceeded(
+                    f"more than max_array_length {limits.max_array_length} elements at offset {m.start()}")
+
+
+def loads_limited(text: str, limits: Optional[ValidationLimits] = None, deadline: Optional[float] = None) -> Any:
+    """json.loads with resource limits; raises LimitExceeded or json.JSONDecodeError.
+
+    Pass the file's deadline to share one time budget with later checks.
+    """
+    limits = limits or DEFAULT_LIMITS
+    if len(text) > limits.max_file_bytes:
+        raise LimitExceeded(f"input of {len(text)} characters exceeds max_file_bytes {limits.max_file_bytes}")
+    if deadline is None:
+        deadline = start_deadline(limits)
+    scan(text, limits, deadline)
+    try:
+        data = json.loads(text)
+    except RecursionError:
+        raise LimitExceeded("nesting too deep to parse")
+    except json.JSONDecodeError:
+        raise
+    except ValueError as e:
+        # e.g. integer literals beyond sys.get_int_max_str_digits()
+        raise LimitExceeded(str(e))
+    check_deadline(deadline, limits, "parsing")
+    return data
+
+
+def load_json_limited(file_path: str, limits: Optional[ValidationLimits] = None,
+                      deadline: Optional[float] = None) -> Any:
+    """Read and parse a JSON file with resource limits; the size is checked before reading."""
+    limits = limits or DEFAULT_LIMITS
+    size = os.path.getsize(file_path)
+    if size > limits.max_file_bytes:
+        raise LimitExceeded(f"file of {size} bytes exceeds max_file_bytes {limits.max_file_bytes}")
+    with open(file_path, "r", encoding="utf-8") as f:
+        # Bounded read in case the file grows between stat and open
+        text = f.read(limits.max_file_bytes + 1)
+    return loads_limited(text, limits, deadline)
@@ -0,0 +1,293 @@
+#!/usr/bin/env python3
+"""
+Worst-case input fuzzing for schema_validator.py and simple_validator.py.
+
+Feeds pathological content through both validators and fails when any input
+raises instead of returning errors, takes longer than the time bound, or
+allocates more than the memory bound. Three groups of cases run:
+
+    adversarial  hand-built worst cases: deep nesting in `code`, giant strings,
+                 million-element `choices`, huge number literals, escape-heavy
+                 strings, unterminated strings, oversized files
+    mutations    random byte-level edits of real lesson and quiz files
+                 (truncation, duplicated spans, bracket/quote injection)
+    generated    random JSON trees shaped like lessons and quizzes, with sizes
+                 drawn on both sides of every limit
+
+Properties checked for every case:
+    - validators return a list of errors and never raise
+    - wall time stays under --max-seconds
+    - peak traced memory stays under --memory-factor x input size + 16 MiB
+    - input accepted by the limits parses to exactly what json.loads returns,
+      and input rejected by them is reported as "Resource limit exceeded"
+
+Runs are reproducible with --seed.
+
+Usage:
+    python scripts/validator_fuzz.py [--iterations N] [--seed N] [--max-seconds S]
+        [--memory-factor F] [--content-dir <dir>] [--verbose]
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+from typing import Any, Callable, Iterator, List, Tuple
+
+import schema_validator
+import simple_validator
+from validation_limits import DEFAULT_LIMITS, LimitExceeded, loads_limited
+
+REPO_ROOT = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+DEFAULT_CONTENT_DIR = os.path.join(REPO_ROOT, "content")
+MEMORY_OVERHEAD = 16 * 1024 * 1024
+
+Case = Tuple[str, str, str]  # (name, kind "lesson"|"quiz", text)
+
+
+# Adversarial cases
+
+def adversarial_cases() -> Iterator[Case]:
+    limits = DEFAULT_LIMITS
+    lesson = {"id": 1, "moduleSlug": "fuzz", "title": "t", "order": 1, "objectives": [], "intro": "",
+              "code": {}, "pitfalls": [], "exercises": [], "next": "", "estimatedMinutes": 1,
+              "difficulty": "Beginner", "tags": []}
+    head = json.dumps(lesson)[:-1]
+
+    depth = 200_000
+    yield "deep-array-in-code", "lesson", f'{head}, "code": {{"x": {"[" * depth}{"]" * depth}}}}}'
+    yield "deep-object-in-code", "lesson", head + ', "code": ' + '{"a":' * depth + "1" + "}" * depth + "}"
+    yield "deep-unclosed", "lesson", "[" * (limits.max_file_bytes - 1)
+    yield "deep-at-limit", "lesson", "[" * (limits.max_depth - 1) + "]" * (limits.max_depth - 1)
+
+    n = 1_000_000
+    yield "million-choices", "quiz", json.dumps({"questions": [{"id": 1, "question": "q", "choices": [0] * n}]})
+    yield "million-questions", "quiz", "[" + ",".join(["{}"] * n) + "]"
+    yield "choices-at-limit", "quiz", json.dumps([{"id": 1, "question": "q", "type": "multiple-choice",
+                                                   "choices": ["c"] * limits.max_array_length,
+                                                   "correctAnswer": "c"}])
+
+    yield "giant-string", "lesson", json.dumps([{**lesson, "intro": "a" * (limits.max_string_length + 1)}])
+    yield "string-at-limit", "lesson", json.dumps([{**lesson, "intro": "a" * limits.max_string_length}])
+    yield "escape-heavy-string", "lesson", '[{"intro": "' + "\\u0041\\n" * 200_000 + '"}]'
+    yield "backslash-run", "lesson", '["' + "\\\\" * 500_000 + '"]'
+    yield "unterminated-string", "lesson", '["' + "a" * 1_000_000
+    yield "many-quotes", "lesson", '"' * 1_000_000
+    yield "huge-int", "quiz", '[{"id": ' + "9" * 1_000_000 + ', "question": "q"}]'
+    yield "huge-correct-answer", "quiz", '[{"id": 1, "question": "q", "choices": ["a"], "correctAnswer": ' + "1" * 4000 + "}]"
+    yield "many-keys", "lesson", "[{" + ",".join(f'"k{i}": {i}' for i in range(200_000)) + "}]"
+    yield "duplicate-keys", "lesson", "[{" + ",".join(['"id": 1'] * 200_000) + "}]"
+    yield "oversized-file", "lesson", " " * (limits.max_file_bytes + 1) + "[]"
+    yield "correct-answer-string-scan", "quiz", json.dumps([{"id": 1, "question": "q", "choices": ["x" * 20_000] * 9_000,
+                                                             "correctAnswer": "y"}])
+
+
+# Mutations of real content
+
+def _content_files(content_dir: str) -> List[Tuple[str, str]]:
+    files = []
+    for kind, sub in (("lesson", "lessons"), ("quiz", "quizzes")):
+        base = os.path.join(content_dir, sub)
+        for root, _, names in os.walk(base):
+            for name in sorted(names):
+                if name.endswith(".json") and name not in ("manifest.json", "sources.json"):
+                    files.append((kind, os.path.join(root, name)))
+    return files
+
+
+def mutate(text: str, rng: random.Random) -> str:
+    for _ in range(rng.randint(1, 4)):
+        op = rng.randrange(5)
+        i = rng.randrange(len(text) + 1)
+        if op == 0:
+            text = text[:i]
+        elif op == 1:
+            j = min(len(text), i + rng.randint(1, 4096))
+            text = text[:j] + text[i:j] * rng.randint(2, 50) + text[j:]
+        elif op == 2:
+            text = text[:i] + rng.choice("[{") * rng.randint(1, 5000) + text[i:]
+        elif op == 3:
+            text = text[:i] + rng.choice(['"', "\\", "]", "}", ",", ":", "\x00", "\ud800"]) + text[i + 1:]
+        else:
+            j = min(len(text), i + rng.randint(1, 256))
+            text = text[:i] + text[j:]
+    return text
+
+
+# Generated trees
+
+def random_value(rng: random.Random, depth: int, budget: List[int]) -> Any:
+    budget[0] -= 1
+    roll = rng.random()
+    if depth <= 0 or budget[0] <= 0 or roll < 0.35:
+        return rng.choice([
+            lambda: rng.randint(-2**40, 2**40),
+            lambda: rng.random(),
+            lambda: rng.choice([True, False, None]),
+            lambda: "".join(rng.choice("ab\"\\\né中") for _ in range(rng.randint(0, 40))),
+        ])()
+    if roll < 0.7:
+        return [random_value(rng, depth - 1, budget) for _ in range(rng.randint(0, 8))]
+    return {rng.choice(["id", "title", "code", "choices", "question", "correctAnswer", "type", "x"]) + str(rng.randint(0, 3)):
+            random_value(rng, depth - 1, budget) for _ in range(rng.randint(0, 6))}
+
+
+def generated_case(rng: random.Random, index: int) -> Case:
+    limits = DEFAULT_LIMITS
+    kind = rng.choice(["lesson", "quiz"])
+    shape = rng.randrange(4)
+    if shape == 0:
+        # Nested code object around the depth limit
+        depth = rng.randint(limits.max_depth - 3, limits.max_depth + 3)
+        code: Any = "x"
+        for _ in range(depth):
+            code = {"c": code} if rng.random() < 0.5 else [code]
+        data: Any = [{"id": index, "title": "t", "code": code}]
+    elif shape == 1:
+        # Choices around the array length limit
+        n = rng.randint(limits.max_array_length - 2, limits.max_array_length + 2)
+        data = [{"id": index, "question": "q", "type": "multiple-choice", "choices": ["c"] * n,
+                 "correctAnswer": rng.choice([0, n, "c", "zz", None])}]
+    elif shape == 2:
+        # Strings around the string length limit
+        n = rng.randint(limits.max_string_length - 2, limits.max_string_length + 2)
+        data = [{"id": index, "question": "q" * n, "explanation": rng.choice(["e", 5, None])}]
+    else:
+        data = random_value(rng, rng.randint(1, 12), [rng.randint(10, 5000)])
+    return f"generated-{index}-shape{shape}", kind, json.dumps(data, ensure_ascii=rng.random() < 0.5)
+
+
+# Runner
+
+def _validators(kind: str) -> List[Tuple[str, Callable[[str, str], List[str]]]]:
+    simple = simple_validator.validate_lesson_file if kind == "lesson" else simple_validator.validate_quiz_file
+    return [
+        ("schema_validator.validate_file", lambda path, text: schema_validator.validate_file(path)[1]),
+        ("schema_validator.validate_text", lambda path, text: schema_validator.validate_text(text, path)[1]),
+        ("simple_validator", lambda path, text: simple(path)),
+    ]
+
+
+def _expected_parse(text: str) -> Tuple[bool, Any]:
+    """(accepted, value) from the limited loader; value is None when rejected."""
+    try:
+        return True, loads_limited(text)
+    except LimitExceeded:
+        return False, None
+    except json.JSONDecodeError:
+        return True, None
+
+
+def check_case(case: Case, work_dir: str, max_seconds: float, memory_factor: float) -> List[str]:
+    name, kind, text = case
+    path = os.path.join(work_dir, "lessons" if kind == "lesson" else "quizzes", "fuzz.json")
+    try:
+        encoded = text.encode("utf-8")
+    except UnicodeEncodeError:
+        encoded = text.encode("utf-8", "surrogatepass")
+    with open(path, "wb") as f:
+        f.write(encoded)
+
+    failures: List[str] = []
+    memory_bound = memory_factor * len(encoded) + MEMORY_OVERHEAD
+    for label, fn in _validators(kind):
+        start = time.perf_counter()
+        try:
+            errors = fn(path, text)
+        except Exception as e:
+            failures.append(f"{name}: {label} raised {type(e).__name__}: {str(e)[:200]}")
+            continue
+        elapsed = time.perf_counter() - start
+        if not isinstance(errors, list):
+            failures.append(f"{name}: {label} returned {type(errors).__name__}, expected list")
+        if elapsed > max_seconds:
+            failures.append(f"{name}: {label} took {elapsed:.2f}s (bound {max_seconds}s)")
+
+        tracemalloc.start()
+        try:
+            fn(path, text)
+            _, peak = tracemalloc.get_traced_memory()
+        except Exception:
+            peak = 0
+        finally:
+            tracemalloc.stop()
+        if peak > memory_bound:
+            failures.append(f"{name}: {label} peaked at {peak / 1e6:.1f} MB (bound {memory_bound / 1e6:.1f} MB)")
+
+        if label == "schema_validator.validate_text":
+            accepted, value = _expected_parse(text)
+            limit_reported = any(e.startswith("Resource limit exceeded") for e in errors)
+            if not accepted and not limit_reported:
+                failures.append(f"{name}: rejected by limits but not reported as a limit error")
+            if accepted and limit_reported:
+                failures.append(f"{name}: accepted by limits but reported as a limit error")
+            if accepted and value is not None:
+                try:
+                    if value != json.loads(text):
+                        failures.append(f"{name}: limited parse differs from json.loads")
+                except (ValueError, RecursionError):
+                    pass
+    return failures
+
+
+def run(iterations: int, seed: int, content_dir: str, max_seconds: float, memory_factor: float,
+        verbose: bool = False) -> List[str]:
+    rng = random.Random(seed)
+    sources = _content_files(content_dir)
+
+    def cases() -> Iterator[Case]:
+        yield from adversarial_cases()
+        for i in range(iterations):
+            if sources and i % 2 == 0:
+                kind, path = rng.choice(sources)
+                with open(path, "r", encoding="utf-8") as f:
+                    yield f"mutated-{i}-{os.path.basename(path)}", kind, mutate(f.read(), rng)
+            else:
+                yield generated_case(rng, i)
+
+    failures: List[str] = []
+    count = 0
+    with tempfile.TemporaryDirectory(prefix="validator-fuzz-") as work_dir:
+        os.makedirs(os.path.join(work_dir, "lessons"))
+        os.makedirs(os.path.join(work_dir, "quizzes"))
+        for case in cases():
+            count += 1
+            case_failures = check_case(case, work_dir, max_seconds, memory_factor)
+            failures.extend(case_failures)
+            if verbose:
+                print(f"{'❌' if case_failures else '✅'} {case[0]} ({len(case[2])} chars)")
+    print(f"\nFuzzed {count} inputs (seed {seed}) against {DEFAULT_LIMITS}")
+    return failures
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Fuzz the content validators with pathological input")
+    parser.add_argument("--iterations", type=int, default=200, help="random cases after the adversarial set")
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--content-dir", default=DEFAULT_CONTENT_DIR, help="real content to mutate")
+    parser.add_argument("--max-seconds", type=float, default=None,
+                        help="per-validator time bound (default: 2x the limits time budget)")
+    parser.add_argument("--memory-factor", type=float, default=12.0,
+                        help="peak memory bound as a multiple of input size, plus 16 MiB")
+    parser.add_argument("--verbose", action="store_true")
+    args = parser.parse_args()
+
+    seed = args.seed if args.seed is not None else random.SystemRandom().randrange(2**32)
+    max_seconds = args.max_seconds if args.max_seconds is not None else DEFAULT_LIMITS.time_budget * 2
+    failures = run(args.iterations, seed, args.content_dir, max_seconds, args.memory_factor, args.verbose)
+    if failures:
+        print(f"❌ {len(failures)} failures (rerun with --seed {seed}):")
+        for failure in failures[:50]:
+            print(f"  - {failure}")
+        if len(failures) > 50:
+            print(f"  ... {len(failures) - 50} more")
+        sys.exit(1)
+    print("✅ All validators stayed within time and memory bounds")
+
+
+if __name__ == "__main__":
+    main()